@@ -1,18 +1,173 @@
-import sqlite3
-import os
-
-
-def connect_database():
-    """ fixed path connection"""
-    # Use absolute Windows path
-    db_path = r"C:\Users\gwati\PycharmProjects\newproject\CW2_M01018151_CST1510\DATA\intelligence_platform.db"
-
-    print(f"🔗 Connecting to: {db_path}")
-
-    # Create directory if needed
-    os.makedirs(os.path.dirname(db_path), exist_ok=True)
-
-    # Connect
-    conn = sqlite3.connect(db_path)
-    print("✅ Connected!")
-    return conn
\ No newline at end of file
+import sqlite3
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+# Default database location, can be overridden with INTELLIGENCE_DB_PATH or configure_database()
+DEFAULT_DB_PATH = Path(__file__).resolve().parents[2] / "DATA" / "intelligence_platform.db"
+
+
+class ConnectionProvider:
+    """Process-wide provider of reusable SQLite connections for app.data.
+
+    Connections are opened once with their pragmas applied and then handed
+    out again and again, so CRUD functions no longer pay for connect/close.
+    """
+
+    def __init__(self, db_path=None, max_idle=5, busy_timeout_ms=5000):
+        self._db_path = str(db_path or os.environ.get("INTELLIGENCE_DB_PATH", DEFAULT_DB_PATH))
+        self._max_idle = max_idle
+        self._busy_timeout_ms = busy_timeout_ms
+        self._idle = queue.LifoQueue()  # (generation, connection) pairs
+        self._generation = 0  # Bumped by configure(); older connections point at the old file
+        self._migrated = set()  # Database paths whose pending migrations have been applied
+        self._migrate_lock = threading.Lock()
+        self._local = threading.local()  # Connection currently borrowed by this thread
+        self._lock = threading.Lock()
+
+    @property
+    def db_path(self):
+        return self._db_path
+
+    def configure(self, db_path):
+        """Point the provider at a different database file."""
+        with self._lock:
+            self._generation += 1
+            self._db_path = str(db_path)
+            self.close_all()
+
+    def open_connection(self):
+        """Open a new connection with the standard pragmas applied."""
+        os.makedirs(os.path.dirname(os.path.abspath(self._db_path)), exist_ok=True)
+        conn = sqlite3.connect(self._db_path, timeout=self._busy_timeout_ms / 1000,
+                               check_same_thread=False)
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute(f"PRAGMA busy_timeout = {int(self._busy_timeout_ms)}")
+        conn.execute("PRAGMA foreign_keys = ON")
+        self._migrate(conn)
+        return conn
+
+    def _migrate(self, conn):
+        """Bring the database schema up to date the first time a path is opened."""
+        path = os.path.abspath(self._db_path)
+        if path in self._migrated:
+            return
+        from app.data.schema import apply_migrations_if_ready  # schema imports this module
+        with self._migrate_lock:
+            if path not in self._migrated and apply_migrations_if_ready(conn):
+                self._migrated.add(path)
+
+    def _checkout(self):
+        while True:
+            try:
+                generation, conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if generation == self._generation:
+                return generation, conn
+            conn.close()
+        generation = self._generation
+        return generation, self.open_connection()
+
+    def _checkin(self, conn, generation):
+        if conn.in_transaction:
+            conn.rollback()
+        # Connections borrowed before configure() still point at the old file
+        if generation == self._generation and self._idle.qsize() < self._max_idle:
+            self._idle.put_nowait((generation, conn))
+        else:
+            conn.close()
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection; nested use on the same thread shares it."""
+        conn = getattr(self._local, "connection", None)
+        if conn is not None:
+            yield conn
+            return
+
+        generation, conn = self._checkout()
+        self._local.connection = conn
+        try:
+            yield conn
+        finally:
+            self._local.connection = None
+            self._checkin(conn, generation)
+
+    @contextmanager
+    def transaction(self):
+        """Borrow a connection and commit on success or roll back on error."""
+        with self.connection() as conn:
+            if getattr(self._local, "in_transaction", False):
+                yield conn  # Inside an outer transaction, which does the commit
+                return
+            self._local.in_transaction = True
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                self._local.in_transaction = False
+
+    @contextmanager
+    def snapshot(self):
+        """Borrow a connection whose reads inside the block all see one snapshot.
+
+        Inside a transaction (ours or the caller's) the reads already share
+        it, so nothing is begun or rolled back here.
+        """
+        with self.connection() as conn:
+            if conn.in_transaction or getattr(self._local, "in_transaction", False):
+                yield conn
+                return
+            conn.execute("BEGIN")
+            try:
+                yield conn
+            finally:
+                conn.rollback()
+
+    def close_all(self):
+        """Close every idle connection."""
+        while True:
+            try:
+                self._idle.get_nowait()[1].close()
+            except queue.Empty:
+                break
+
+
+# Shared provider used by every module in app.data
+_provider = ConnectionProvider()
+
+
+def configure_database(db_path):
+    """Use a different database file for all app.data functions."""
+    _provider.configure(db_path)
+
+
+def get_db():
+    """Context manager that lends out a pooled connection (do not close it)."""
+    return _provider.connection()
+
+
+def transaction():
+    """Context manager that groups writes into one commit."""
+    return _provider.transaction()
+
+
+def read_snapshot():
+    """Context manager that lends out a connection with one consistent view for all its reads."""
+    return _provider.snapshot()
+
+
+def close_all_connections():
+    """Close all pooled connections (e.g. on shutdown)."""
+    _provider.close_all()
+
+
+def connect_database():
+    """Open a standalone connection to the configured database; the caller closes it."""
+    return _provider.open_connection()
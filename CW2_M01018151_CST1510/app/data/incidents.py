@@ -1,78 +1,125 @@
-import pandas as pd
-from app.data.db import connect_database
-
-def insert_incident(incident_id, timestamp, category, severity, status, description):
-    """Insert new incident - FIXED PARAMETER ORDER."""
-    conn = connect_database()
-    cursor = conn.cursor()
-    cursor.execute("""
-        INSERT INTO cyber_incidents
-        (incident_id, timestamp, category, severity, status, description)
-        VALUES (?, ?, ?, ?, ?, ?)
-    """, (incident_id, timestamp, category, severity, status, description))
-    conn.commit()
-    conn.close()
-    return incident_id
-
-def get_all_incidents():
-    """Get all incidents as DataFrame."""
-    conn = connect_database()
-    df = pd.read_sql_query(
-        "SELECT * FROM cyber_incidents ORDER BY incident_id DESC",
-        conn
-    )
-    conn.close()
-    return df
-
-def update_incident_status(incident_id, new_status):
-    """Update incident status."""
-    conn = connect_database()
-    cursor = conn.cursor()
-    cursor.execute(
-        "UPDATE cyber_incidents SET status = ? WHERE incident_id = ?",
-        (new_status, incident_id)
-    )
-    conn.commit()
-    rows_affected = cursor.rowcount
-    conn.close()
-    return rows_affected
-
-def delete_incident(incident_id):
-    """Delete an incident."""
-    conn = connect_database()
-    cursor = conn.cursor()
-    cursor.execute(
-        "DELETE FROM cyber_incidents WHERE incident_id = ?",
-        (incident_id,)
-    )
-    conn.commit()
-    rows_affected = cursor.rowcount
-    conn.close()
-    return rows_affected
-
-def get_incidents_by_type_count():
-    """Count incidents by type ."""
-    conn = connect_database()
-    query = """
-    SELECT category, COUNT(*) as count
-    FROM cyber_incidents
-    GROUP BY category
-    ORDER BY count DESC
-    """
-    df = pd.read_sql_query(query, conn)
-    conn.close()
-    return df
-
-def get_high_severity_by_status():
-    """Count high severity incidents by status """
-    conn = connect_database()
-    query = """
-    SELECT status, COUNT(*) as count
-    FROM cyber_incidents
-    WHERE severity = 'High'
-    GROUP BY status
-    ORDER BY count DESC
-    """
-    df = pd.read_sql_query(query, conn)
-    conn.close()
-    return df
\ No newline at end of file
+import base64
+import json
+import pandas as pd
+from app.data.db import get_db, transaction
+
+def insert_incident(incident_id, timestamp, category, severity, status, description):
+    """Insert new incident - FIXED PARAMETER ORDER."""
+    with transaction() as conn:
+        conn.execute("""
+            INSERT INTO cyber_incidents
+            (incident_id, timestamp, category, severity, status, description)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, (incident_id, timestamp, category, severity, status, description))
+    return incident_id
+
+def get_all_incidents():
+    """Get all incidents as DataFrame."""
+    with get_db() as conn:
+        return pd.read_sql_query(
+            "SELECT * FROM cyber_incidents ORDER BY incident_id DESC",
+            conn
+        )
+
+def encode_incident_cursor(after_id):
+    """Opaque token for the page that follows incident after_id."""
+    return base64.urlsafe_b64encode(json.dumps({"after_id": int(after_id)}).encode()).decode()
+
+def decode_incident_cursor(cursor):
+    """Incident id stored in a cursor token."""
+    try:
+        return int(json.loads(base64.urlsafe_b64decode(cursor.encode()))["after_id"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Invalid incident cursor: {cursor!r}") from e
+
+def get_incidents_page(after_id=None, limit=50, severities=None, status=None, category=None, cursor=None):
+    """Get one page of incidents, newest first, with keyset pagination.
+
+    Returns (DataFrame, next_cursor); next_cursor is None on the last page.
+    """
+    if cursor is not None:
+        after_id = decode_incident_cursor(cursor)
+
+    conditions = []
+    params = []
+    if after_id is not None:
+        conditions.append("incident_id < ?")
+        params.append(after_id)
+    if severities:
+        conditions.append(f"severity IN ({', '.join('?' for _ in severities)})")
+        params.extend(severities)
+    if status:
+        conditions.append("status = ?")
+        params.append(status)
+    if category:
+        conditions.append("category = ?")
+        params.append(category)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    with get_db() as conn:
+        page = pd.read_sql_query(
+            f"SELECT * FROM cyber_incidents {where} ORDER BY incident_id DESC LIMIT ?",
+            conn,
+            params=tuple(params) + (limit + 1,)
+        )
+    if len(page) <= limit:
+        return page, None
+    page = page.iloc[:limit]
+    return page, encode_incident_cursor(page['incident_id'].iloc[-1])
+
+def update_incident_status(incident_id, new_status):
+    """Update incident status."""
+    with transaction() as conn:
+        cursor = conn.execute(
+            "UPDATE cyber_incidents SET status = ? WHERE incident_id = ?",
+            (new_status, incident_id)
+        )
+    return cursor.rowcount
+
+def delete_incident(incident_id):
+    """Delete an incident."""
+    with transaction() as conn:
+        cursor = conn.execute(
+            "DELETE FROM cyber_incidents WHERE incident_id = ?",
+            (incident_id,)
+        )
+    return cursor.rowcount
+
+def get_incidents_by_type_count():
+    """Count incidents by type ."""
+    query = """
+    SELECT category, COUNT(*) as count
+    FROM cyber_incidents
+    GROUP BY category
+    ORDER BY count DESC
+    """
+    with get_db() as conn:
+        return pd.read_sql_query(query, conn)
+
+def get_weekly_incident_trend(category, severities=None):
+    """Weekly incident counts for a category from the incident_weekly_counts rollup (0 for empty weeks)."""
+    query = "SELECT week_ending, SUM(count) as count FROM incident_weekly_counts WHERE category = ?"
+    params = [category]
+    if severities:
+        query += f" AND severity IN ({', '.join('?' for _ in severities)})"
+        params.extend(severities)
+    with get_db() as conn:
+        weekly = pd.read_sql_query(query + " GROUP BY week_ending ORDER BY week_ending", conn, params=params)
+
+    if weekly.empty:
+        return pd.Series(dtype="int64", name="count")
+    weekly = weekly.set_index(pd.to_datetime(weekly['week_ending'], format="%Y-%m-%d"))['count']
+    weeks = pd.date_range(weekly.index.min(), weekly.index.max(), freq="W-SUN")
+    return weekly.reindex(weeks, fill_value=0)
+
+def get_high_severity_by_status():
+    """Count high severity incidents by status """
+    query = """
+    SELECT status, COUNT(*) as count
+    FROM cyber_incidents
+    WHERE severity = 'High'
+    GROUP BY status
+    ORDER BY count DESC
+    """
+    with get_db() as conn:
+        return pd.read_sql_query(query, conn)
@@ -1,77 +1,207 @@
-from app.data.db import connect_database
-
-def create_users_table(conn):
-    """Create the users table."""
-    cursor = conn.cursor()
-    create_table_sql = """
-    CREATE TABLE IF NOT EXISTS users (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        username TEXT NOT NULL UNIQUE,
-        password_hash TEXT NOT NULL,
-        role TEXT DEFAULT 'user',
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-    )
-    """
-    cursor.execute(create_table_sql)
-    conn.commit()
-    print(" Users table created successfully!")
-
-def create_cyber_incidents_table(conn):
-    """Create the cyber_incidents table."""
-    cursor = conn.cursor()
-    create_table_sql = """
-    CREATE TABLE IF NOT EXISTS cyber_incidents (
-        incident_id INTEGER PRIMARY KEY,
-        timestamp TEXT NOT NULL,
-        severity TEXT NOT NULL,
-        category TEXT NOT NULL,
-        status TEXT NOT NULL,
-        description TEXT
-    )
-    """
-    cursor.execute(create_table_sql)
-    conn.commit()
-    print("Cyber incidents table created successfully!")
-
-def create_datasets_metadata_table(conn):
-    """Create the datasets_metadata table."""
-    cursor = conn.cursor()
-    create_table_sql = """
-    CREATE TABLE IF NOT EXISTS datasets_metadata (
-        dataset_id INTEGER PRIMARY KEY,
-        name TEXT NOT NULL,
-        rows INTEGER,
-        columns INTEGER,
-        uploaded_by TEXT,
-        upload_date TEXT
-    )
-    """
-    cursor.execute(create_table_sql)
-    conn.commit()
-    print(" Datasets metadata table created successfully!")
-
-def create_it_tickets_table(conn):
-    """Create the it_tickets table."""
-    cursor = conn.cursor()
-    create_table_sql = """
-    CREATE TABLE IF NOT EXISTS it_tickets (
-        ticket_id INTEGER PRIMARY KEY,
-        priority TEXT,
-        description TEXT,
-        status TEXT,
-        assigned_to TEXT,
-        created_at TEXT,
-        resolution_time_hours INTEGER
-    )
-    """
-    cursor.execute(create_table_sql)
-    conn.commit()
-    print("IT tickets table created successfully!")
-
-def create_all_tables(conn):
-    """Create all database tables."""
-    create_users_table(conn)
-    create_cyber_incidents_table(conn)
-    create_datasets_metadata_table(conn)
-    create_it_tickets_table(conn)
+from app.data.db import connect_database
+from multi_domain_platform.services.rollup_schema import (DASHBOARD_SUMMARY_TABLES, RESOLUTION_TIME_SKETCH,
+                                                      STAFF_TICKET_STATS)
+
+# Tables the migrations build on; until they exist there is nothing to migrate
+DOMAIN_TABLES = ("cyber_incidents", "datasets_metadata", "it_tickets")
+
+def create_users_table(conn):
+    """Create the users table."""
+    cursor = conn.cursor()
+    create_table_sql = """
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT NOT NULL UNIQUE,
+        password_hash TEXT NOT NULL,
+        role TEXT DEFAULT 'user',
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """
+    cursor.execute(create_table_sql)
+    conn.commit()
+    print(" Users table created successfully!")
+
+def create_cyber_incidents_table(conn):
+    """Create the cyber_incidents table."""
+    cursor = conn.cursor()
+    create_table_sql = """
+    CREATE TABLE IF NOT EXISTS cyber_incidents (
+        incident_id INTEGER PRIMARY KEY,
+        timestamp TEXT NOT NULL,
+        severity TEXT NOT NULL,
+        category TEXT NOT NULL,
+        status TEXT NOT NULL,
+        description TEXT
+    )
+    """
+    cursor.execute(create_table_sql)
+    conn.commit()
+    print("Cyber incidents table created successfully!")
+
+def create_datasets_metadata_table(conn):
+    """Create the datasets_metadata table."""
+    cursor = conn.cursor()
+    create_table_sql = """
+    CREATE TABLE IF NOT EXISTS datasets_metadata (
+        dataset_id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        rows INTEGER,
+        columns INTEGER,
+        uploaded_by TEXT,
+        upload_date TEXT
+    )
+    """
+    cursor.execute(create_table_sql)
+    conn.commit()
+    print(" Datasets metadata table created successfully!")
+
+def create_it_tickets_table(conn):
+    """Create the it_tickets table."""
+    cursor = conn.cursor()
+    create_table_sql = """
+    CREATE TABLE IF NOT EXISTS it_tickets (
+        ticket_id INTEGER PRIMARY KEY,
+        priority TEXT,
+        description TEXT,
+        status TEXT,
+        assigned_to TEXT,
+        created_at TEXT,
+        resolution_time_hours INTEGER
+    )
+    """
+    cursor.execute(create_table_sql)
+    conn.commit()
+    print("IT tickets table created successfully!")
+
+# incident_weekly_counts: incidents per (category, Sunday week_ending, severity)
+WEEKLY_INCIDENT_ROLLUP = (
+    """
+    CREATE TABLE IF NOT EXISTS incident_weekly_counts (
+        category TEXT NOT NULL,
+        week_ending TEXT NOT NULL,
+        severity TEXT NOT NULL,
+        count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (category, week_ending, severity)
+    )
+    """,
+    # Weeks end on Sunday, the same bins as pandas resample("W")
+    """
+    INSERT OR IGNORE INTO incident_weekly_counts (category, week_ending, severity, count)
+    SELECT IFNULL(category, ''), date(timestamp, 'weekday 0'), IFNULL(severity, ''), COUNT(*)
+    FROM cyber_incidents WHERE date(timestamp, 'weekday 0') IS NOT NULL
+    GROUP BY 1, 2, 3
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_incident_weekly_insert AFTER INSERT ON cyber_incidents
+    WHEN date(NEW.timestamp, 'weekday 0') IS NOT NULL
+    BEGIN
+        INSERT INTO incident_weekly_counts (category, week_ending, severity, count)
+        VALUES (IFNULL(NEW.category, ''), date(NEW.timestamp, 'weekday 0'), IFNULL(NEW.severity, ''), 1)
+        ON CONFLICT(category, week_ending, severity) DO UPDATE SET count = count + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_incident_weekly_delete AFTER DELETE ON cyber_incidents
+    BEGIN
+        UPDATE incident_weekly_counts SET count = count - 1
+        WHERE category = IFNULL(OLD.category, '') AND week_ending = date(OLD.timestamp, 'weekday 0')
+          AND severity = IFNULL(OLD.severity, '');
+        DELETE FROM incident_weekly_counts WHERE count <= 0;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_incident_weekly_update
+    AFTER UPDATE OF category, severity, timestamp ON cyber_incidents
+    BEGIN
+        UPDATE incident_weekly_counts SET count = count - 1
+        WHERE category = IFNULL(OLD.category, '') AND week_ending = date(OLD.timestamp, 'weekday 0')
+          AND severity = IFNULL(OLD.severity, '');
+        INSERT INTO incident_weekly_counts (category, week_ending, severity, count)
+        SELECT IFNULL(NEW.category, ''), date(NEW.timestamp, 'weekday 0'), IFNULL(NEW.severity, ''), 1
+        WHERE date(NEW.timestamp, 'weekday 0') IS NOT NULL
+        ON CONFLICT(category, week_ending, severity) DO UPDATE SET count = count + 1;
+        DELETE FROM incident_weekly_counts WHERE count <= 0;
+    END
+    """,
+)
+
+# Ordered schema changes: (version, description, statements)
+MIGRATIONS = [
+    (1, "Add indexes for dashboard filters and summaries", [
+        "CREATE INDEX IF NOT EXISTS idx_incidents_status ON cyber_incidents(status)",
+        "CREATE INDEX IF NOT EXISTS idx_incidents_severity_status ON cyber_incidents(severity, status)",
+        "CREATE INDEX IF NOT EXISTS idx_incidents_category_timestamp ON cyber_incidents(category, timestamp)",
+        "CREATE INDEX IF NOT EXISTS idx_incidents_timestamp ON cyber_incidents(timestamp)",
+        "CREATE INDEX IF NOT EXISTS idx_tickets_status_resolution ON it_tickets(status, resolution_time_hours)",
+        "CREATE INDEX IF NOT EXISTS idx_tickets_priority_status ON it_tickets(priority, status)",
+        "CREATE INDEX IF NOT EXISTS idx_tickets_assigned_resolution ON it_tickets(assigned_to, resolution_time_hours)",
+        "CREATE INDEX IF NOT EXISTS idx_datasets_uploaded_by ON datasets_metadata(uploaded_by)",
+        "CREATE INDEX IF NOT EXISTS idx_datasets_rows_columns ON datasets_metadata(rows, columns)",
+        "ANALYZE",
+    ]),
+    (2, "Add weekly incident rollup for trend charts", WEEKLY_INCIDENT_ROLLUP),
+    (3, "Add per-assignee running ticket aggregates for staff performance", STAFF_TICKET_STATS),
+    (4, "Add log-histogram sketch of ticket resolution times", RESOLUTION_TIME_SKETCH),
+    (5, "Add trigger-maintained summary tables for dashboard metrics", DASHBOARD_SUMMARY_TABLES),
+]
+
+def apply_migrations(conn):
+    """Apply any migrations newer than the recorded legacy_schema_version.
+
+    The multi-domain platform keeps its own numbering in schema_version, and
+    both apps can point at the same file, so the legacy versions live apart.
+    """
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS legacy_schema_version (
+        version INTEGER PRIMARY KEY,
+        description TEXT NOT NULL,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """)
+    conn.commit()
+    current = conn.execute("SELECT MAX(version) FROM legacy_schema_version").fetchone()[0] or 0
+
+    for version, description, statements in MIGRATIONS:
+        if version <= current:
+            continue
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Another connection may have applied it while we waited for the write lock
+            if conn.execute("SELECT 1 FROM legacy_schema_version WHERE version = ?", (version,)).fetchone():
+                conn.rollback()
+                continue
+            for statement in statements:
+                conn.execute(statement)
+            conn.execute(
+                "INSERT OR IGNORE INTO legacy_schema_version (version, description) VALUES (?, ?)",
+                (version, description)
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        print(f" Applied migration {version}: {description}")
+
+def apply_migrations_if_ready(conn):
+    """Apply pending migrations if the domain tables exist; returns False if they don't yet.
+
+    Called on the first connection to each database, so the pages get the
+    rollup tables even when main.py (create_all_tables) was never run.
+    """
+    placeholders = ", ".join("?" for _ in DOMAIN_TABLES)
+    found = conn.execute(
+        f"SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name IN ({placeholders})", DOMAIN_TABLES
+    ).fetchone()[0]
+    if found < len(DOMAIN_TABLES):
+        return False
+    apply_migrations(conn)
+    return True
+
+def create_all_tables(conn):
+    """Create all database tables."""
+    create_users_table(conn)
+    create_cyber_incidents_table(conn)
+    create_datasets_metadata_table(conn)
+    create_it_tickets_table(conn)
+    apply_migrations(conn)
     print(" All tables created successfully!")
\ No newline at end of file
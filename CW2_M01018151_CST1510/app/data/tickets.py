@@ -1,90 +1,152 @@
-import pandas as pd
-from app.data.db import connect_database
-
-def get_all_tickets():
-    """Get all IT tickets."""
-    conn = connect_database()
-    df = pd.read_sql_query("SELECT * FROM it_tickets", conn)
-    conn.close()
-    return df
-
-def get_tickets_by_status(status):
-    """Get tickets by status."""
-    conn = connect_database()
-    query = "SELECT * FROM it_tickets WHERE status = ?"
-    df = pd.read_sql_query(query, conn, params=(status,))
-    conn.close()
-    return df
-
-def insert_ticket(ticket_id, priority, description, status, assigned_to, created_at, resolution_time_hours):
-    """Insert new IT ticket."""
-    conn = connect_database()
-    cursor = conn.cursor()
-    cursor.execute("""
-        INSERT INTO it_tickets
-        (ticket_id, priority, description, status, assigned_to, created_at, resolution_time_hours)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-    """, (ticket_id, priority, description, status, assigned_to, created_at, resolution_time_hours))
-    conn.commit()
-    conn.close()
-    return ticket_id
-
-def update_ticket_status(ticket_id, new_status):
-    """Update ticket status."""
-    conn = connect_database()
-    cursor = conn.cursor()
-    cursor.execute(
-        "UPDATE it_tickets SET status = ? WHERE ticket_id = ?",
-        (new_status, ticket_id)
-    )
-    conn.commit()
-    rows_affected = cursor.rowcount
-    conn.close()
-    return rows_affected
-
-def delete_ticket(ticket_id):
-    """Delete a ticket."""
-    conn = connect_database()
-    cursor = conn.cursor()
-    cursor.execute(
-        "DELETE FROM it_tickets WHERE ticket_id = ?",
-        (ticket_id,)
-    )
-    conn.commit()
-    rows_affected = cursor.rowcount
-    conn.close()
-    return rows_affected
-
-# Simple analytical queries
-def get_ticket_summary():
-    """Get basic ticket summary."""
-    conn = connect_database()
-    query = """
-    SELECT 
-        COUNT(*) as total_tickets,
-        AVG(resolution_time_hours) as avg_resolution_time,
-        SUM(CASE WHEN status = 'Open' THEN 1 ELSE 0 END) as open_tickets
-    FROM it_tickets
-    """
-    cursor = conn.cursor()
-    cursor.execute(query)
-    result = cursor.fetchone()
-    conn.close()
-    return result
-
-def get_staff_performance():
-    """Simple staff performance analysis."""
-    conn = connect_database()
-    query = """
-    SELECT 
-        assigned_to,
-        COUNT(*) as ticket_count,
-        AVG(resolution_time_hours) as avg_resolution_time
-    FROM it_tickets 
-    WHERE assigned_to IS NOT NULL
-    GROUP BY assigned_to
-    ORDER BY avg_resolution_time DESC
-    """
-    df = pd.read_sql_query(query, conn)
-    conn.close()
-    return df
\ No newline at end of file
+import pandas as pd
+from app.data.db import get_db, transaction
+
+def get_all_tickets():
+    """Get all IT tickets."""
+    with get_db() as conn:
+        return pd.read_sql_query("SELECT * FROM it_tickets", conn)
+
+def get_tickets_by_status(status):
+    """Get tickets by status."""
+    query = "SELECT * FROM it_tickets WHERE status = ?"
+    with get_db() as conn:
+        return pd.read_sql_query(query, conn, params=(status,))
+
+def insert_ticket(ticket_id, priority, description, status, assigned_to, created_at, resolution_time_hours):
+    """Insert new IT ticket."""
+    with transaction() as conn:
+        conn.execute("""
+            INSERT INTO it_tickets
+            (ticket_id, priority, description, status, assigned_to, created_at, resolution_time_hours)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (ticket_id, priority, description, status, assigned_to, created_at, resolution_time_hours))
+    return ticket_id
+
+def update_ticket_status(ticket_id, new_status):
+    """Update ticket status."""
+    with transaction() as conn:
+        cursor = conn.execute(
+            "UPDATE it_tickets SET status = ? WHERE ticket_id = ?",
+            (new_status, ticket_id)
+        )
+    return cursor.rowcount
+
+def delete_ticket(ticket_id):
+    """Delete a ticket."""
+    with transaction() as conn:
+        cursor = conn.execute(
+            "DELETE FROM it_tickets WHERE ticket_id = ?",
+            (ticket_id,)
+        )
+    return cursor.rowcount
+
+# Simple analytical queries
+def get_ticket_summary():
+    """Get basic ticket summary."""
+    query = """
+    SELECT 
+        COUNT(*) as total_tickets,
+        AVG(resolution_time_hours) as avg_resolution_time,
+        SUM(CASE WHEN status = 'Open' THEN 1 ELSE 0 END) as open_tickets
+    FROM it_tickets
+    """
+    with get_db() as conn:
+        return conn.execute(query).fetchone()
+
+def get_staff_performance():
+    """Staff performance per assignee from the trigger-maintained staff_ticket_stats table."""
+    query = """
+    SELECT
+        assigned_to,
+        SUM(count) as ticket_count,
+        SUM(resolution_sum) / NULLIF(SUM(resolution_count), 0) as avg_resolution_time,
+        CASE WHEN SUM(resolution_count) > 1 THEN
+            MAX(0, SUM(resolution_sumsq) - SUM(resolution_sum) * SUM(resolution_sum) / SUM(resolution_count))
+            / (SUM(resolution_count) - 1)
+        END as resolution_time_variance,
+        SUM(resolved_count) as resolved_tickets
+    FROM staff_ticket_stats
+    GROUP BY assigned_to
+    ORDER BY avg_resolution_time DESC
+    """
+    with get_db() as conn:
+        return pd.read_sql_query(query, conn)
+
+def get_staff_performance_by_priority():
+    """Staff performance per assignee and priority from staff_ticket_stats."""
+    query = """
+    SELECT
+        assigned_to,
+        priority,
+        count as ticket_count,
+        resolution_sum / NULLIF(resolution_count, 0) as avg_resolution_time,
+        CASE WHEN resolution_count > 1 THEN
+            MAX(0, resolution_sumsq - resolution_sum * resolution_sum / resolution_count)
+            / (resolution_count - 1)
+        END as resolution_time_variance,
+        resolved_count as resolved_tickets
+    FROM staff_ticket_stats
+    ORDER BY assigned_to, priority
+    """
+    with get_db() as conn:
+        return pd.read_sql_query(query, conn)
+
+# Percentiles read from the resolution_time_sketch histograms
+RESOLUTION_PERCENTILES = {"p50": 0.5, "p90": 0.9, "p99": 0.99}
+
+def get_resolution_percentiles(by="priority", priorities=None, assignees=None):
+    """p50/p90/p99 resolution time of resolved tickets per priority or assignee (by=None merges all).
+
+    Computed from the trigger-maintained log histograms, so the cost does not
+    grow with the number of tickets; values are within 2.5% of exact.
+    """
+    if by not in ("priority", "assigned_to", None):
+        raise ValueError(f"Cannot group resolution percentiles by {by!r}")
+
+    conditions = []
+    params = []
+    if priorities:
+        conditions.append(f"priority IN ({', '.join('?' for _ in priorities)})")
+        params.extend(priorities)
+    if assignees:
+        conditions.append(f"assigned_to IN ({', '.join('?' for _ in assignees)})")
+        params.extend(assignees)
+    if by == "assigned_to":
+        conditions.append("assigned_to != ''")
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    # First bucket whose running count reaches q * total holds the q-th percentile
+    picks = ",\n".join(
+        f"MIN(CASE WHEN running >= {q} * total THEN bucket END) as {name}"
+        for name, q in RESOLUTION_PERCENTILES.items()
+    )
+    values = ", ".join(f"{name}.value as {name}" for name in RESOLUTION_PERCENTILES)
+    joins = "\n".join(
+        f"JOIN resolution_time_buckets {name} ON {name}.bucket = picked.{name}"
+        for name in RESOLUTION_PERCENTILES
+    )
+    query = f"""
+    WITH hist AS (
+        SELECT {by or "'all'"} as key, bucket, SUM(count) as count
+        FROM resolution_time_sketch {where}
+        GROUP BY 1, 2
+    ),
+    ranked AS (
+        SELECT key, bucket,
+            SUM(count) OVER (PARTITION BY key ORDER BY bucket) as running,
+            SUM(count) OVER (PARTITION BY key) as total
+        FROM hist
+    ),
+    picked AS (
+        SELECT key, MAX(total) as total,
+        {picks}
+        FROM ranked
+        GROUP BY key
+    )
+    SELECT picked.key as {by or "scope"}, picked.total as resolved_tickets, {values}
+    FROM picked
+    {joins}
+    ORDER BY picked.key
+    """
+    with get_db() as conn:
+        return pd.read_sql_query(query, conn, params=params)
\ No newline at end of file
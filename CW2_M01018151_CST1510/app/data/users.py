@@ -1,33 +1,22 @@
-from app.data.db import connect_database
-
-def get_user_by_username(username):
-    """Retrieve user by username."""
-    conn = connect_database()
-    cursor = conn.cursor()
-    cursor.execute(
-        "SELECT * FROM users WHERE username = ?",
-        (username,)
-    )
-    user = cursor.fetchone()
-    conn.close()
-    return user
-
-def insert_user(username, password_hash, role='user'):
-    """Insert new user."""
-    conn = connect_database()
-    cursor = conn.cursor()
-    cursor.execute(
-        "INSERT INTO users (username, password_hash, role) VALUES (?, ?, ?)",
-        (username, password_hash, role)
-    )
-    conn.commit()
-    conn.close()
-
-def get_all_users():
-    """Get all users."""
-    conn = connect_database()
-    cursor = conn.cursor()
-    cursor.execute("SELECT id, username, role FROM users")
-    users = cursor.fetchall()
-    conn.close()
-    return users
\ No newline at end of file
+from app.data.db import get_db, transaction
+
+def get_user_by_username(username):
+    """Retrieve user by username."""
+    with get_db() as conn:
+        return conn.execute(
+            "SELECT * FROM users WHERE username = ?",
+            (username,)
+        ).fetchone()
+
+def insert_user(username, password_hash, role='user'):
+    """Insert new user."""
+    with transaction() as conn:
+        conn.execute(
+            "INSERT INTO users (username, password_hash, role) VALUES (?, ?, ?)",
+            (username, password_hash, role)
+        )
+
+def get_all_users():
+    """Get all users."""
+    with get_db() as conn:
+        return conn.execute("SELECT id, username, role FROM users").fetchall()
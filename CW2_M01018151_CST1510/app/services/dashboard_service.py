@@ -0,0 +1,47 @@
+import pandas as pd
+from app.data.db import read_snapshot
+
+# All six metrics in one statement, read from the trigger-maintained summary tables
+# so the cost does not grow with the domain tables
+OVERVIEW_METRICS_SQL = """
+SELECT
+    (SELECT IFNULL(SUM(count), 0) FROM incident_counts),
+    (SELECT IFNULL(SUM(count), 0) FROM incident_counts WHERE status = 'Open'),
+    (SELECT IFNULL(SUM(count), 0) FROM dataset_totals),
+    (SELECT IFNULL(SUM(rows_sum), 0) FROM dataset_totals),
+    (SELECT IFNULL(SUM(count), 0) FROM ticket_counts),
+    (SELECT IFNULL(SUM(count), 0) FROM ticket_counts WHERE status = 'Open')
+"""
+
+# Newest rows first, read backwards along the primary key
+RECENT_INCIDENTS_SQL = """
+SELECT incident_id, timestamp, severity, category, status
+FROM cyber_incidents ORDER BY incident_id DESC LIMIT ?
+"""
+RECENT_DATASETS_SQL = """
+SELECT dataset_id, name, rows, upload_date
+FROM datasets_metadata ORDER BY dataset_id DESC LIMIT ?
+"""
+RECENT_TICKETS_SQL = """
+SELECT ticket_id, priority, status, assigned_to, created_at
+FROM it_tickets ORDER BY ticket_id DESC LIMIT ?
+"""
+
+
+def overview(limit=5):
+    """Dashboard metrics and the newest rows per domain from one connection visit.
+
+    Returns a dict with total_incidents, open_incidents, total_datasets,
+    total_rows, total_tickets, open_tickets and the recent_incidents,
+    recent_datasets and recent_tickets DataFrames.
+    """
+    with read_snapshot() as conn:  # One snapshot for all four queries
+        metrics = conn.execute(OVERVIEW_METRICS_SQL).fetchone()
+        recent_incidents = pd.read_sql_query(RECENT_INCIDENTS_SQL, conn, params=(limit,))
+        recent_datasets = pd.read_sql_query(RECENT_DATASETS_SQL, conn, params=(limit,))
+        recent_tickets = pd.read_sql_query(RECENT_TICKETS_SQL, conn, params=(limit,))
+
+    names = ("total_incidents", "open_incidents", "total_datasets", "total_rows", "total_tickets", "open_tickets")
+    result = dict(zip(names, metrics))
+    result.update(recent_incidents=recent_incidents, recent_datasets=recent_datasets, recent_tickets=recent_tickets)
+    return result
@@ -1,148 +1,227 @@
-import bcrypt
-import pandas as pd
-from pathlib import Path
-from app.data.db import connect_database
-from app.data.users import get_user_by_username, insert_user
-
-
-def register_user(username, password, role="user"):
-    """Register a new user."""
-    conn = connect_database()
-    cursor = conn.cursor()
-
-    # Check if user exists
-    cursor.execute("SELECT * FROM users WHERE username = ?", (username,))
-    if cursor.fetchone():
-        conn.close()
-        return False, f"Username '{username}' already exists."
-
-    # Hash password
-    password_bytes = password.encode('utf-8')
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password_bytes, salt)
-    password_hash = hashed.decode('utf-8')
-
-    # Insert user
-    cursor.execute(
-        "INSERT INTO users (username, password_hash, role) VALUES (?, ?, ?)",
-        (username, password_hash, role)
-    )
-    conn.commit()
-    conn.close()
-
-    return True, f"User '{username}' registered successfully!"
-
-
-def login_user(username, password):
-    """Authenticate a user."""
-    user = get_user_by_username(username)
-    if not user:
-        return False, "Username not found.", None  # ← ADDED None as 3rd value
-
-    stored_hash = user[2]  # password_hash column
-    password_bytes = password.encode('utf-8')
-    hash_bytes = stored_hash.encode('utf-8')
-
-    if bcrypt.checkpw(password_bytes, hash_bytes):
-        # Create user_data dictionary from database row
-        # user = (id, username, password_hash, role, created_at)
-        user_data = {
-            'id': user[0],
-            'username': user[1],
-            'role': user[3] if len(user) > 3 else 'user',
-            'created_at': user[4] if len(user) > 4 else None
-        }
-        return True, f"Welcome, {username}!", user_data  # ← ADDED user_data as 3rd value
-    else:
-        return False, "Invalid password.", None  # ← ADDED None as 3rd value
-
-
-def migrate_users_from_file(filepath='DATA/users.txt'):
-    """Migrate users from text file to database."""
-    filepath = Path(filepath)
-    if not filepath.exists():
-        print(f" File not found: {filepath}")
-        return 0
-
-    conn = connect_database()
-    cursor = conn.cursor()
-    migrated_count = 0
-
-    with open(filepath, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-
-            parts = line.split(',')
-            if len(parts) >= 2:
-                username = parts[0]
-                password_hash = parts[1]
-
-                try:
-                    cursor.execute(
-                        "INSERT OR IGNORE INTO users (username, password_hash, role) VALUES (?, ?, ?)",
-                        (username, password_hash, 'user')
-                    )
-                    if cursor.rowcount > 0:
-                        migrated_count += 1
-                except Exception as e:
-                    print(f"Error migrating user {username}: {e}")
-
-    conn.commit()
-    conn.close()
-    print(f"Migrated {migrated_count} users from {filepath.name}")
-    return migrated_count
-
-
-def load_csv_to_table(csv_path, table_name):
-    """Load CSV data into database table"""
-    csv_path = Path(csv_path)
-    if not csv_path.exists():
-        print(f" CSV file not found: {csv_path}")
-        return 0
-
-    conn = connect_database()
-
-    try:
-        # Check if table has data
-        cursor = conn.cursor()
-        cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-        count = cursor.fetchone()[0]
-
-        if count > 0:
-            print(f"  Skipping {table_name} - already has {count} rows")
-            return 0
-
-        df = pd.read_csv(csv_path)
-        rows_loaded = df.to_sql(
-            name=table_name,
-            con=conn,
-            if_exists='append',
-            index=False
-        )
-        print(f" Loaded {rows_loaded} rows into {table_name} table")
-        return rows_loaded
-    except Exception as e:
-        print(f"Error loading {csv_path}: {e}")
-        return 0
-    finally:
-        conn.close()
-
-
-def load_all_csv_data():
-    """Load all CSV files into database"""
-    csv_files = {
-        'cyber_incidents': 'DATA/cyber_incidents.csv',
-        'datasets_metadata': 'DATA/datasets_metadata.csv',
-        'it_tickets': 'DATA/it_tickets.csv'
-    }
-
-    total_rows = 0
-    for table_name, csv_path in csv_files.items():
-        rows_loaded = load_csv_to_table(csv_path, table_name)
-        total_rows += rows_loaded
-
-    return total_rows
-
+import bcrypt
+import re
+import time
+from pathlib import Path
+from app.data.db import get_db, transaction
+from app.data.users import get_user_by_username, insert_user
+from multi_domain_platform.services.csv_ingest import (DEFAULT_RANGE_BYTES, insert_sql, parallel_load_csv_files,
+                                                       read_csv_chunks)
+
+# bcrypt hashes look like $2b$12$ followed by 53 characters of salt and hash
+BCRYPT_HASH_PATTERN = re.compile(r'^\$2[abxy]?\$\d{2}\$[./A-Za-z0-9]{53}$')
+
+
+def register_user(username, password, role="user"):
+    """Register a new user."""
+    # Check if user exists
+    if get_user_by_username(username):
+        return False, f"Username '{username}' already exists."
+
+    # Hash password
+    password_bytes = password.encode('utf-8')
+    salt = bcrypt.gensalt()
+    hashed = bcrypt.hashpw(password_bytes, salt)
+    password_hash = hashed.decode('utf-8')
+
+    # Insert user
+    insert_user(username, password_hash, role)
+
+    return True, f"User '{username}' registered successfully!"
+
+
+def login_user(username, password):
+    """Authenticate a user."""
+    user = get_user_by_username(username)
+    if not user:
+        return False, "Username not found.", None  # ← ADDED None as 3rd value
+
+    stored_hash = user[2]  # password_hash column
+    password_bytes = password.encode('utf-8')
+    hash_bytes = stored_hash.encode('utf-8')
+
+    if bcrypt.checkpw(password_bytes, hash_bytes):
+        # Create user_data dictionary from database row
+        # user = (id, username, password_hash, role, created_at)
+        user_data = {
+            'id': user[0],
+            'username': user[1],
+            'role': user[3] if len(user) > 3 else 'user',
+            'created_at': user[4] if len(user) > 4 else None
+        }
+        return True, f"Welcome, {username}!", user_data  # ← ADDED user_data as 3rd value
+    else:
+        return False, "Invalid password.", None  # ← ADDED None as 3rd value
+
+
+def migrate_users_from_file(filepath='DATA/users.txt'):
+    """Migrate users from text file to database."""
+    filepath = Path(filepath)
+    if not filepath.exists():
+        print(f" File not found: {filepath}")
+        return 0
+
+    migrated_count = 0
+
+    with transaction() as conn, open(filepath, 'r') as f:
+        cursor = conn.cursor()
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+
+            parts = line.split(',')
+            if len(parts) >= 2:
+                username = parts[0]
+                password_hash = parts[1]
+
+                try:
+                    cursor.execute(
+                        "INSERT OR IGNORE INTO users (username, password_hash, role) VALUES (?, ?, ?)",
+                        (username, password_hash, 'user')
+                    )
+                    if cursor.rowcount > 0:
+                        migrated_count += 1
+                except Exception as e:
+                    print(f"Error migrating user {username}: {e}")
+
+    print(f"Migrated {migrated_count} users from {filepath.name}")
+    return migrated_count
+
+
+def bulk_migrate_users_from_file(filepath='DATA/users.txt', batch_size=10000):
+    """Migrate a large users file in executemany batches inside one transaction.
+
+    Each line is username,bcrypt_hash[,role]. Lines with a missing field or a
+    hash that is not in bcrypt format are counted as malformed and skipped;
+    usernames that already exist (in the database or earlier in the file)
+    are counted as duplicates. Returns a summary dict.
+    """
+    filepath = Path(filepath)
+    summary = {'inserted': 0, 'duplicates': 0, 'malformed': 0, 'lines': 0,
+               'seconds': 0.0, 'lines_per_sec': 0.0}
+    if not filepath.exists():
+        print(f" File not found: {filepath}")
+        return summary
+
+    start = time.perf_counter()
+
+    def flush(conn, batch):
+        cursor = conn.executemany(
+            "INSERT OR IGNORE INTO users (username, password_hash, role) VALUES (?, ?, ?)",
+            batch
+        )
+        summary['inserted'] += cursor.rowcount
+        summary['duplicates'] += len(batch) - cursor.rowcount
+        elapsed = time.perf_counter() - start
+        print(f"  {summary['lines']:,} lines processed ({summary['lines'] / elapsed:,.0f} lines/sec)")
+
+    with transaction() as conn, open(filepath, 'r', encoding='utf-8') as f:
+        batch = []
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            summary['lines'] += 1
+
+            parts = [part.strip() for part in line.split(',')]
+            if len(parts) < 2 or not parts[0] or not BCRYPT_HASH_PATTERN.match(parts[1]):
+                summary['malformed'] += 1
+                continue
+            role = parts[2] if len(parts) > 2 and parts[2] else 'user'
+            batch.append((parts[0], parts[1], role))
+
+            if len(batch) >= batch_size:
+                flush(conn, batch)
+                batch = []
+        if batch:
+            flush(conn, batch)
+
+    summary['seconds'] = time.perf_counter() - start
+    if summary['seconds'] > 0:
+        summary['lines_per_sec'] = summary['lines'] / summary['seconds']
+    print(f"Migrated {summary['inserted']} users from {filepath.name}: "
+          f"{summary['duplicates']} duplicates, {summary['malformed']} malformed, "
+          f"{summary['lines_per_sec']:,.0f} lines/sec")
+    return summary
+
+
+def load_csv_to_table(csv_path, table_name, chunk_size=10000):
+    """Load CSV data into database table in chunks, so memory use stays constant"""
+    csv_path = Path(csv_path)
+    if not csv_path.exists():
+        print(f" CSV file not found: {csv_path}")
+        return 0
+
+    try:
+        with get_db() as conn:
+            # Check if table has data
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
+            count = cursor.fetchone()[0]
+
+            if count > 0:
+                print(f"  Skipping {table_name} - already has {count} rows")
+                return 0
+
+            start = time.perf_counter()
+            rows_loaded = 0
+            # Shared chunked reader; empty fields become NULL. These tables have no epoch columns
+            for chunk in read_csv_chunks(str(csv_path), chunk_size):
+                # One executemany and one commit per chunk
+                with transaction():
+                    conn.executemany(insert_sql(table_name, chunk.columns), chunk.rows)
+                rows_loaded += len(chunk.rows)
+            elapsed = time.perf_counter() - start
+
+        rate = rows_loaded / elapsed if elapsed > 0 else 0
+        print(f" Loaded {rows_loaded} rows into {table_name} table ({rate:,.0f} rows/sec)")
+        return rows_loaded
+    except Exception as e:
+        print(f"Error loading {csv_path}: {e}")
+        return 0
+
+
+def load_all_csv_data(max_workers=None, range_bytes=DEFAULT_RANGE_BYTES):
+    """Load all CSV files into database
+
+    Empty tables are filled in one pass by the platform's parallel CSV
+    loader: worker processes parse the files in byte ranges (small files are
+    parsed in-process) and this process writes the parsed rows over one connection.
+    """
+    csv_files = {
+        'cyber_incidents': 'DATA/cyber_incidents.csv',
+        'datasets_metadata': 'DATA/datasets_metadata.csv',
+        'it_tickets': 'DATA/it_tickets.csv'
+    }
+
+    try:
+        with get_db() as conn:
+            to_load = {}
+            for table_name, csv_path in csv_files.items():
+                if not Path(csv_path).exists():
+                    print(f" CSV file not found: {csv_path}")
+                    continue
+                count = conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
+                if count > 0:
+                    print(f"  Skipping {table_name} - already has {count} rows")
+                    continue
+                to_load[table_name] = csv_path
+
+            start_time = time.perf_counter()
+            # These tables have no epoch columns
+            results = parallel_load_csv_files(conn, to_load, max_workers=max_workers,
+                                              range_bytes=range_bytes, add_epochs=False)
+            elapsed = time.perf_counter() - start_time
+    except Exception as e:
+        print(f"Error loading CSV files: {e}")
+        return 0
+
+    for stats in results.values():
+        skipped = f", {stats.skipped} malformed skipped" if stats.skipped else ""
+        print(f" Loaded {stats.rows} rows into {stats.table} table{skipped}")
+    total_rows = sum(stats.rows for stats in results.values())
+    rate = total_rows / elapsed if elapsed > 0 else 0
+    print(f" {total_rows} rows in {elapsed:.2f}s ({rate:,.0f} rows/sec)")
+    return total_rows
+
 #Chat Gpt was used to debug this file
\ No newline at end of file
@@ -0,0 +1,159 @@
+# benchmarks.py
+# Run from the multi_domain_platform folder: python benchmarks.py
+import csv
+import io
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+from services import parquet_io
+from services.csv_ingest import stream_csv_to_table
+from services.database_manager import DatabaseManager
+from services.migrations import MigrationRunner
+
+INCIDENTS_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS cyber_incidents (
+    incident_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    category TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    status TEXT DEFAULT 'Open',
+    description TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+
+def _sample_incidents(count: int, start_id: int = 1):
+    """Generate incident rows for the insert benchmarks."""
+    categories = ["Malware", "Phishing", "DDoS", "Misconfiguration", "Unauthorized Access"]
+    severities = ["Low", "Medium", "High", "Critical"]
+    for i in range(start_id, start_id + count):
+        yield (i, "2024-04-12 19:00:00", categories[i % 5], severities[i % 4], "Open", f"Incident {i}")
+
+
+def _fresh_database(folder: str, name: str) -> DatabaseManager:
+    db = DatabaseManager(os.path.join(folder, name))
+    db.execute_query(INCIDENTS_TABLE_SQL)
+    return db
+
+
+def _report(label: str, rows: int, seconds: float) -> None:
+    rate = rows / seconds if seconds > 0 else float("inf")
+    print(f"   {label:<32} {rows:>8} rows in {seconds:8.2f}s  ({rate:,.0f} rows/sec)")
+
+
+def benchmark_transactions(rows: int = 100_000) -> None:
+    """Compare one commit per row against batched single-commit inserts."""
+    insert_sql = """
+        INSERT INTO cyber_incidents (incident_id, timestamp, category, severity, status, description)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """
+    print(f"\nInsert benchmark ({rows:,} incidents)")
+
+    with tempfile.TemporaryDirectory() as folder:
+        db = _fresh_database(folder, "per_row.db")
+        start = time.perf_counter()
+        for row in _sample_incidents(rows):
+            db.execute_query(insert_sql, row)
+        _report("execute_query (commit per row)", rows, time.perf_counter() - start)
+        db.close()
+
+        db = _fresh_database(folder, "transaction.db")
+        start = time.perf_counter()
+        with db.transaction():
+            for row in _sample_incidents(rows):
+                db.execute_query(insert_sql, row)
+        _report("transaction() + execute_query", rows, time.perf_counter() - start)
+        db.close()
+
+        db = _fresh_database(folder, "execute_many.db")
+        start = time.perf_counter()
+        db.execute_many(insert_sql, _sample_incidents(rows))
+        _report("execute_many (single commit)", rows, time.perf_counter() - start)
+        db.close()
+
+
+def benchmark_startup(constructions: int = 1000) -> None:
+    """Time DatabaseManager construction as done on every Streamlit rerun."""
+    print(f"\nStartup benchmark ({constructions:,} constructions)")
+
+    with tempfile.TemporaryDirectory() as folder:
+        db_path = os.path.join(folder, "startup.db")
+
+        start = time.perf_counter()
+        db = DatabaseManager(db_path)
+        cold = time.perf_counter() - start
+        print(f"   first construction (schema bootstrap)  {cold * 1000:8.2f} ms")
+
+        # What every rerun used to pay: a new connection plus the sqlite_master probe
+        start = time.perf_counter()
+        with redirect_stdout(io.StringIO()):  # Silence the per-call status prints
+            for _ in range(constructions):
+                db._initialize_database()
+        bootstrap = (time.perf_counter() - start) / constructions
+        print(f"   schema bootstrap per construction     {bootstrap * 1000:8.3f} ms")
+
+        start = time.perf_counter()
+        for _ in range(constructions):
+            DatabaseManager(db_path)
+        warm = (time.perf_counter() - start) / constructions
+        print(f"   registry lookup per construction      {warm * 1000:8.3f} ms")
+        DatabaseManager.clear_registry()
+
+
+def _migrated_connection(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    with redirect_stdout(io.StringIO()):
+        MigrationRunner(conn).apply()
+    return conn
+
+
+def benchmark_parquet(rows: int = 100_000) -> None:
+    """Compare CSV and Parquet round trips (export, then import into a new database)."""
+    if parquet_io.pq is None:
+        print("\nParquet benchmark skipped: pyarrow is not installed")
+        return
+    print(f"\nCSV vs Parquet round trip ({rows:,} incidents)")
+    columns = ["incident_id", "timestamp", "category", "severity", "status", "description"]
+
+    with tempfile.TemporaryDirectory() as folder:
+        source = _migrated_connection(os.path.join(folder, "source.db"))
+        source.executemany(
+            "INSERT INTO cyber_incidents (incident_id, timestamp, category, severity, status, description) "
+            "VALUES (?, ?, ?, ?, ?, ?)", _sample_incidents(rows))
+        source.commit()
+
+        csv_path = os.path.join(folder, "cyber_incidents.csv")
+        start = time.perf_counter()
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            writer.writerows(source.execute(f"SELECT {', '.join(columns)} FROM cyber_incidents"))
+        csv_export = time.perf_counter() - start
+        target = _migrated_connection(os.path.join(folder, "from_csv.db"))
+        csv_import = stream_csv_to_table(target, csv_path, "cyber_incidents").seconds
+        target.close()
+
+        parquet_path = os.path.join(folder, "cyber_incidents.parquet")
+        parquet_export = parquet_io.export_table_to_parquet(source, "cyber_incidents", parquet_path, columns).seconds
+        target = _migrated_connection(os.path.join(folder, "from_parquet.db"))
+        parquet_import = parquet_io.import_parquet_to_table(target, parquet_path, "cyber_incidents").seconds
+        target.close()
+        source.close()
+
+        for label, export_time, import_time, path in (("CSV", csv_export, csv_import, csv_path),
+                                                      ("Parquet", parquet_export, parquet_import, parquet_path)):
+            size_mb = os.path.getsize(path) / (1024 * 1024)
+            print(f"   {label:<8} export {export_time:6.2f}s  import {import_time:6.2f}s  "
+                  f"round trip {export_time + import_time:6.2f}s  file {size_mb:7.2f} MB")
+
+
+if __name__ == "__main__":
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    benchmark_transactions(row_count)
+    benchmark_startup()
+    benchmark_parquet(row_count)
@@ -1,72 +1,135 @@
-
-import bcrypt
-import pandas as pd
-from pathlib import Path
-import sqlite3
-import os
-
-
-def connect_database():
-    """Connect to SQLite database."""
-    db_path = r"C:\Users\gwati\PycharmProjects\newproject\CW2_M01018151_CST1510\multi_domain_platform\intelligence_platform.db"
-    return sqlite3.connect(db_path)
-
-
-def load_csv_to_table(csv_path, table_name):
-    """Load CSV data into database table"""
-    csv_path = Path(csv_path)
-    if not csv_path.exists():
-        print(f" CSV file not found: {csv_path}")
-        return 0
-
-    conn = connect_database()
-
-    try:
-        # Check if table has data
-        cursor = conn.cursor()
-        cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-        count = cursor.fetchone()[0]
-
-        if count > 0:
-            print(f"  Skipping {table_name} - already has {count} rows")
-            return 0
-
-        df = pd.read_csv(csv_path)
-        rows_loaded = df.to_sql(
-            name=table_name,
-            con=conn,
-            if_exists='append',
-            index=False
-        )
-        print(f" Loaded {rows_loaded} rows into {table_name} table")
-        return rows_loaded
-    except Exception as e:
-        print(f"Error loading {csv_path}: {e}")
-        return 0
-    finally:
-        conn.close()
-
-
-def load_all_csv_data():
-    """Load all CSV files into database"""
-    # Update paths to  OOP DATA folder
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    data_folder = os.path.join(current_dir, "OOP DATA")
-
-    csv_files = {
-        'cyber_incidents': os.path.join(data_folder, 'cyber_incidents.csv'),
-        'datasets_metadata': os.path.join(data_folder, 'datasets_metadata.csv'),
-        'it_tickets': os.path.join(data_folder, 'it_tickets.csv')
-    }
-
-    total_rows = 0
-    for table_name, csv_path in csv_files.items():
-        rows_loaded = load_csv_to_table(csv_path, table_name)
-        total_rows += rows_loaded
-
-    print(f"\nTotal rows loaded: {total_rows}")
-    return total_rows
-
-
-if __name__ == "__main__":
-    load_all_csv_data()
\ No newline at end of file
+
+from pathlib import Path
+import os
+import sys
+from services.csv_ingest import (DEFAULT_CHUNK_SIZE, add_dataset_defaults, follow_csv_files,
+                                 parallel_load_csv_files, stream_csv_to_table, sync_csv_to_table)
+from services.database_manager import DatabaseManager
+
+# Same database file the model classes use
+current_dir = os.path.dirname(os.path.abspath(__file__))
+db_path = os.path.join(current_dir, "intelligence_platform.db")
+
+# Same column defaults init_database applies when it syncs the datasets CSV
+TRANSFORMS = {'datasets_metadata': add_dataset_defaults}
+
+
+def load_csv_to_table(csv_path, table_name, chunk_size=DEFAULT_CHUNK_SIZE, incremental=False,
+                      verify_prefix=False):
+    """Load CSV data into database table, streaming it in chunks
+
+    With incremental=True the table is synced instead: only rows that are new
+    or changed since the last run are upserted, and an unchanged file is skipped.
+    verify_prefix=True also checks the already-synced bytes for in-place edits.
+    """
+    csv_path = Path(csv_path)
+    if not csv_path.exists():
+        print(f" CSV file not found: {csv_path}")
+        return 0
+
+    db = DatabaseManager(db_path)
+
+    try:
+        with db.connection() as conn:
+            if incremental:
+                stats = sync_csv_to_table(conn, str(csv_path), table_name, chunk_size=chunk_size,
+                                          transform=TRANSFORMS.get(table_name), verify_prefix=verify_prefix)
+                print(f" Synced {stats}")
+                return stats.rows
+
+            # Check if table has data
+            count = conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
+
+            if count > 0:
+                print(f"  Skipping {table_name} - already has {count} rows")
+                return 0
+
+            stats = stream_csv_to_table(conn, str(csv_path), table_name, chunk_size=chunk_size,
+                                        transform=TRANSFORMS.get(table_name))
+        print(f" Loaded {stats}")
+        return stats.rows
+    except Exception as e:
+        print(f"Error loading {csv_path}: {e}")
+        return 0
+
+
+def load_all_csv_data(incremental=False, verify_prefix=False):
+    """Load all CSV files into database
+
+    A full load parses the files in parallel worker processes and writes
+    them through one connection; incremental syncs go file by file.
+    """
+    # Update paths to  OOP DATA folder
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    data_folder = os.path.join(current_dir, "OOP DATA")
+
+    csv_files = {
+        'cyber_incidents': os.path.join(data_folder, 'cyber_incidents.csv'),
+        'datasets_metadata': os.path.join(data_folder, 'datasets_metadata.csv'),
+        'it_tickets': os.path.join(data_folder, 'it_tickets.csv')
+    }
+
+    total_rows = 0
+    if incremental:
+        for table_name, csv_path in csv_files.items():
+            rows_loaded = load_csv_to_table(csv_path, table_name, incremental=True, verify_prefix=verify_prefix)
+            total_rows += rows_loaded
+    else:
+        total_rows = _load_empty_tables_parallel(csv_files)
+
+    print(f"\nTotal rows loaded: {total_rows}")
+    return total_rows
+
+
+def _load_empty_tables_parallel(csv_files):
+    """Load every CSV whose table is still empty in a single parallel pass."""
+    db = DatabaseManager(db_path)
+    try:
+        with db.connection() as conn:
+            to_load = {}
+            for table_name, csv_path in csv_files.items():
+                if not Path(csv_path).exists():
+                    print(f" CSV file not found: {csv_path}")
+                    continue
+                count = conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
+                if count > 0:
+                    print(f"  Skipping {table_name} - already has {count} rows")
+                    continue
+                to_load[table_name] = csv_path
+
+            results = parallel_load_csv_files(conn, to_load, transforms=TRANSFORMS)
+    except Exception as e:
+        print(f"Error loading CSV files: {e}")
+        return 0
+
+    for stats in results.values():
+        print(f" Loaded {stats}")
+    return sum(stats.rows for stats in results.values())
+
+
+def follow_csv_data(poll_interval=1.0, batch_size=500):
+    """Tail the incident and ticket CSVs, loading appended rows until Ctrl+C"""
+    data_folder = os.path.join(current_dir, "OOP DATA")
+    csv_files = {
+        'cyber_incidents': os.path.join(data_folder, 'cyber_incidents.csv'),
+        'it_tickets': os.path.join(data_folder, 'it_tickets.csv')
+    }
+
+    print(f"Following {', '.join(csv_files)} (polling every {poll_interval}s, Ctrl+C to stop)")
+    db = DatabaseManager(db_path)
+    with db.connection() as conn:
+        totals = follow_csv_files(conn, csv_files, poll_interval=poll_interval, batch_size=batch_size,
+                                  on_sync=lambda stats: print(f" Synced {stats}"))
+
+    print(f"\nTotal rows followed: {sum(totals.values())}")
+    return totals
+
+
+if __name__ == "__main__":
+    # python import_csv.py --sync    picks up new/changed rows without a full reload
+    # python import_csv.py --sync --verify  also re-hashes the synced part of each file for in-place edits
+    # python import_csv.py --follow  keeps loading rows appended to the CSVs
+    if "--follow" in sys.argv:
+        follow_csv_data()
+    else:
+        load_all_csv_data(incremental="--sync" in sys.argv, verify_prefix="--verify" in sys.argv)
\ No newline at end of file
@@ -1,154 +1,337 @@
-import pandas as pd
-import os
-from services.database_manager import DatabaseManager
-from typing import Optional
-
-# Get database path
-current_dir = os.path.dirname(os.path.abspath(__file__))
-db_path = os.path.join(os.path.dirname(current_dir), "intelligence_platform.db")
-
-
-class ITTicket:
-    """Represents an IT support ticket."""
-
-    # Database manager as a class variable
-    _db_manager = DatabaseManager(db_path)
-
-    def __init__(self, ticket_id: int, title: str, priority: str, status: str, assigned_to: str,
-                 description: str = None, created_at: str = None, resolution_time_hours: float = None):
-        self.__id = ticket_id
-        self.__title = title
-        self.__priority = priority
-        self.__status = status
-        self.__assigned_to = assigned_to
-        self.__description = description
-        self.__created_at = created_at
-        self.__resolution_time_hours = resolution_time_hours
-
-    def assign_to(self, staff: str) -> None:
-        self.__assigned_to = staff
-
-    def close_ticket(self) -> None:
-        self.__status = "Closed"
-
-    def get_status(self) -> str:
-        return self.__status
-
-    def get_id(self) -> int:
-        return self.__id
-
-    def get_title(self) -> str:
-        return self.__title
-
-    def get_priority(self) -> str:
-        return self.__priority
-
-    def get_assigned_to(self) -> str:
-        return self.__assigned_to
-
-    def get_description(self) -> Optional[str]:
-        return self.__description
-
-    def get_created_at(self) -> Optional[str]:
-        return self.__created_at
-
-    def get_resolution_time_hours(self) -> Optional[float]:
-        return self.__resolution_time_hours
-
-    def __str__(self) -> str:
-        return (
-            f"Ticket {self.__id}: {self.__title} "
-            f"[{self.__priority}] – {self.__status} (assigned to: {self.__assigned_to})"
-        )
-
-    # Database operations as class methods using DatabaseManager
-    @classmethod
-    def get_all_tickets(cls) -> pd.DataFrame:
-        """Get all IT tickets."""
-        return cls._db_manager.fetch_dataframe("SELECT * FROM it_tickets")
-
-    @classmethod
-    def get_tickets_by_status(cls, status: str) -> pd.DataFrame:
-        """Get tickets by status."""
-        return cls._db_manager.fetch_dataframe(
-            "SELECT * FROM it_tickets WHERE status = ?",
-            (status,)
-        )
-
-    @classmethod
-    def get_ticket_by_id(cls, ticket_id: int) -> Optional['ITTicket']:
-        """Get a single ticket by ID."""
-        ticket_data = cls._db_manager.fetch_one(
-            "SELECT * FROM it_tickets WHERE ticket_id = ?",
-            (ticket_id,)
-        )
-
-        if ticket_data:
-            #using columns: ticket_id, priority, description, status, assigned_to, created_at, resolution_time_hours
-            title = ticket_data[2] if len(ticket_data) > 2 else "No Title"
-            return cls(
-                ticket_id=ticket_data[0],
-                title=title,
-                priority=ticket_data[1],
-                status=ticket_data[3],
-                assigned_to=ticket_data[4],
-                description=ticket_data[2] if len(ticket_data) > 2 else None,
-                created_at=ticket_data[5] if len(ticket_data) > 5 else None,
-                resolution_time_hours=ticket_data[6] if len(ticket_data) > 6 else None
-            )
-        return None
-
-    @classmethod
-    def insert_ticket(cls, ticket_id: int, priority: str, description: str, status: str,
-                      assigned_to: str, created_at: str, resolution_time_hours: float) -> int:
-        """Insert new IT ticket."""
-        cursor = cls._db_manager.execute_query("""
-            INSERT INTO it_tickets
-            (ticket_id, priority, description, status, assigned_to, created_at, resolution_time_hours)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (ticket_id, priority, description, status, assigned_to, created_at, resolution_time_hours))
-        return ticket_id
-
-    @classmethod
-    def update_ticket_status(cls, ticket_id: int, new_status: str) -> int:
-        """Update ticket status."""
-        cursor = cls._db_manager.execute_query(
-            "UPDATE it_tickets SET status = ? WHERE ticket_id = ?",
-            (new_status, ticket_id)
-        )
-        return cursor.rowcount
-
-    @classmethod
-    def delete_ticket(cls, ticket_id: int) -> int:
-        """Delete a ticket."""
-        cursor = cls._db_manager.execute_query(
-            "DELETE FROM it_tickets WHERE ticket_id = ?",
-            (ticket_id,)
-        )
-        return cursor.rowcount
-
-    @classmethod
-    def get_ticket_summary(cls) -> tuple:
-        """Get basic ticket summary."""
-        result = cls._db_manager.fetch_one("""
-        SELECT 
-            COUNT(*) as total_tickets,
-            AVG(resolution_time_hours) as avg_resolution_time,
-            SUM(CASE WHEN status = 'Open' THEN 1 ELSE 0 END) as open_tickets
-        FROM it_tickets
-        """)
-        return result
-
-    @classmethod
-    def get_staff_performance(cls) -> pd.DataFrame:
-        """Simple staff performance analysis."""
-        return cls._db_manager.fetch_dataframe("""
-        SELECT 
-            assigned_to,
-            COUNT(*) as ticket_count,
-            AVG(resolution_time_hours) as avg_resolution_time
-        FROM it_tickets 
-        WHERE assigned_to IS NOT NULL
-        GROUP BY assigned_to
-        ORDER BY avg_resolution_time DESC
-        """)
\ No newline at end of file
+import pandas as pd
+import os
+from services.database_manager import DatabaseManager
+from services.write_queue import get_write_queue
+from typing import Iterable, List, Optional, Tuple
+
+# Get database path (INTELLIGENCE_DB_PATH overrides it, e.g. for tests)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+db_path = os.environ.get("INTELLIGENCE_DB_PATH", os.path.join(os.path.dirname(current_dir), "intelligence_platform.db"))
+
+
+class ITTicket:
+    """Represents an IT support ticket."""
+
+    # Database manager as a class variable
+    _db_manager = DatabaseManager(db_path)
+
+    # Epoch columns returned as datetime columns instead of the stored text
+    _epoch_columns = {"created_at_epoch": "created_at"}
+
+    # Columns query_tickets may sort by, mapped to the SQL that sorts them
+    _sort_columns = {
+        "ticket_id": "ticket_id",
+        "priority": "priority",
+        "status": "status",
+        "assigned_to": "assigned_to",
+        "created_at": "created_at_epoch",
+        "resolution_time_hours": "resolution_time_hours",
+    }
+
+    # Percentiles read from the resolution_time_sketch histograms
+    _percentiles = {"p50": 0.5, "p90": 0.9, "p99": 0.99}
+
+    def __init__(self, ticket_id: int, title: str, priority: str, status: str, assigned_to: str,
+                 description: str = None, created_at: str = None, resolution_time_hours: float = None):
+        self.__id = ticket_id
+        self.__title = title
+        self.__priority = priority
+        self.__status = status
+        self.__assigned_to = assigned_to
+        self.__description = description
+        self.__created_at = created_at
+        self.__resolution_time_hours = resolution_time_hours
+
+    def assign_to(self, staff: str) -> None:
+        self.__assigned_to = staff
+
+    def close_ticket(self) -> None:
+        self.__status = "Closed"
+
+    def get_status(self) -> str:
+        return self.__status
+
+    def get_id(self) -> int:
+        return self.__id
+
+    def get_title(self) -> str:
+        return self.__title
+
+    def get_priority(self) -> str:
+        return self.__priority
+
+    def get_assigned_to(self) -> str:
+        return self.__assigned_to
+
+    def get_description(self) -> Optional[str]:
+        return self.__description
+
+    def get_created_at(self) -> Optional[str]:
+        return self.__created_at
+
+    def get_resolution_time_hours(self) -> Optional[float]:
+        return self.__resolution_time_hours
+
+    def __str__(self) -> str:
+        return (
+            f"Ticket {self.__id}: {self.__title} "
+            f"[{self.__priority}] – {self.__status} (assigned to: {self.__assigned_to})"
+        )
+
+    # Database operations as class methods using DatabaseManager
+    @classmethod
+    def read_snapshot(cls):
+        """Context manager giving all reads inside it one consistent read-only view."""
+        return cls._db_manager.read_snapshot()
+
+    @classmethod
+    def get_all_tickets(cls) -> pd.DataFrame:
+        """Get all IT tickets."""
+        return cls._db_manager.fetch_dataframe("SELECT * FROM it_tickets", epoch_columns=cls._epoch_columns)
+
+    @classmethod
+    def get_tickets_by_status(cls, status: str) -> pd.DataFrame:
+        """Get tickets by status."""
+        return cls._db_manager.fetch_dataframe(
+            "SELECT * FROM it_tickets WHERE status = ?",
+            (status,),
+            epoch_columns=cls._epoch_columns
+        )
+
+    @classmethod
+    def get_tickets_created_between(cls, start, end) -> pd.DataFrame:
+        """Get tickets with start <= created_at < end, using the indexed epoch column."""
+        return cls._db_manager.fetch_dataframe(
+            "SELECT * FROM it_tickets WHERE created_at_epoch >= ? AND created_at_epoch < ? "
+            "ORDER BY created_at_epoch",
+            (int(pd.Timestamp(start).timestamp()), int(pd.Timestamp(end).timestamp())),
+            epoch_columns=cls._epoch_columns
+        )
+
+    @classmethod
+    def query_tickets(cls, statuses: Optional[List[str]] = None, priority: Optional[str] = None,
+                      assigned_to: Optional[str] = None, created_from=None, created_to=None,
+                      sort_by: str = "ticket_id", descending: bool = False,
+                      page: int = 1, page_size: int = 50) -> Tuple[pd.DataFrame, int]:
+        """Filter, sort and page tickets in SQL.
+
+        Returns (one page of tickets, total number of matching tickets). The
+        date range is start-inclusive and end-exclusive on created_at.
+        """
+        if sort_by not in cls._sort_columns:
+            raise ValueError(f"Cannot sort tickets by {sort_by!r}")
+
+        conditions = []
+        params = []
+        if statuses:
+            conditions.append(f"status IN ({', '.join('?' for _ in statuses)})")
+            params.extend(statuses)
+        if priority:
+            conditions.append("priority = ?")
+            params.append(priority)
+        if assigned_to:
+            conditions.append("assigned_to = ?")
+            params.append(assigned_to)
+        if created_from is not None:
+            conditions.append("created_at_epoch >= ?")
+            params.append(int(pd.Timestamp(created_from).timestamp()))
+        if created_to is not None:
+            conditions.append("created_at_epoch < ?")
+            params.append(int(pd.Timestamp(created_to).timestamp()))
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        direction = "DESC" if descending else "ASC"
+        order = f"{cls._sort_columns[sort_by]} {direction}"
+        if sort_by != "ticket_id":
+            order += f", ticket_id {direction}"  # Stable order across pages
+        page_size = max(1, page_size)
+        offset = (max(1, page) - 1) * page_size
+
+        # Same snapshot for both queries so the total matches the page
+        with cls.read_snapshot():
+            total = cls._db_manager.fetch_one(f"SELECT COUNT(*) FROM it_tickets {where}", params)[0]
+            page_df = cls._db_manager.fetch_dataframe(
+                f"SELECT * FROM it_tickets {where} ORDER BY {order} LIMIT ? OFFSET ?",
+                params + [page_size, offset],
+                epoch_columns=cls._epoch_columns
+            )
+        return page_df, total
+
+    @classmethod
+    def get_ticket_by_id(cls, ticket_id: int) -> Optional['ITTicket']:
+        """Get a single ticket by ID."""
+        ticket_data = cls._db_manager.fetch_one(
+            "SELECT * FROM it_tickets WHERE ticket_id = ?",
+            (ticket_id,)
+        )
+
+        if ticket_data:
+            #using columns: ticket_id, priority, description, status, assigned_to, created_at, resolution_time_hours
+            title = ticket_data[2] if len(ticket_data) > 2 else "No Title"
+            return cls(
+                ticket_id=ticket_data[0],
+                title=title,
+                priority=ticket_data[1],
+                status=ticket_data[3],
+                assigned_to=ticket_data[4],
+                description=ticket_data[2] if len(ticket_data) > 2 else None,
+                created_at=ticket_data[5] if len(ticket_data) > 5 else None,
+                resolution_time_hours=ticket_data[6] if len(ticket_data) > 6 else None
+            )
+        return None
+
+    @classmethod
+    def insert_ticket(cls, ticket_id: int, priority: str, description: str, status: str,
+                      assigned_to: str, created_at: str, resolution_time_hours: float) -> int:
+        """Insert new IT ticket."""
+        result = get_write_queue(cls._db_manager).execute("""
+            INSERT INTO it_tickets
+            (ticket_id, priority, description, status, assigned_to, created_at, resolution_time_hours)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (ticket_id, priority, description, status, assigned_to, created_at, resolution_time_hours))
+        return ticket_id
+
+    @classmethod
+    def insert_tickets(cls, tickets: Iterable[tuple]) -> int:
+        """Insert many IT tickets as one write through the write queue.
+
+        Each item is (ticket_id, priority, description, status, assigned_to,
+        created_at, resolution_time_hours).
+        """
+        result = get_write_queue(cls._db_manager).execute_many("""
+            INSERT INTO it_tickets
+            (ticket_id, priority, description, status, assigned_to, created_at, resolution_time_hours)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, tickets)
+        return result.rowcount
+
+    @classmethod
+    def update_ticket_status(cls, ticket_id: int, new_status: str) -> int:
+        """Update ticket status."""
+        result = get_write_queue(cls._db_manager).execute(
+            "UPDATE it_tickets SET status = ? WHERE ticket_id = ?",
+            (new_status, ticket_id)
+        )
+        return result.rowcount
+
+    @classmethod
+    def delete_ticket(cls, ticket_id: int) -> int:
+        """Delete a ticket."""
+        result = get_write_queue(cls._db_manager).execute(
+            "DELETE FROM it_tickets WHERE ticket_id = ?",
+            (ticket_id,)
+        )
+        return result.rowcount
+
+    @classmethod
+    def get_ticket_summary(cls) -> tuple:
+        """Get basic ticket summary (from the trigger-maintained ticket_counts table)."""
+        result = cls._db_manager.fetch_one("""
+        SELECT 
+            IFNULL(SUM(count), 0) as total_tickets,
+            SUM(resolution_sum) / NULLIF(SUM(resolution_count), 0) as avg_resolution_time,
+            IFNULL(SUM(CASE WHEN status = 'Open' THEN count END), 0) as open_tickets
+        FROM ticket_counts
+        """)
+        return result
+
+    @classmethod
+    def get_staff_performance(cls) -> pd.DataFrame:
+        """Staff performance from the trigger-maintained staff_ticket_stats table.
+
+        One row per assignee: ticket count, mean and sample variance of
+        resolution_time_hours, and resolved (Resolved/Closed) tickets.
+        """
+        return cls._db_manager.fetch_dataframe("""
+        SELECT
+            assigned_to,
+            SUM(count) as ticket_count,
+            SUM(resolution_sum) / NULLIF(SUM(resolution_count), 0) as avg_resolution_time,
+            CASE WHEN SUM(resolution_count) > 1 THEN
+                MAX(0, SUM(resolution_sumsq) - SUM(resolution_sum) * SUM(resolution_sum) / SUM(resolution_count))
+                / (SUM(resolution_count) - 1)
+            END as resolution_time_variance,
+            SUM(resolved_count) as resolved_tickets
+        FROM staff_ticket_stats
+        GROUP BY assigned_to
+        ORDER BY avg_resolution_time DESC
+        """)
+
+    @classmethod
+    def get_staff_performance_by_priority(cls) -> pd.DataFrame:
+        """Staff performance broken down by ticket priority (one row per assignee and priority)."""
+        return cls._db_manager.fetch_dataframe("""
+        SELECT
+            assigned_to,
+            priority,
+            count as ticket_count,
+            resolution_sum / NULLIF(resolution_count, 0) as avg_resolution_time,
+            CASE WHEN resolution_count > 1 THEN
+                MAX(0, resolution_sumsq - resolution_sum * resolution_sum / resolution_count)
+                / (resolution_count - 1)
+            END as resolution_time_variance,
+            resolved_count as resolved_tickets
+        FROM staff_ticket_stats
+        ORDER BY assigned_to, priority
+        """)
+
+    @classmethod
+    def get_resolution_percentiles(cls, by: Optional[str] = "priority", priorities: Optional[List[str]] = None,
+                                   assignees: Optional[List[str]] = None) -> pd.DataFrame:
+        """p50/p90/p99 resolution time of resolved tickets, per priority or per assignee.
+
+        Read from the trigger-maintained resolution_time_sketch log histograms,
+        so the cost depends on the number of histogram buckets, not tickets.
+        Histograms are merged by adding their bucket counts: filter by
+        priorities/assignees to merge any subset, or pass by=None for one row
+        covering everything. Values are bucket midpoints, within 2.5% of the
+        exact percentile.
+        """
+        if by not in ("priority", "assigned_to", None):
+            raise ValueError(f"Cannot group resolution percentiles by {by!r}")
+
+        conditions = []
+        params = []
+        if priorities:
+            conditions.append(f"priority IN ({', '.join('?' for _ in priorities)})")
+            params.extend(priorities)
+        if assignees:
+            conditions.append(f"assigned_to IN ({', '.join('?' for _ in assignees)})")
+            params.extend(assignees)
+        if by == "assigned_to":
+            conditions.append("assigned_to != ''")  # Unassigned tickets only count in the merged histograms
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        # First bucket whose running count reaches q * total holds the q-th percentile
+        picks = ",\n".join(
+            f"MIN(CASE WHEN running >= {q} * total THEN bucket END) as {name}"
+            for name, q in cls._percentiles.items()
+        )
+        values = ", ".join(f"{name}.value as {name}" for name in cls._percentiles)
+        joins = "\n".join(
+            f"JOIN resolution_time_buckets {name} ON {name}.bucket = picked.{name}"
+            for name in cls._percentiles
+        )
+        return cls._db_manager.fetch_dataframe(f"""
+        WITH hist AS (
+            SELECT {by or "'all'"} as key, bucket, SUM(count) as count
+            FROM resolution_time_sketch {where}
+            GROUP BY 1, 2
+        ),
+        ranked AS (
+            SELECT key, bucket,
+                SUM(count) OVER (PARTITION BY key ORDER BY bucket) as running,
+                SUM(count) OVER (PARTITION BY key) as total
+            FROM hist
+        ),
+        picked AS (
+            SELECT key, MAX(total) as total,
+            {picks}
+            FROM ranked
+            GROUP BY key
+        )
+        SELECT picked.key as {by or "scope"}, picked.total as resolved_tickets, {values}
+        FROM picked
+        {joins}
+        ORDER BY picked.key
+        """, params)
\ No newline at end of file
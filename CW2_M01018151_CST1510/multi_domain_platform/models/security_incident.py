@@ -1,140 +1,264 @@
-import pandas as pd
-import os
-from services.database_manager import DatabaseManager
-from typing import Optional
-
-# Get database path
-current_dir = os.path.dirname(os.path.abspath(__file__))
-db_path = os.path.join(os.path.dirname(current_dir), "intelligence_platform.db")
-
-
-class SecurityIncident:
-    """Represents a cybersecurity incident in the platform."""
-
-    # Database manager as a class variable
-    _db_manager = DatabaseManager(db_path)
-
-    def __init__(self, incident_id: int, incident_type: str, severity: str, status: str, description: str,
-                 timestamp: str = None):
-        self.__id = incident_id
-        self.__incident_type = incident_type
-        self.__severity = severity
-        self.__status = status
-        self.__description = description
-        self.__timestamp = timestamp
-
-    def get_id(self) -> int:
-        return self.__id
-
-    def get_incident_type(self) -> str:
-        return self.__incident_type
-
-    def get_severity(self) -> str:
-        return self.__severity
-
-    def get_status(self) -> str:
-        return self.__status
-
-    def get_description(self) -> str:
-        return self.__description
-
-    def get_timestamp(self) -> Optional[str]:
-        return self.__timestamp
-
-    def update_status(self, new_status: str) -> None:
-        self.__status = new_status
-
-    def get_severity_level(self) -> int:
-        """Return an integer severity level (simple example)."""
-        mapping = {
-            "low": 1,
-            "medium": 2,
-            "high": 3,
-            "critical": 4,
-        }
-        return mapping.get(self.__severity.lower(), 0)
-
-    def __str__(self) -> str:
-        return f"Incident {self.__id} [{self.__severity.upper()}] {self.__incident_type} - {self.__status}"
-
-    # Database operations as class methods using DatabaseManager
-    @classmethod
-    def insert_incident(cls, incident_id: int, timestamp: str, category: str, severity: str, status: str,
-                        description: str) -> int:
-        """Insert new incident."""
-        cursor = cls._db_manager.execute_query("""
-            INSERT INTO cyber_incidents
-            (incident_id, timestamp, category, severity, status, description)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (incident_id, timestamp, category, severity, status, description))
-        return incident_id
-
-    @classmethod
-    def get_all_incidents(cls) -> pd.DataFrame:
-        """Get all incidents as DataFrame."""
-        return cls._db_manager.fetch_dataframe(
-            "SELECT * FROM cyber_incidents ORDER BY incident_id DESC"
-        )
-
-    @classmethod
-    def get_incident_by_id(cls, incident_id: int) -> Optional['SecurityIncident']:
-        """Get a single incident by ID."""
-        incident_data = cls._db_manager.fetch_one(
-            "SELECT * FROM cyber_incidents WHERE incident_id = ?",
-            (incident_id,)
-        )
-
-        if incident_data:
-
-            # CSV columns: incident_id,timestamp,severity,category,status,description
-            # Database columns after import: incident_id,timestamp,category,severity,status,description
-            return cls(
-                incident_id=incident_data[0],        # incident_id
-                incident_type=incident_data[3],      # severity (from CSV category)
-                severity=incident_data[2],           # category (from CSV severity)
-                status=incident_data[4],             # status
-                description=incident_data[5],        # description
-                timestamp=incident_data[1]           # timestamp
-            )
-        return None
-
-    @classmethod
-    def update_incident_status(cls, incident_id: int, new_status: str) -> int:
-        """Update incident status."""
-        cursor = cls._db_manager.execute_query(
-            "UPDATE cyber_incidents SET status = ? WHERE incident_id = ?",
-            (new_status, incident_id)
-        )
-        return cursor.rowcount
-
-    @classmethod
-    def delete_incident(cls, incident_id: int) -> int:
-        """Delete an incident."""
-        cursor = cls._db_manager.execute_query(
-            "DELETE FROM cyber_incidents WHERE incident_id = ?",
-            (incident_id,)
-        )
-        return cursor.rowcount
-
-    @classmethod
-    def get_incidents_by_type_count(cls) -> pd.DataFrame:
-        """Count incidents by type."""
-        query = """
-        SELECT category, COUNT(*) as count
-        FROM cyber_incidents
-        GROUP BY category
-        ORDER BY count DESC
-        """
-        return cls._db_manager.fetch_dataframe(query)
-
-    @classmethod
-    def get_high_severity_by_status(cls) -> pd.DataFrame:
-        """Count high severity incidents by status."""
-        query = """
-        SELECT status, COUNT(*) as count
-        FROM cyber_incidents
-        WHERE severity = 'High'
-        GROUP BY status
-        ORDER BY count DESC
-        """
-        return cls._db_manager.fetch_dataframe(query)
\ No newline at end of file
+import base64
+import json
+import pandas as pd
+import os
+from services.database_manager import DatabaseManager
+from services.write_queue import get_write_queue
+from services.incident_cube import IncidentCube, get_incident_cube
+from services.incident_store import IncidentStore, get_incident_store
+from typing import Iterable, List, Optional, Tuple
+
+# Get database path (INTELLIGENCE_DB_PATH overrides it, e.g. for tests)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+db_path = os.environ.get("INTELLIGENCE_DB_PATH", os.path.join(os.path.dirname(current_dir), "intelligence_platform.db"))
+
+
+class SecurityIncident:
+    """Represents a cybersecurity incident in the platform."""
+
+    # Database manager as a class variable
+    _db_manager = DatabaseManager(db_path)
+
+    # Epoch columns returned as datetime columns instead of the stored text
+    _epoch_columns = {"timestamp_epoch": "timestamp"}
+
+    def __init__(self, incident_id: int, incident_type: str, severity: str, status: str, description: str,
+                 timestamp: str = None):
+        self.__id = incident_id
+        self.__incident_type = incident_type
+        self.__severity = severity
+        self.__status = status
+        self.__description = description
+        self.__timestamp = timestamp
+
+    def get_id(self) -> int:
+        return self.__id
+
+    def get_incident_type(self) -> str:
+        return self.__incident_type
+
+    def get_severity(self) -> str:
+        return self.__severity
+
+    def get_status(self) -> str:
+        return self.__status
+
+    def get_description(self) -> str:
+        return self.__description
+
+    def get_timestamp(self) -> Optional[str]:
+        return self.__timestamp
+
+    def update_status(self, new_status: str) -> None:
+        self.__status = new_status
+
+    def get_severity_level(self) -> int:
+        """Return an integer severity level (simple example)."""
+        mapping = {
+            "low": 1,
+            "medium": 2,
+            "high": 3,
+            "critical": 4,
+        }
+        return mapping.get(self.__severity.lower(), 0)
+
+    def __str__(self) -> str:
+        return f"Incident {self.__id} [{self.__severity.upper()}] {self.__incident_type} - {self.__status}"
+
+    # Database operations as class methods using DatabaseManager
+    @classmethod
+    def read_snapshot(cls):
+        """Context manager giving all reads inside it one consistent read-only view."""
+        return cls._db_manager.read_snapshot()
+
+    @classmethod
+    def get_store(cls) -> IncidentStore:
+        """Shared columnar incident store, refreshed with any rows written since the last call."""
+        store = get_incident_store(cls._db_manager)
+        store.refresh()
+        return store
+
+    @classmethod
+    def get_cube(cls) -> IncidentCube:
+        """Shared severity x category x status x week incident cube, reloaded if the data changed."""
+        cube = get_incident_cube(cls._db_manager)
+        cube.refresh()
+        return cube
+
+    @classmethod
+    def insert_incident(cls, incident_id: int, timestamp: str, category: str, severity: str, status: str,
+                        description: str) -> int:
+        """Insert new incident."""
+        result = get_write_queue(cls._db_manager).execute("""
+            INSERT INTO cyber_incidents
+            (incident_id, timestamp, category, severity, status, description)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, (incident_id, timestamp, category, severity, status, description))
+        return incident_id
+
+    @classmethod
+    def insert_incidents(cls, incidents: Iterable[tuple]) -> int:
+        """Insert many incidents as one write through the write queue.
+
+        Each item is (incident_id, timestamp, category, severity, status, description).
+        """
+        result = get_write_queue(cls._db_manager).execute_many("""
+            INSERT INTO cyber_incidents
+            (incident_id, timestamp, category, severity, status, description)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, incidents)
+        return result.rowcount
+
+    @classmethod
+    def get_all_incidents(cls) -> pd.DataFrame:
+        """Get all incidents as DataFrame."""
+        return cls._db_manager.fetch_dataframe(
+            "SELECT * FROM cyber_incidents ORDER BY incident_id DESC",
+            epoch_columns=cls._epoch_columns
+        )
+
+    @staticmethod
+    def encode_cursor(after_id: int) -> str:
+        """Opaque token for the page that follows incident `after_id`."""
+        return base64.urlsafe_b64encode(json.dumps({"after_id": int(after_id)}).encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> int:
+        """Incident id stored in a cursor token; ValueError if the token is not valid."""
+        try:
+            return int(json.loads(base64.urlsafe_b64decode(cursor.encode()))["after_id"])
+        except (ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"Invalid incident cursor: {cursor!r}") from e
+
+    @classmethod
+    def get_incidents_page(cls, after_id: Optional[int] = None, limit: int = 50,
+                           severities: Optional[List[str]] = None, status: Optional[str] = None,
+                           category: Optional[str] = None,
+                           cursor: Optional[str] = None) -> Tuple[pd.DataFrame, Optional[str]]:
+        """Get one page of incidents, newest first, using keyset pagination.
+
+        Pass the previous page's cursor (or the last incident_id seen as
+        `after_id`) to continue. Every filter combination has an index that
+        ends in incident_id, so each page is a backwards walk of that index
+        from the last id that stops after `limit` rows, and deep pages cost
+        the same as the first one. Several severities are read as one walk
+        per severity, merged by UNION ALL without a sort.
+        Returns (page, next cursor or None when there are no more rows).
+        """
+        if cursor is not None:
+            after_id = cls.decode_cursor(cursor)
+
+        conditions = []
+        params = []
+        if after_id is not None:
+            conditions.append("incident_id < ?")
+            params.append(after_id)
+        if status:
+            conditions.append("status = ?")
+            params.append(status)
+        if category:
+            conditions.append("category = ?")
+            params.append(category)
+
+        arms = []
+        arm_params = []
+        for severity in list(dict.fromkeys(severities or [])) or [None]:
+            arm_conditions = conditions if severity is None else ["severity = ?"] + conditions
+            where = f"WHERE {' AND '.join(arm_conditions)}" if arm_conditions else ""
+            arms.append(f"SELECT * FROM cyber_incidents {where}")
+            arm_params.extend(params if severity is None else [severity] + params)
+
+        # One extra row tells us whether another page exists
+        page_df = cls._db_manager.fetch_dataframe(
+            f"{' UNION ALL '.join(arms)} ORDER BY incident_id DESC LIMIT ?",
+            arm_params + [limit + 1],
+            epoch_columns=cls._epoch_columns
+        )
+        if len(page_df) <= limit:
+            return page_df, None
+        page_df = page_df.iloc[:limit]
+        return page_df, cls.encode_cursor(page_df['incident_id'].iloc[-1])
+
+    @classmethod
+    def get_incidents_between(cls, start, end) -> pd.DataFrame:
+        """Get incidents with start <= timestamp < end, using the indexed epoch column."""
+        return cls._db_manager.fetch_dataframe(
+            "SELECT * FROM cyber_incidents WHERE timestamp_epoch >= ? AND timestamp_epoch < ? "
+            "ORDER BY timestamp_epoch",
+            (int(pd.Timestamp(start).timestamp()), int(pd.Timestamp(end).timestamp())),
+            epoch_columns=cls._epoch_columns
+        )
+
+    @classmethod
+    def get_incident_by_id(cls, incident_id: int) -> Optional['SecurityIncident']:
+        """Get a single incident by ID."""
+        incident_data = cls._db_manager.fetch_one(
+            "SELECT * FROM cyber_incidents WHERE incident_id = ?",
+            (incident_id,)
+        )
+
+        if incident_data:
+
+            # CSV columns: incident_id,timestamp,severity,category,status,description
+            # Database columns after import: incident_id,timestamp,category,severity,status,description
+            return cls(
+                incident_id=incident_data[0],        # incident_id
+                incident_type=incident_data[3],      # severity (from CSV category)
+                severity=incident_data[2],           # category (from CSV severity)
+                status=incident_data[4],             # status
+                description=incident_data[5],        # description
+                timestamp=incident_data[1]           # timestamp
+            )
+        return None
+
+    @classmethod
+    def update_incident_status(cls, incident_id: int, new_status: str) -> int:
+        """Update incident status."""
+        result = get_write_queue(cls._db_manager).execute(
+            "UPDATE cyber_incidents SET status = ? WHERE incident_id = ?",
+            (new_status, incident_id)
+        )
+        return result.rowcount
+
+    @classmethod
+    def delete_incident(cls, incident_id: int) -> int:
+        """Delete an incident."""
+        result = get_write_queue(cls._db_manager).execute(
+            "DELETE FROM cyber_incidents WHERE incident_id = ?",
+            (incident_id,)
+        )
+        return result.rowcount
+
+    @classmethod
+    def get_incidents_by_type_count(cls) -> pd.DataFrame:
+        """Count incidents by type (from the trigger-maintained incident_counts table)."""
+        query = """
+        SELECT category, SUM(count) as count
+        FROM incident_counts
+        GROUP BY category
+        ORDER BY count DESC
+        """
+        return cls._db_manager.fetch_dataframe(query)
+
+    @classmethod
+    def get_high_severity_by_status(cls) -> pd.DataFrame:
+        """Count high severity incidents by status."""
+        query = """
+        SELECT status, SUM(count) as count
+        FROM incident_counts
+        WHERE severity = 'High'
+        GROUP BY status
+        ORDER BY count DESC
+        """
+        return cls._db_manager.fetch_dataframe(query)
+
+    @classmethod
+    def get_incident_summary(cls) -> tuple:
+        """Get (total, open, high severity) incident counts without scanning the incidents."""
+        return cls._db_manager.fetch_one("""
+        SELECT
+            IFNULL(SUM(count), 0) as total_incidents,
+            IFNULL(SUM(CASE WHEN status = 'Open' THEN count END), 0) as open_incidents,
+            IFNULL(SUM(CASE WHEN severity = 'High' THEN count END), 0) as high_severity
+        FROM incident_counts
+        """)
\ No newline at end of file
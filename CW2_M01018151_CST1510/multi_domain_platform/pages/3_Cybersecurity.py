@@ -1,130 +1,146 @@
-import streamlit as st
-import pandas as pd
-from models.security_incident import SecurityIncident
-
-# Page configuration
-st.set_page_config(
-    page_title="Cybersecurity Dashboard",
-    page_icon="🔒",
-    layout="wide"
-)
-
-# Check login state
-if "logged_in" not in st.session_state:
-    st.session_state.logged_in = False
-
-# Guard: if not logged in, send user back
-if not st.session_state.logged_in:
-    st.error("You must be logged in to access this dashboard.")
-
-    col1, col2 = st.columns(2)
-    with col1:
-        if st.button(" Go to Login Page"):
-            st.switch_page("OOP_home.py")  # Changed to OOP_home.py
-    with col2:
-        if st.button(" Register New Account"):
-            st.switch_page("OOP_home.py")  # Changed to OOP_home.py
-
-    st.stop()
-
-st.title("🔒 Cybersecurity Dashboard")
-
-# sidebar
-with st.sidebar:
-    st.header("Filters")
-    severity_filter = st.multiselect(
-        "Select Severity",
-        ["Low", "Medium", "High", "Critical"],
-        default=["High", "Critical"]
-    )
-    show_raw_data = st.checkbox("Show raw data")
-
-    st.divider()
-    st.header("Quick Actions")
-    if st.button("Refresh Data"):
-        st.rerun()
-    if st.button("Generate Report"):
-        st.info("Report generation coming soon!")
-
-# content
-st.header("Incident Overview")
-
-# Get data using OOP
-try:
-    # Get all incidents as DataFrame using SecurityIncident class method
-    incidents_df = SecurityIncident.get_all_incidents()
-
-    # Get type counts using SecurityIncident class method
-    type_counts_df = SecurityIncident.get_incidents_by_type_count()
-
-    # Create SecurityIncident objects from the data
-    incidents_list = []
-    for _, row in incidents_df.iterrows():
-        incident = SecurityIncident(
-            incident_id=row['incident_id'],
-            incident_type=row['category'],
-            severity=row['severity'],
-            status=row['status'],
-            description=row['description']
-        )
-        incidents_list.append(incident)
-
-except Exception as e:
-    st.error(f"Error loading data: {e}")
-    incidents_df = pd.DataFrame()
-    type_counts_df = pd.DataFrame()
-    incidents_list = []
-
-# Metrics
-col1, col2, col3, col4 = st.columns(4)
-col1.metric("Total Incidents", len(incidents_df))
-col2.metric("High Severity", len(incidents_df[incidents_df['severity'] == 'High']))
-col3.metric("Open Incidents", len(incidents_df[incidents_df['status'] == 'Open']))
-col4.metric("Categories", len(type_counts_df))
-
-st.divider()
-
-# charts
-st.header("Visualizations")
-
-# Use columns for layout
-col1, col2 = st.columns(2)
-
-with col1:
-    st.subheader("Incidents by Category")
-    # Bar chart from tutorial
-    if not type_counts_df.empty:
-        st.bar_chart(type_counts_df.set_index('category'))
-
-with col2:
-    st.subheader("Severity Distribution")
-    # Create data for pie chart
-    if not incidents_df.empty:
-        severity_data = incidents_df['severity'].value_counts()
-        st.bar_chart(severity_data)
-
-# showing row datafiles from the csv
-if show_raw_data:
-    st.header("Raw Incident Data")
-    st.dataframe(incidents_df)
-
-# widgets
-st.divider()
-st.header("Incident Analysis")
-
-# Selectbox
-selected_category = st.selectbox(
-    "Analyze Category",
-    incidents_df['category'].unique() if len(incidents_df) > 0 else []
-)
-
-if selected_category:
-    category_data = incidents_df[incidents_df['category'] == selected_category]
-    st.write(f"**{len(category_data)}** incidents in {selected_category}")
-
-    # Show line chart of incidents over time
-    if 'timestamp' in category_data.columns:
-        category_data['datetime'] = pd.to_datetime(category_data['timestamp'], format='mixed')
-        weekly_counts = category_data.set_index('datetime').resample("W").size().fillna(0)
-        st.subheader("Weekly Incident Trend")
+import streamlit as st
+import pandas as pd
+from models.security_incident import SecurityIncident
+
+# Page configuration
+st.set_page_config(
+    page_title="Cybersecurity Dashboard",
+    page_icon="🔒",
+    layout="wide"
+)
+
+# Check login state
+if "logged_in" not in st.session_state:
+    st.session_state.logged_in = False
+
+# Guard: if not logged in, send user back
+if not st.session_state.logged_in:
+    st.error("You must be logged in to access this dashboard.")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button(" Go to Login Page"):
+            st.switch_page("OOP_home.py")  # Changed to OOP_home.py
+    with col2:
+        if st.button(" Register New Account"):
+            st.switch_page("OOP_home.py")  # Changed to OOP_home.py
+
+    st.stop()
+
+st.title("🔒 Cybersecurity Dashboard")
+
+# sidebar
+with st.sidebar:
+    st.header("Filters")
+    severity_filter = st.multiselect(
+        "Select Severity",
+        ["Low", "Medium", "High", "Critical"],
+        default=["High", "Critical"]
+    )
+    show_raw_data = st.checkbox("Show raw data")
+
+    st.divider()
+    st.header("Quick Actions")
+    if st.button("Refresh Data"):
+        st.session_state.pop("raw_incidents", None)  # Raw data starts again from the newest page
+        st.rerun()
+    if st.button("Generate Report"):
+        st.info("Report generation coming soon!")
+
+# content
+st.header("Incident Overview")
+
+# Get data using OOP
+try:
+    # Columnar incident store: only rows written since the last rerun are read,
+    # and every count on the page is a vectorised NumPy count over it
+    incident_store = SecurityIncident.get_store()
+    total_incidents, open_incidents, high_severity = incident_store.summary()
+    type_counts_df = incident_store.counts_by("category").reset_index()
+    severity_counts = incident_store.counts_by("severity")
+    categories = list(type_counts_df["category"])
+
+    # The weekly trend comes from the severity x category x status x week cube
+    incident_cube = SecurityIncident.get_cube()
+
+except Exception as e:
+    st.error(f"Error loading data: {e}")
+    incident_store = incident_cube = None
+    type_counts_df = pd.DataFrame()
+    severity_counts = pd.Series(dtype="int64")
+    categories = []
+    total_incidents = open_incidents = high_severity = 0
+
+# Metrics
+col1, col2, col3, col4 = st.columns(4)
+col1.metric("Total Incidents", total_incidents)
+col2.metric("High Severity", high_severity)
+col3.metric("Open Incidents", open_incidents)
+col4.metric("Categories", len(type_counts_df))
+
+st.divider()
+
+# charts
+st.header("Visualizations")
+
+# Use columns for layout
+col1, col2 = st.columns(2)
+
+with col1:
+    st.subheader("Incidents by Category")
+    # Bar chart from tutorial
+    if not type_counts_df.empty:
+        st.bar_chart(type_counts_df.set_index('category'))
+
+with col2:
+    st.subheader("Severity Distribution")
+    # Create data for pie chart
+    if not severity_counts.empty:
+        st.bar_chart(severity_counts)
+
+# showing row datafiles from the csv
+if show_raw_data:
+    st.header("Raw Incident Data")
+    # All incidents, as before the sidebar filter existed; pages load on demand with the keyset cursor
+    if "raw_incidents" not in st.session_state:
+        first_page, next_cursor = SecurityIncident.get_incidents_page(limit=50)
+        st.session_state.raw_incidents = [first_page]
+        st.session_state.raw_incidents_cursor = next_cursor
+
+    if st.session_state.raw_incidents_cursor and st.button("Load more"):
+        more, next_cursor = SecurityIncident.get_incidents_page(
+            limit=50, cursor=st.session_state.raw_incidents_cursor
+        )
+        st.session_state.raw_incidents.append(more)
+        st.session_state.raw_incidents_cursor = next_cursor
+
+    st.dataframe(pd.concat(st.session_state.raw_incidents, ignore_index=True))
+
+# widgets
+st.divider()
+st.header("Incident Analysis")
+
+# Selectbox
+selected_category = st.selectbox(
+    "Analyze Category",
+    categories
+)
+
+if selected_category:
+    # Everything in this section is limited to the severities picked in the sidebar
+    severities = severity_filter or None
+    st.caption(f"Severity: {', '.join(severity_filter) if severity_filter else 'all'}. "
+               "The weekly trend leaves out incidents without a timestamp.")
+    category_total = incident_store.count(category=selected_category, severities=severities)
+    st.write(f"**{category_total}** incidents in {selected_category}")
+
+    status_counts = incident_store.counts_by("status", category=selected_category, severities=severities)
+    if not status_counts.empty:
+        st.subheader("Status Breakdown")
+        st.bar_chart(status_counts)
+
+    # Show line chart of incidents over time from the cube's week dimension
+    weekly_counts = incident_cube.drilldown("week", category=selected_category, severity=severities)
+    if not weekly_counts.empty:
+        st.subheader("Weekly Incident Trend")
         st.line_chart(weekly_counts)
\ No newline at end of file
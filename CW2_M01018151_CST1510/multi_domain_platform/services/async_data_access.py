@@ -0,0 +1,78 @@
+# services/async_data_access.py
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from services.database_manager import DatabaseManager
+
+
+class AsyncDataAccess:
+    """Runs blocking DatabaseManager reads concurrently on a bounded thread pool.
+
+    Each call returns a Future (or an awaitable through the async methods), so
+    a page can start all of its queries at once and wait only as long as the
+    slowest one. Every worker thread borrows its own pooled connection.
+    """
+
+    def __init__(self, db: Optional[DatabaseManager] = None, max_workers: int = 4):
+        self._db = db
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="db-read")
+
+    def submit(self, func: Callable, *args, **kwargs) -> Future:
+        """Run any blocking data-access callable in the background."""
+        return self._executor.submit(func, *args, **kwargs)
+
+    def fetch_dataframe(self, sql: str, params: Iterable[Any] = ()) -> Future:
+        """Run DatabaseManager.fetch_dataframe in the background."""
+        return self.submit(self._require_db().fetch_dataframe, sql, params)
+
+    def fetch_all(self, sql: str, params: Iterable[Any] = ()) -> Future:
+        """Run DatabaseManager.fetch_all in the background."""
+        return self.submit(self._require_db().fetch_all, sql, params)
+
+    def fetch_one(self, sql: str, params: Iterable[Any] = ()) -> Future:
+        """Run DatabaseManager.fetch_one in the background."""
+        return self.submit(self._require_db().fetch_one, sql, params)
+
+    def load_all(self, calls: Dict[str, Callable[[], Any]], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Run several callables concurrently and wait for all of them.
+
+        Returns a dict with the same keys as `calls`. If any call fails its
+        exception is raised here, after the others have been started.
+        """
+        futures = {name: self.submit(func) for name, func in calls.items()}
+        return {name: future.result(timeout=timeout) for name, future in futures.items()}
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """Await a blocking data-access callable from asyncio code."""
+        return await asyncio.wrap_future(self.submit(func, *args, **kwargs))
+
+    async def gather(self, calls: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+        """Await several callables concurrently; returns results by key."""
+        names = list(calls)
+        results = await asyncio.gather(*(self.run(calls[name]) for name in names))
+        return dict(zip(names, results))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads."""
+        self._executor.shutdown(wait=wait)
+
+    def _require_db(self) -> DatabaseManager:
+        if self._db is None:
+            raise ValueError("AsyncDataAccess was created without a DatabaseManager")
+        return self._db
+
+
+# One shared executor per process so Streamlit reruns don't start new threads
+_shared_access = None
+_shared_access_lock = threading.Lock()
+
+
+def get_data_access() -> AsyncDataAccess:
+    """Return the process-wide AsyncDataAccess used by the pages."""
+    global _shared_access
+    with _shared_access_lock:
+        if _shared_access is None:
+            _shared_access = AsyncDataAccess()
+        return _shared_access
@@ -0,0 +1,543 @@
+# services/csv_ingest.py
+import calendar
+import csv
+import hashlib
+import io
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+# Rows handed to executemany at a time, and chunks committed together
+DEFAULT_CHUNK_SIZE = 10_000
+DEFAULT_CHUNKS_PER_TRANSACTION = 10
+
+# Primary key used to upsert each domain table
+PRIMARY_KEYS = {
+    "cyber_incidents": "incident_id",
+    "it_tickets": "ticket_id",
+    "datasets_metadata": "dataset_id",
+}
+
+# Text timestamp column and the INTEGER epoch column filled from it at ingest
+EPOCH_COLUMNS = {
+    "cyber_incidents": ("timestamp", "timestamp_epoch"),
+    "it_tickets": ("created_at", "created_at_epoch"),
+    "datasets_metadata": ("upload_date", "upload_date_epoch"),
+}
+
+# Non-ISO layouts accepted by parse_timestamp
+TIMESTAMP_FORMATS = ("%d/%m/%Y %H:%M:%S", "%d/%m/%Y %H:%M", "%d/%m/%Y", "%m/%d/%Y %H:%M", "%m/%d/%Y")
+
+# Size of the byte ranges parsed by each worker process in a parallel load
+DEFAULT_RANGE_BYTES = 4 * 1024 * 1024
+
+# Below this many bytes in total a parallel load parses in this process;
+# starting worker processes would take longer than the parsing itself
+DEFAULT_IN_PROCESS_BYTES = 8 * 1024 * 1024
+
+# Block size for hashing the already-synced part of a CSV file; a checkpoint
+# stores one sha1 per block (20 bytes per MB synced)
+HASH_BLOCK_BYTES = 1024 * 1024
+
+RecordTransform = Callable[[Dict[str, Optional[str]]], Dict]
+
+
+class IngestStats(NamedTuple):
+    """Summary of one CSV load."""
+    table: str
+    rows: int
+    seconds: float
+    skipped: int = 0  # Malformed records left out
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+    def __str__(self) -> str:
+        text = f"{self.rows} rows into {self.table} in {self.seconds:.2f}s ({self.rows_per_sec:,.0f} rows/sec)"
+        return f"{text}, {self.skipped} malformed skipped" if self.skipped else text
+
+
+class CsvChunk(NamedTuple):
+    """A block of parsed rows plus the byte offset reading can resume from."""
+    columns: List[str]
+    rows: List[tuple]
+    end_offset: int  # Just past the last newline-terminated record in the chunk
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[int]:
+    """Parse a timestamp string to Unix epoch seconds, or None if it can't be parsed.
+
+    Times without a timezone are taken as UTC, which is what SQLite's
+    strftime('%s', ...) does, so both give the same value.
+    """
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.strip())
+    except ValueError:
+        for fmt in TIMESTAMP_FORMATS:
+            try:
+                parsed = datetime.strptime(value.strip(), fmt)
+                break
+            except ValueError:
+                continue
+        else:
+            return None
+    if parsed.tzinfo is not None:
+        return int(parsed.timestamp())
+    return calendar.timegm(parsed.timetuple())
+
+
+def add_epoch_column(table_name: str, record: Dict) -> Dict:
+    """Fill in the table's epoch column from its text timestamp, if it has one."""
+    if table_name in EPOCH_COLUMNS:
+        text_column, epoch_column = EPOCH_COLUMNS[table_name]
+        if text_column in record:
+            record[epoch_column] = parse_timestamp(record[text_column])
+    return record
+
+
+def add_dataset_defaults(record: Dict) -> Dict:
+    """Fill the datasets_metadata columns that the CSV does not have."""
+    record['size_bytes'] = int(record['rows']) * int(record['columns']) * 100
+    record['source'] = 'CSV Import'
+    return record
+
+
+def read_csv_header(csv_path: str) -> Tuple[List[str], int]:
+    """Return the header fields and the byte offset of the first data line."""
+    with open(csv_path, "rb") as f:
+        line = f.readline()
+    header = next(csv.reader([line.decode("utf-8-sig")]), [])
+    return header, len(line)
+
+
+def iter_csv_records(csv_path: str, start_offset: int = 0) -> Iterator[Tuple[List[str], int, bool]]:
+    """Yield (values, end_offset, complete) for each data record in the file.
+
+    Reading starts at `start_offset` (or just after the header). end_offset
+    is the byte position right after the record; `complete` is False for a
+    final line that has no newline yet, e.g. one still being written.
+    """
+    _, header_end = read_csv_header(csv_path)
+    position = {"offset": max(start_offset, header_end), "complete": True}
+
+    def lines():
+        with open(csv_path, "rb") as f:
+            f.seek(position["offset"])
+            for raw in f:
+                position["offset"] += len(raw)
+                position["complete"] = raw.endswith(b"\n")
+                yield raw.decode("utf-8")
+
+    # csv.reader pulls lines lazily, so the position is the end of the record just read
+    for values in csv.reader(lines()):
+        if values:
+            yield values, position["offset"], position["complete"]
+
+
+def read_csv_chunks(csv_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                    transform: Optional[RecordTransform] = None,
+                    start_offset: int = 0, table_name: Optional[str] = None,
+                    skip_incomplete: bool = False) -> Iterator[CsvChunk]:
+    """Yield CsvChunk blocks from a CSV file without loading it all.
+
+    Empty fields become NULL. `transform` may rename, drop or add fields;
+    it receives and returns one record as a dict. If `table_name` is given
+    the table's epoch timestamp column is filled in as well. With
+    `skip_incomplete` a last line with no newline (still being written) is
+    left for the next read.
+    """
+    header, header_end = read_csv_header(csv_path)
+    if not header:
+        return
+
+    columns = None
+    chunk: List[tuple] = []
+    resume_offset = max(start_offset, header_end)
+    for values, end_offset, complete in iter_csv_records(csv_path, start_offset):
+        if skip_incomplete and not complete:
+            break
+        record = {name: (value if value != "" else None) for name, value in zip(header, values)}
+        if transform is not None:
+            record = transform(record)
+        if table_name is not None:
+            record = add_epoch_column(table_name, record)
+        if columns is None:
+            columns = list(record)
+        chunk.append(tuple(record.get(name) for name in columns))
+        if complete:
+            resume_offset = end_offset
+        if len(chunk) >= chunk_size:
+            yield CsvChunk(columns, chunk, resume_offset)
+            chunk = []
+    if chunk:
+        yield CsvChunk(columns, chunk, resume_offset)
+
+
+def insert_sql(table_name: str, columns: List[str]) -> str:
+    """Parameterised INSERT for the given columns."""
+    column_list = ", ".join(f'"{name}"' for name in columns)
+    placeholders = ", ".join("?" for _ in columns)
+    return f'INSERT INTO "{table_name}" ({column_list}) VALUES ({placeholders})'
+
+
+def upsert_sql(table_name: str, columns: List[str], primary_key: str) -> str:
+    """INSERT ... ON CONFLICT DO UPDATE that only rewrites rows whose values changed."""
+    updates = [name for name in columns if name != primary_key]
+    if not updates:
+        return f'{insert_sql(table_name, columns)} ON CONFLICT("{primary_key}") DO NOTHING'
+    set_clause = ", ".join(f'"{name}" = excluded."{name}"' for name in updates)
+    changed = " OR ".join(f'"{table_name}"."{name}" IS NOT excluded."{name}"' for name in updates)
+    return (f'{insert_sql(table_name, columns)} ON CONFLICT("{primary_key}") '
+            f'DO UPDATE SET {set_clause} WHERE {changed}')
+
+
+def stream_csv_to_table(conn: sqlite3.Connection, csv_path: str, table_name: str,
+                        chunk_size: int = DEFAULT_CHUNK_SIZE,
+                        chunks_per_transaction: int = DEFAULT_CHUNKS_PER_TRANSACTION,
+                        transform: Optional[RecordTransform] = None) -> IngestStats:
+    """Load a CSV file into a table in chunks with constant memory use.
+
+    Each chunk is written with executemany and every `chunks_per_transaction`
+    chunks are committed together. The connection must not already be inside
+    a transaction that the caller wants to keep open.
+    """
+    start = time.perf_counter()
+    total_rows = 0
+    pending_chunks = 0
+    try:
+        for chunk in read_csv_chunks(csv_path, chunk_size, transform, table_name=table_name):
+            conn.executemany(insert_sql(table_name, chunk.columns), chunk.rows)
+            total_rows += len(chunk.rows)
+            pending_chunks += 1
+            if pending_chunks >= chunks_per_transaction:
+                conn.commit()
+                pending_chunks = 0
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return IngestStats(table_name, total_rows, time.perf_counter() - start)
+
+
+class Checkpoint(NamedTuple):
+    """How far a CSV file has been synced into a table."""
+    file_size: int
+    mtime_ns: int
+    byte_offset: int
+    inode: Optional[int]
+    block_hashes: Optional[bytes]  # sha1 of each HASH_BLOCK_BYTES block of [0, byte_offset)
+
+
+class _PrefixHasher:
+    """sha1 digests of a file prefix, one per HASH_BLOCK_BYTES block.
+
+    The last block may be partial; it is kept as a running hasher, so
+    extending the prefix reads only the new bytes.
+    """
+
+    def __init__(self, f):
+        self._f = f
+        self.end = 0
+        self._digests = bytearray()
+        self._tail = hashlib.sha1()
+
+    @classmethod
+    def resume(cls, f, block_hashes: bytes, end: int, verify_prefix: bool) -> Optional["_PrefixHasher"]:
+        """A hasher positioned at `end` if the file still matches `block_hashes`, else None.
+
+        Only the block holding the last synced byte is re-read, unless
+        `verify_prefix` asks for every block before `end` to be checked.
+        """
+        if len(block_hashes) != -(-end // HASH_BLOCK_BYTES) * hashlib.sha1().digest_size:
+            return None
+        hasher = cls(f)
+        if not verify_prefix and end:
+            kept_blocks = (end - 1) // HASH_BLOCK_BYTES
+            hasher._digests[:] = block_hashes[:kept_blocks * hasher._tail.digest_size]
+            hasher.end = kept_blocks * HASH_BLOCK_BYTES
+        hasher.extend(end)
+        return hasher if hasher.end == end and hasher.digests() == block_hashes else None
+
+    def extend(self, end: int) -> None:
+        """Hash bytes [self.end, end) of the file."""
+        self._f.seek(self.end)
+        while self.end < end:
+            block_end = min((self.end // HASH_BLOCK_BYTES + 1) * HASH_BLOCK_BYTES, end)
+            data = self._f.read(block_end - self.end)
+            if not data:
+                break
+            self._tail.update(data)
+            self.end += len(data)
+            if self.end % HASH_BLOCK_BYTES == 0:
+                self._digests += self._tail.digest()
+                self._tail = hashlib.sha1()
+
+    def digests(self) -> bytes:
+        partial = self._tail.digest() if self.end % HASH_BLOCK_BYTES else b""
+        return bytes(self._digests) + partial
+
+
+def load_checkpoint(conn: sqlite3.Connection, csv_path: str, table_name: str) -> Optional[Checkpoint]:
+    """Saved sync position for a file/table pair, or None if never synced."""
+    row = conn.execute(
+        "SELECT file_size, mtime_ns, byte_offset, inode, block_hashes FROM ingest_checkpoints "
+        "WHERE file_path = ? AND table_name = ?",
+        (os.path.abspath(csv_path), table_name)
+    ).fetchone()
+    return Checkpoint(*row) if row else None
+
+
+def save_checkpoint(conn: sqlite3.Connection, csv_path: str, table_name: str,
+                    checkpoint: Checkpoint, rows_synced: int) -> None:
+    """Store the sync position (the caller commits)."""
+    conn.execute("""
+        INSERT INTO ingest_checkpoints
+        (file_path, table_name, file_size, mtime_ns, byte_offset, inode, block_hashes, rows_synced, synced_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT(file_path, table_name) DO UPDATE SET
+            file_size = excluded.file_size,
+            mtime_ns = excluded.mtime_ns,
+            byte_offset = excluded.byte_offset,
+            inode = excluded.inode,
+            block_hashes = excluded.block_hashes,
+            rows_synced = ingest_checkpoints.rows_synced + excluded.rows_synced,
+            synced_at = excluded.synced_at
+    """, (os.path.abspath(csv_path), table_name, *checkpoint, rows_synced))
+
+
+def sync_csv_to_table(conn: sqlite3.Connection, csv_path: str, table_name: str,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE,
+                      transform: Optional[RecordTransform] = None,
+                      skip_incomplete: bool = False,
+                      verify_prefix: bool = False) -> IngestStats:
+    """Incrementally upsert a CSV file into a table using a stored checkpoint.
+
+    - File unchanged since the last sync (same size and mtime): nothing is read.
+    - File only appended to: parsing resumes at the saved byte offset.
+    - Anything else: the whole file is re-read, but only new or changed rows
+      are written (INSERT ... ON CONFLICT DO UPDATE on the primary key).
+
+    "Only appended to" means the same inode, no shrinking below the saved
+    offset, and the block holding the last synced byte still matching its
+    hash, so a sync reads at most one HASH_BLOCK_BYTES block plus the new
+    bytes. `verify_prefix` checks every block before the offset instead,
+    which catches in-place edits anywhere at the cost of reading the prefix.
+
+    `rows` in the returned stats is the number of rows inserted or updated.
+    `skip_incomplete` leaves a partly written last line for the next sync.
+    """
+    start = time.perf_counter()
+    stat = os.stat(csv_path)
+    checkpoint = load_checkpoint(conn, csv_path, table_name)
+
+    if checkpoint and (checkpoint.file_size, checkpoint.mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+        return IngestStats(table_name, 0, time.perf_counter() - start)
+
+    primary_key = PRIMARY_KEYS[table_name]
+    rows_written = 0
+    with open(csv_path, "rb") as f:
+        hasher = None
+        if (checkpoint and checkpoint.block_hashes is not None and checkpoint.inode == stat.st_ino
+                and checkpoint.byte_offset <= stat.st_size):
+            hasher = _PrefixHasher.resume(f, checkpoint.block_hashes, checkpoint.byte_offset, verify_prefix)
+        hasher = hasher or _PrefixHasher(f)
+        resume_from = hasher.end
+
+        try:
+            for chunk in read_csv_chunks(csv_path, chunk_size, transform, start_offset=resume_from,
+                                         table_name=table_name, skip_incomplete=skip_incomplete):
+                # rowcount only counts rows the upsert touched, not trigger side effects
+                cursor = conn.executemany(upsert_sql(table_name, chunk.columns, primary_key), chunk.rows)
+                rows_written += cursor.rowcount
+                hasher.extend(chunk.end_offset)
+                # Size -1 marks a partial sync, so an interrupted run resumes instead of skipping
+                save_checkpoint(conn, csv_path, table_name,
+                                Checkpoint(-1, -1, hasher.end, stat.st_ino, hasher.digests()), len(chunk.rows))
+                conn.commit()
+
+            save_checkpoint(conn, csv_path, table_name,
+                            Checkpoint(stat.st_size, stat.st_mtime_ns, hasher.end, stat.st_ino, hasher.digests()), 0)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    return IngestStats(table_name, rows_written, time.perf_counter() - start)
+
+
+def follow_csv_files(conn: sqlite3.Connection, sources: Dict[str, str],
+                     transforms: Optional[Dict[str, RecordTransform]] = None,
+                     poll_interval: float = 1.0, batch_size: int = 500,
+                     stop_event: Optional[threading.Event] = None,
+                     on_sync: Optional[Callable[[IngestStats], None]] = None) -> Dict[str, int]:
+    """Keep tables in step with CSV files that other programs append to.
+
+    `sources` maps table name to CSV path. Every `poll_interval` seconds each
+    file is checked with sync_csv_to_table: an unchanged file costs one
+    stat() call, appended lines are parsed from the saved byte offset and
+    committed in micro-batches of `batch_size`, and a line still being
+    written waits for its newline. If a file changed while nothing was
+    following it, the first poll verifies its whole synced prefix; later
+    polls only re-hash the last synced block, so a poll reads the new bytes
+    rather than the file. Runs until `stop_event` is set (or
+    KeyboardInterrupt) and returns the rows written per table.
+    """
+    transforms = transforms or {}
+    stop_event = stop_event or threading.Event()
+    totals = {table_name: 0 for table_name in sources}
+    verified = set()
+    try:
+        while not stop_event.is_set():
+            for table_name, csv_path in sources.items():
+                if not os.path.exists(csv_path):
+                    continue
+                stats = sync_csv_to_table(conn, csv_path, table_name, chunk_size=batch_size,
+                                          transform=transforms.get(table_name), skip_incomplete=True,
+                                          verify_prefix=table_name not in verified)
+                verified.add(table_name)
+                if stats.rows:
+                    totals[table_name] += stats.rows
+                    if on_sync is not None:
+                        on_sync(stats)
+            stop_event.wait(poll_interval)
+    except KeyboardInterrupt:
+        pass
+    return totals
+
+
+class ParsedRange(NamedTuple):
+    """Rows parsed from one byte range of a CSV file by a worker process."""
+    table: str
+    columns: List[str]
+    rows: List[tuple]
+    malformed: int
+
+
+def csv_byte_ranges(csv_path: str, range_bytes: int = DEFAULT_RANGE_BYTES) -> List[Tuple[int, int]]:
+    """Split the data part of a CSV file into (start, end) ranges on line boundaries.
+
+    Splitting is done on newlines, so records must not contain embedded
+    newlines; a record cut in two shows up as malformed rather than as bad data.
+    """
+    _, header_end = read_csv_header(csv_path)
+    size = os.path.getsize(csv_path)
+    ranges = []
+    start = header_end
+    with open(csv_path, "rb") as f:
+        while start < size:
+            f.seek(min(start + range_bytes, size))
+            f.readline()  # Move on to the start of the next line
+            end = f.tell()
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def parse_csv_range(table_name: str, csv_path: str, start: int, end: int, header: List[str],
+                    transform: Optional[RecordTransform] = None, add_epochs: bool = True) -> ParsedRange:
+    """Parse and validate one byte range of a CSV file (runs in a worker process).
+
+    Records whose field count does not match the header are counted as
+    malformed and left out, and (unless add_epochs is False) timestamps are
+    parsed into the table's epoch column here so the writer never has to.
+    `transform` must be a module-level function so it can be sent to the worker.
+    """
+    with open(csv_path, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode("utf-8")
+
+    columns = None
+    rows = []
+    malformed = 0
+    # Read like a file opened with newline="", so only real line breaks end a record
+    for values in csv.reader(io.StringIO(text, newline="")):
+        if not values:
+            continue
+        if len(values) != len(header):
+            malformed += 1
+            continue
+        record = {name: (value if value != "" else None) for name, value in zip(header, values)}
+        if transform is not None:
+            record = transform(record)
+        if add_epochs:
+            record = add_epoch_column(table_name, record)
+        if columns is None:
+            columns = list(record)
+        rows.append(tuple(record.get(name) for name in columns))
+    return ParsedRange(table_name, columns or [], rows, malformed)
+
+
+def parallel_load_csv_files(conn: sqlite3.Connection, sources: Dict[str, str],
+                            transforms: Optional[Dict[str, RecordTransform]] = None,
+                            max_workers: Optional[int] = None,
+                            range_bytes: int = DEFAULT_RANGE_BYTES,
+                            in_process_bytes: int = DEFAULT_IN_PROCESS_BYTES,
+                            add_epochs: bool = True) -> Dict[str, IngestStats]:
+    """Load several CSV files at once: parse in a process pool, write on one connection.
+
+    `sources` maps table name to CSV path. Every file is cut into byte
+    ranges that worker processes parse and validate in parallel; the parsed
+    batches come back to this process and are inserted through `conn` one
+    at a time, so SQLite still only ever sees a single writer. Total time
+    tracks the largest file rather than the sum of all of them.
+
+    When the files add up to less than `in_process_bytes` they are parsed
+    here instead. Pass add_epochs=False for tables without epoch columns.
+    """
+    transforms = transforms or {}
+    tasks = []
+    total_bytes = 0
+    for table_name, csv_path in sources.items():
+        header, _ = read_csv_header(csv_path)
+        if header:
+            total_bytes += os.path.getsize(csv_path)
+            for start, end in csv_byte_ranges(csv_path, range_bytes):
+                tasks.append((table_name, csv_path, start, end, header, transforms.get(table_name), add_epochs))
+
+    began = time.perf_counter()
+    totals = {table_name: [0, 0, 0.0] for table_name in sources}  # rows, malformed, seconds
+
+    def write(parsed: ParsedRange) -> None:
+        if parsed.rows:
+            conn.executemany(insert_sql(parsed.table, parsed.columns), parsed.rows)
+            conn.commit()
+        total = totals[parsed.table]
+        total[0] += len(parsed.rows)
+        total[1] += parsed.malformed
+        total[2] = time.perf_counter() - began
+
+    workers = max_workers or os.cpu_count() or 1
+    try:
+        if len(tasks) <= 1 or workers == 1 or total_bytes < in_process_bytes:
+            # Not worth starting processes for
+            for task in tasks:
+                write(parse_csv_range(*task))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                remaining = iter(tasks)
+                pending = set()
+                while True:
+                    # Keep a couple of ranges per worker in flight so parsed rows don't pile up
+                    while len(pending) < workers * 2:
+                        task = next(remaining, None)
+                        if task is None:
+                            break
+                        pending.add(pool.submit(parse_csv_range, *task))
+                    if not pending:
+                        break
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        write(future.result())
+    except Exception:
+        conn.rollback()
+        raise
+
+    return {table_name: IngestStats(table_name, rows, seconds, malformed)
+            for table_name, (rows, malformed, seconds) in totals.items()}
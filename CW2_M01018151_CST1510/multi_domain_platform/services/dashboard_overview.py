@@ -0,0 +1,70 @@
+# services/dashboard_overview.py
+import os
+from typing import NamedTuple, Optional
+
+import pandas as pd
+
+from services.database_manager import DatabaseManager
+
+# Same database file the model classes use
+DEFAULT_DB_PATH = os.environ.get(
+    "INTELLIGENCE_DB_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "intelligence_platform.db")
+)
+
+RECENT_LIMIT = 5
+
+
+class Overview(NamedTuple):
+    """Everything the dashboard's System Overview and Recent Activity sections show."""
+    total_incidents: int
+    open_incidents: int
+    total_datasets: int
+    total_rows: int
+    total_tickets: int
+    open_tickets: int
+    recent_incidents: pd.DataFrame
+    recent_datasets: pd.DataFrame
+    recent_tickets: pd.DataFrame
+
+
+# All six metrics in one statement, read from the trigger-maintained summary tables
+OVERVIEW_METRICS_SQL = """
+SELECT
+    (SELECT IFNULL(SUM(count), 0) FROM incident_counts),
+    (SELECT IFNULL(SUM(count), 0) FROM incident_counts WHERE status = 'Open'),
+    (SELECT IFNULL(SUM(count), 0) FROM dataset_totals),
+    (SELECT IFNULL(SUM(rows_sum), 0) FROM dataset_totals),
+    (SELECT IFNULL(SUM(count), 0) FROM ticket_counts),
+    (SELECT IFNULL(SUM(count), 0) FROM ticket_counts WHERE status = 'Open')
+"""
+
+# Newest rows first; each is a backwards walk of the primary key that stops after LIMIT rows
+RECENT_INCIDENTS_SQL = """
+SELECT incident_id, timestamp, severity, category, status
+FROM cyber_incidents ORDER BY incident_id DESC LIMIT ?
+"""
+RECENT_DATASETS_SQL = """
+SELECT dataset_id, name, rows, upload_date
+FROM datasets_metadata ORDER BY dataset_id DESC LIMIT ?
+"""
+RECENT_TICKETS_SQL = """
+SELECT ticket_id, priority, status, assigned_to, created_at
+FROM it_tickets ORDER BY ticket_id DESC LIMIT ?
+"""
+
+
+def overview(db: Optional[DatabaseManager] = None, limit: int = RECENT_LIMIT) -> Overview:
+    """Load the dashboard overview in one visit to one read-only connection.
+
+    The metrics come from the summary tables and the recent-activity lists
+    are LIMIT queries on the primary keys, so the cost does not grow with
+    the size of the domain tables. All four queries share one snapshot.
+    """
+    db = db or DatabaseManager(DEFAULT_DB_PATH)
+    with db.read_snapshot():
+        metrics = db.fetch_one(OVERVIEW_METRICS_SQL)
+        recent_incidents = db.fetch_dataframe(RECENT_INCIDENTS_SQL, (limit,))
+        recent_datasets = db.fetch_dataframe(RECENT_DATASETS_SQL, (limit,))
+        recent_tickets = db.fetch_dataframe(RECENT_TICKETS_SQL, (limit,))
+    return Overview(*metrics, recent_incidents, recent_datasets, recent_tickets)
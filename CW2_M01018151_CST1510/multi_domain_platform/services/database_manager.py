@@ -1,144 +1,663 @@
-
-import sqlite3
-import os
-from typing import Any, Iterable, Optional, List, Tuple
-
-
-class DatabaseManager:
-    """Handles SQLite database connections and queries."""
-
-    def __init__(self, db_path: str):
-        self._db_path = db_path
-        self._connection = None  # Single connection instance
-        self._initialize_database()  # Create tables on initialization
-
-    def _initialize_database(self):
-        """Create necessary tables if they don't exist."""
-        # Use a fresh connection for initialization to avoid any issues
-        with sqlite3.connect(self._db_path) as conn:
-            cursor = conn.cursor()
-
-            # First check if users table exists
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='users'")
-            table_exists = cursor.fetchone() is not None
-
-            if not table_exists:
-                print(f"⚠ Creating database tables for the first time...")
-                print(f"   Database location: {os.path.abspath(self._db_path)}")
-
-                # Create users table
-                cursor.execute('''
-                    CREATE TABLE users (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        username TEXT UNIQUE NOT NULL,
-                        password_hash TEXT NOT NULL,
-                        role TEXT NOT NULL,
-                        email TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                ''')
-                print("   ✓ Created 'users' table")
-
-                # Create other tables as needed for your application
-                cursor.execute('''
-                    CREATE TABLE sessions (
-                        session_id TEXT PRIMARY KEY,
-                        username TEXT NOT NULL,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        expires_at TIMESTAMP,
-                        FOREIGN KEY (username) REFERENCES users(username)
-                    )
-                ''')
-                print("   ✓ Created 'sessions' table")
-
-                # Add more tables based on your needs
-                cursor.execute('''
-                    CREATE TABLE articles (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        title TEXT NOT NULL,
-                        content TEXT NOT NULL,
-                        category TEXT,
-                        author TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (author) REFERENCES users(username)
-                    )
-                ''')
-                print("   ✓ Created 'articles' table")
-
-                conn.commit()
-                print(f"Database initialization complete!")
-            else:
-                print(f"Database tables already exist in: {self._db_path}")
-
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get or create a database connection."""
-        if self._connection is None:
-            self._connection = sqlite3.connect(self._db_path, check_same_thread=False)
-            # Enable foreign keys
-            self._connection.execute("PRAGMA foreign_keys = ON")
-        return self._connection
-
-    def connect(self) -> None:
-        """Ensure connection exists (called automatically)."""
-        self._get_connection()
-
-    def close(self) -> None:
-        """Close the database connection."""
-        if self._connection is not None:
-            self._connection.close()
-            self._connection = None
-
-    def execute_query(self, sql: str, params: Iterable[Any] = ()) -> sqlite3.Cursor:
-        """Execute a write query (INSERT, UPDATE, DELETE)."""
-        conn = self._get_connection()
-        cur = conn.cursor()
-        cur.execute(sql, tuple(params))
-        conn.commit()
-        return cur
-
-    def fetch_one(self, sql: str, params: Iterable[Any] = ()) -> Optional[Tuple]:
-        """Fetch a single row from the database."""
-        conn = self._get_connection()
-        cur = conn.cursor()
-        cur.execute(sql, tuple(params))
-        return cur.fetchone()
-
-    def fetch_all(self, sql: str, params: Iterable[Any] = ()) -> List[Tuple]:
-        """Fetch all rows from the database."""
-        conn = self._get_connection()
-        cur = conn.cursor()
-        cur.execute(sql, tuple(params))
-        return cur.fetchall()
-
-    def fetch_dataframe(self, sql: str, params: Iterable[Any] = ()):
-        """Fetch data as pandas DataFrame."""
-        import pandas as pd
-        conn = self._get_connection()
-        return pd.read_sql_query(sql, conn, params=tuple(params))
-
-    # HELPER METHODS
-
-    def table_exists(self, table_name: str) -> bool:
-        """Check if a table exists in the database."""
-        sql = "SELECT name FROM sqlite_master WHERE type='table' AND name=?"
-        result = self.fetch_one(sql, (table_name,))
-        return result is not None
-
-    def get_tables(self) -> List[str]:
-        """Get list of all tables in the database."""
-        sql = "SELECT name FROM sqlite_master WHERE type='table'"
-        results = self.fetch_all(sql)
-        return [row[0] for row in results]
-
-    def add_default_user(self, username: str, password_hash: str, role: str = "user", email: str = None) -> bool:
-        """Add a default user to the database (for initialization)."""
-        try:
-            self.execute_query(
-                "INSERT OR IGNORE INTO users (username, password_hash, role, email) VALUES (?, ?, ?, ?)",
-                (username, password_hash, role, email)
-            )
-            print(f"✓ Added default user: {username}")
-            return True
-        except Exception as e:
-            print(f"✗ Failed to add user {username}: {e}")
+
+import sqlite3
+import os
+import queue
+import re
+import sys
+import threading
+from collections import OrderedDict
+from contextlib import closing, contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, List, Tuple
+from urllib.request import pathname2url
+
+from services.migrations import MigrationRunner
+
+
+class _ConnectionPool:
+    """Bounded checkout/checkin pool of SQLite connections."""
+
+    def __init__(self, factory: Callable[[], sqlite3.Connection], size: int, timeout: float):
+        self._factory = factory
+        self._size = size
+        self._timeout = timeout
+        self._idle = queue.LifoQueue(maxsize=size)
+        self._lock = threading.Lock()
+        self._created = 0
+
+    @staticmethod
+    def _is_healthy(conn: sqlite3.Connection) -> bool:
+        """Check that a pooled connection can still run a query."""
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        """Close a connection and free its slot in the pool."""
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+        with self._lock:
+            self._created -= 1
+
+    def checkout(self) -> sqlite3.Connection:
+        """Take a healthy connection from the pool, opening one if there is room."""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    can_create = self._created < self._size
+                    if can_create:
+                        self._created += 1
+                if can_create:
+                    try:
+                        return self._factory()
+                    except Exception:
+                        with self._lock:
+                            self._created -= 1
+                        raise
+                try:
+                    conn = self._idle.get(timeout=self._timeout)
+                except queue.Empty:
+                    raise sqlite3.OperationalError(
+                        f"Connection pool exhausted ({self._size} connections in use)"
+                    )
+
+            if self._is_healthy(conn):
+                return conn
+            self._discard(conn)  # Broken connection, try again with a new one
+
+    def checkin(self, conn: sqlite3.Connection) -> None:
+        """Return a connection to the pool."""
+        if conn.in_transaction:
+            # Never hand out a connection with someone else's half-done transaction
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                self._discard(conn)
+                return
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            self._discard(conn)
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
+
+
+# Returned by _ResultCache.get() when there is no usable entry (None is a valid fetch_one result)
+_MISS = object()
+
+_WORD = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+def _words(sql: str) -> set:
+    """Lower-cased identifiers in a statement, used to find the tables it mentions."""
+    return {word.lower() for word in _WORD.findall(sql)}
+
+
+class _ResultCache:
+    """LRU cache of read results, each tagged with the table versions it was read at."""
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (versions, result, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, versions):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != versions:
+                self.misses += 1
+                return _MISS
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, versions, result, size: int) -> None:
+        if size > self._max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+            self._entries[key] = (versions, result, size)
+            self._bytes += size
+            while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._bytes, "hits": self.hits, "misses": self.misses}
+
+
+def _rows_size(rows) -> int:
+    """Rough size of fetch_one/fetch_all results (containers only, not the values)."""
+    if rows is None:
+        return 0
+    if isinstance(rows, tuple):
+        return sys.getsizeof(rows)
+    return sys.getsizeof(rows) + sum(map(sys.getsizeof, rows))
+
+
+def _dataframe_size(df) -> int:
+    """Estimated DataFrame size, scaled up from the deep memory usage of its first rows."""
+    sample = df.head(1000)
+    if len(sample) == 0:
+        return int(df.memory_usage(index=True).sum())
+    return int(sample.memory_usage(index=True, deep=True).sum() * len(df) / len(sample))
+
+
+class DatabaseManager:
+    """Handles SQLite database connections and queries.
+
+    Connections come from a small pool instead of one shared connection, so
+    each Streamlit session thread gets its own connection for the duration
+    of a query. Pooled connections run in WAL mode with a busy timeout so
+    readers and a writer can work at the same time. fetch_* calls use a
+    separate pool of read-only connections, and read_snapshot() pins one of
+    them so several reads see the same committed state.
+
+    fetch_* results are kept in an LRU cache keyed by SQL and parameters.
+    Each entry records the table_versions counters (bumped by triggers on
+    every write) of the tables the query reads, and is only served while
+    they are unchanged; the counters are re-read only when PRAGMA
+    data_version shows another connection or process has committed. Hits
+    return copies, so callers may modify what they get back.
+
+    There is one manager per database file per process: constructing
+    DatabaseManager(path) again returns the existing instance, so the schema
+    bootstrap and the pool are shared by every model class and every
+    Streamlit rerun. Pool settings passed to later constructions are ignored.
+    """
+
+    # Registry of managers keyed by absolute database path
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    # Per-thread state shared by every manager on the same file, so that model
+    # classes with their own manager still join an outer transaction
+    _thread_states = {}
+    _thread_states_lock = threading.Lock()
+
+    @classmethod
+    def _thread_state_for(cls, db_path: str) -> threading.local:
+        key = os.path.abspath(db_path)
+        with cls._thread_states_lock:
+            if key not in cls._thread_states:
+                cls._thread_states[key] = threading.local()
+            return cls._thread_states[key]
+
+    def __new__(cls, db_path: str, *args, **kwargs):
+        key = os.path.abspath(db_path)
+        with cls._instances_lock:
+            instance = cls._instances.get(key)
+            if instance is None:
+                instance = super().__new__(cls)
+                instance._initialized = False
+                instance._init_lock = threading.Lock()
+                cls._instances[key] = instance
+            return instance
+
+    @classmethod
+    def clear_registry(cls) -> None:
+        """Close and forget every registered manager (mainly for scripts and benchmarks)."""
+        with cls._instances_lock:
+            instances = list(cls._instances.values())
+            cls._instances.clear()
+        for instance in instances:
+            instance.close()
+
+    def __init__(self, db_path: str, pool_size: int = 5, busy_timeout_ms: int = 5000,
+                 pool_timeout: float = 30.0, cache_entries: int = 256, cache_bytes: int = 128 * 1024 * 1024):
+        with self._init_lock:
+            if self._initialized:
+                return  # Already set up by an earlier construction for this file
+            self._setup(db_path, pool_size, busy_timeout_ms, pool_timeout, cache_entries, cache_bytes)
+            self._initialized = True
+
+    def _setup(self, db_path: str, pool_size: int, busy_timeout_ms: int, pool_timeout: float,
+               cache_entries: int, cache_bytes: int) -> None:
+        self._db_path = db_path
+        self._pool_size = max(1, pool_size)
+        self._busy_timeout_ms = busy_timeout_ms
+        self._pool_timeout = pool_timeout
+        self._pool = _ConnectionPool(self._create_connection, self._pool_size, pool_timeout)
+        self._read_pool = _ConnectionPool(self._create_read_connection, self._pool_size, pool_timeout)
+        self._local = self._thread_state_for(db_path)  # Connection held by the current thread
+
+        # Result cache and the table versions it is validated against
+        self._cache = _ResultCache(cache_entries, cache_bytes)
+        self._version_lock = threading.Lock()
+        self._version_conn = None  # Read-only connection that only watches for commits
+        self._data_version = None
+        self._schema_cookie = None
+        self._table_versions = {}
+        self._table_sources = {}  # table -> tables whose triggers write it
+        self._tables = set()
+        self._dependencies_by_sql = {}
+        self._initialize_database()  # Create tables on initialization
+
+    def _initialize_database(self):
+        """Create necessary tables if they don't exist."""
+        # Use a fresh connection for initialization to avoid any issues
+        with closing(sqlite3.connect(self._db_path)) as conn, conn:
+            # WAL is stored in the file, so switch once here before any reader holds it open
+            conn.execute("PRAGMA journal_mode = WAL")
+            cursor = conn.cursor()
+
+            # First check if users table exists
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='users'")
+            table_exists = cursor.fetchone() is not None
+
+            if not table_exists:
+                print(f"⚠ Creating database tables for the first time...")
+                print(f"   Database location: {os.path.abspath(self._db_path)}")
+
+                # Create users table
+                cursor.execute('''
+                    CREATE TABLE users (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        username TEXT UNIQUE NOT NULL,
+                        password_hash TEXT NOT NULL,
+                        role TEXT NOT NULL,
+                        email TEXT,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                ''')
+                print("   ✓ Created 'users' table")
+
+                # Create other tables as needed for your application
+                cursor.execute('''
+                    CREATE TABLE sessions (
+                        session_id TEXT PRIMARY KEY,
+                        username TEXT NOT NULL,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        expires_at TIMESTAMP,
+                        FOREIGN KEY (username) REFERENCES users(username)
+                    )
+                ''')
+                print("   ✓ Created 'sessions' table")
+
+                # Add more tables based on your needs
+                cursor.execute('''
+                    CREATE TABLE articles (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        title TEXT NOT NULL,
+                        content TEXT NOT NULL,
+                        category TEXT,
+                        author TEXT,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        FOREIGN KEY (author) REFERENCES users(username)
+                    )
+                ''')
+                print("   ✓ Created 'articles' table")
+
+                conn.commit()
+                print(f"Database initialization complete!")
+            else:
+                print(f"Database tables already exist in: {self._db_path}")
+
+            # Domain tables and indexes are managed by versioned migrations
+            MigrationRunner(conn).apply()
+
+    def _create_connection(self) -> sqlite3.Connection:
+        """Open a new connection with the pool pragmas applied."""
+        conn = sqlite3.connect(
+            self._db_path,
+            timeout=self._busy_timeout_ms / 1000,
+            check_same_thread=False  # Connections move between threads via the pool
+        )
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute(f"PRAGMA busy_timeout = {int(self._busy_timeout_ms)}")
+        # Enable foreign keys
+        conn.execute("PRAGMA foreign_keys = ON")
+        return conn
+
+    def _create_read_connection(self) -> sqlite3.Connection:
+        """Open a read-only connection (mode=ro URI plus query_only)."""
+        uri = f"file:{pathname2url(os.path.abspath(self._db_path))}?mode=ro"
+        conn = sqlite3.connect(
+            uri,
+            uri=True,
+            timeout=self._busy_timeout_ms / 1000,
+            check_same_thread=False
+        )
+        conn.execute(f"PRAGMA busy_timeout = {int(self._busy_timeout_ms)}")
+        conn.execute("PRAGMA query_only = ON")
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a pooled connection for the current thread.
+
+        Nested calls on the same thread reuse the connection that is already
+        checked out instead of taking a second one from the pool.
+        """
+        conn = getattr(self._local, "connection", None)
+        if conn is not None:
+            yield conn
+            return
+
+        conn = self._pool.checkout()
+        self._local.connection = conn
+        try:
+            yield conn
+        finally:
+            self._local.connection = None
+            self._pool.checkin(conn)
+
+    @contextmanager
+    def read_connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection for reads.
+
+        Inside read_snapshot() this is the snapshot connection, and inside
+        transaction()/connection() it is the thread's own connection (so the
+        transaction sees its own writes). Otherwise a read-only pooled
+        connection is used, which never holds up writers.
+        """
+        conn = getattr(self._local, "snapshot", None) or getattr(self._local, "connection", None)
+        if conn is not None:
+            yield conn
+            return
+
+        conn = self._read_pool.checkout()
+        try:
+            yield conn
+        finally:
+            self._read_pool.checkin(conn)
+
+    @contextmanager
+    def read_snapshot(self) -> Iterator[sqlite3.Connection]:
+        """Consistent read-only view of the database for several queries.
+
+        Every fetch_* call made on this thread inside the block reads from the
+        same WAL snapshot, so metrics computed in one page render agree with
+        each other even while new rows are being written.
+        """
+        existing = getattr(self._local, "snapshot", None)
+        if existing is not None:
+            yield existing
+            return
+
+        conn = self._read_pool.checkout()
+        self._local.snapshot = conn
+        try:
+            conn.execute("BEGIN")
+            conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()  # Start the read transaction now
+            yield conn
+        finally:
+            self._local.snapshot = None
+            self._read_pool.checkin(conn)  # Ends the read transaction
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Open a standalone connection that the caller is responsible for closing."""
+        return self._create_connection()
+
+    def connect(self) -> None:
+        """Open one pooled connection up front (otherwise done on first query)."""
+        with self.connection():
+            pass
+
+    def close(self) -> None:
+        """Close all idle pooled connections."""
+        self._pool.close()
+        self._read_pool.close()
+        with self._version_lock:
+            if self._version_conn is not None:
+                self._version_conn.close()
+                self._version_conn = None
+                self._data_version = None
+        self._cache.clear()
+
+    # Result cache
+
+    @staticmethod
+    def _read_table_versions(conn: sqlite3.Connection) -> Dict[str, int]:
+        try:
+            return dict(conn.execute("SELECT table_name, version FROM table_versions"))
+        except sqlite3.OperationalError:
+            return {}  # Database from before the table_versions migration: nothing is cached
+
+    def _load_schema(self, conn: sqlite3.Connection) -> None:
+        """Find which tables are written by triggers on which other tables."""
+        self._tables = {name.lower() for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        self._table_sources = {}
+        for source, trigger_sql in conn.execute("SELECT tbl_name, sql FROM sqlite_master WHERE type = 'trigger'"):
+            for target in (_words(trigger_sql) & self._tables) - {source.lower(), "table_versions"}:
+                self._table_sources.setdefault(target, set()).add(source.lower())
+        self._dependencies_by_sql = {}
+
+    def _current_versions(self) -> Dict[str, int]:
+        """Committed table versions, re-read only when PRAGMA data_version moves."""
+        with self._version_lock:
+            if self._version_conn is None:
+                self._version_conn = self._create_read_connection()
+            data_version = self._version_conn.execute("PRAGMA data_version").fetchone()[0]
+            if data_version != self._data_version:
+                schema_cookie = self._version_conn.execute("PRAGMA schema_version").fetchone()[0]
+                if schema_cookie != self._schema_cookie:
+                    self._load_schema(self._version_conn)
+                    self._cache.clear()
+                    self._schema_cookie = schema_cookie
+                self._table_versions = self._read_table_versions(self._version_conn)
+                self._data_version = data_version
+            return self._table_versions
+
+    def _dependencies(self, sql: str) -> Optional[Tuple[str, ...]]:
+        """Versioned tables a query depends on, or None if it cannot be cached.
+
+        Tables written only by triggers (the summary tables) depend on the
+        tables those triggers fire on. A query touching any other table that
+        has no version counter is never cached.
+        """
+        if sql in self._dependencies_by_sql:
+            return self._dependencies_by_sql[sql]
+        dependencies = set()
+        pending = list(_words(sql) & self._tables)
+        seen = set()
+        while pending and dependencies is not None:
+            table = pending.pop()
+            if table in seen:
+                continue
+            seen.add(table)
+            if table in self._table_versions:
+                dependencies.add(table)
+            elif table in self._table_sources:
+                pending.extend(self._table_sources[table])
+            else:
+                dependencies = None
+        result = tuple(sorted(dependencies)) if dependencies else None
+        self._dependencies_by_sql[sql] = result
+        return result
+
+    def _cache_versions(self, sql: str) -> Optional[Tuple]:
+        """Versions to tag/validate a cached result with, or None to bypass the cache."""
+        if getattr(self._local, "connection", None) is not None:
+            return None  # The thread's own connection may see uncommitted writes
+        table_versions = self._current_versions()
+        dependencies = self._dependencies(sql)
+        if dependencies is None:
+            return None
+        snapshot = getattr(self._local, "snapshot", None)
+        if snapshot is not None:
+            table_versions = self._read_table_versions(snapshot)  # Versions as of the snapshot
+        versions = tuple(table_versions.get(table) for table in dependencies)
+        return None if None in versions else versions
+
+    def _cached(self, kind: str, sql: str, params: Tuple, load: Callable[[], Any], size_of: Callable[[Any], int],
+                copy: Callable[[Any], Any], extra: Tuple = ()) -> Any:
+        """Serve a read from the cache, or run `load` and remember its result."""
+        key = (kind, sql, params, extra)
+        try:
+            hash(key)
+        except TypeError:
+            return load()
+        versions = self._cache_versions(sql)
+        if versions is None:
+            return load()
+        result = self._cache.get(key, versions)
+        if result is _MISS:
+            result = load()
+            self._cache.put(key, versions, result, size_of(result))
+        return copy(result)
+
+    def clear_cache(self) -> None:
+        """Drop every cached result."""
+        self._cache.clear()
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Number of cached results, their estimated size in bytes, and hit/miss counts."""
+        return self._cache.stats()
+
+    def in_transaction(self) -> bool:
+        """True while the current thread is inside transaction()."""
+        return getattr(self._local, "transaction_depth", 0) > 0
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Group several writes into a single commit.
+
+        Every execute_query/execute_many call made on this thread inside the
+        block (including the model class methods) runs on the same connection
+        and is committed once at the end, or rolled back if an error escapes.
+        Nested transaction() blocks join the outer one.
+        """
+        with self.connection() as conn:
+            depth = getattr(self._local, "transaction_depth", 0)
+            self._local.transaction_depth = depth + 1
+            try:
+                if depth > 0:
+                    yield conn
+                    return
+
+                conn.execute("BEGIN IMMEDIATE")  # Take the write lock up front
+                try:
+                    yield conn
+                except BaseException:
+                    conn.rollback()
+                    raise
+                conn.commit()
+            finally:
+                self._local.transaction_depth = depth
+
+    def _run_write(self, run) -> sqlite3.Cursor:
+        """Run a write and commit it, unless an outer transaction will."""
+        with self.connection() as conn:
+            cur = conn.cursor()
+            if self.in_transaction():
+                run(cur)
+                return cur
+            try:
+                run(cur)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            return cur
+
+    def execute_query(self, sql: str, params: Iterable[Any] = ()) -> sqlite3.Cursor:
+        """Execute a write query (INSERT, UPDATE, DELETE)."""
+        return self._run_write(lambda cur: cur.execute(sql, tuple(params)))
+
+    def execute_many(self, sql: str, seq_of_params: Iterable[Iterable[Any]]) -> sqlite3.Cursor:
+        """Execute the same write for many parameter sets with a single commit."""
+        return self._run_write(lambda cur: cur.executemany(sql, (tuple(p) for p in seq_of_params)))
+
+    def fetch_one(self, sql: str, params: Iterable[Any] = (), cache: bool = True) -> Optional[Tuple]:
+        """Fetch a single row from the database (cached unless cache=False)."""
+        params = tuple(params)
+
+        def load():
+            with self.read_connection() as conn:
+                cur = conn.cursor()
+                cur.execute(sql, params)
+                return cur.fetchone()
+
+        if not cache:
+            return load()
+        return self._cached("one", sql, params, load, _rows_size, lambda row: row)
+
+    def fetch_all(self, sql: str, params: Iterable[Any] = (), cache: bool = True) -> List[Tuple]:
+        """Fetch all rows from the database (cached unless cache=False)."""
+        params = tuple(params)
+
+        def load():
+            with self.read_connection() as conn:
+                cur = conn.cursor()
+                cur.execute(sql, params)
+                return cur.fetchall()
+
+        if not cache:
+            return load()
+        return self._cached("all", sql, params, load, _rows_size, list)
+
+    def fetch_dataframe(self, sql: str, params: Iterable[Any] = (), epoch_columns: Dict[str, str] = None,
+                        cache: bool = True):
+        """Fetch data as pandas DataFrame (cached unless cache=False).
+
+        `epoch_columns` maps INTEGER epoch columns in the result to the
+        datetime column each one replaces, e.g. {"timestamp_epoch": "timestamp"}.
+        A cached result is returned as a copy, never the shared frame.
+        """
+        import pandas as pd
+        params = tuple(params)
+
+        def load():
+            with self.read_connection() as conn:
+                df = pd.read_sql_query(sql, conn, params=params)
+            for epoch_column, column in (epoch_columns or {}).items():
+                if epoch_column in df.columns:
+                    df[column] = pd.to_datetime(df.pop(epoch_column), unit="s")
+            return df
+
+        if not cache:
+            return load()
+        extra = tuple(sorted((epoch_columns or {}).items()))
+        return self._cached("dataframe", sql, params, load, _dataframe_size, lambda df: df.copy(), extra)
+
+    # HELPER METHODS
+
+    def table_exists(self, table_name: str) -> bool:
+        """Check if a table exists in the database."""
+        sql = "SELECT name FROM sqlite_master WHERE type='table' AND name=?"
+        result = self.fetch_one(sql, (table_name,))
+        return result is not None
+
+    def get_tables(self) -> List[str]:
+        """Get list of all tables in the database."""
+        sql = "SELECT name FROM sqlite_master WHERE type='table'"
+        results = self.fetch_all(sql)
+        return [row[0] for row in results]
+
+    def add_default_user(self, username: str, password_hash: str, role: str = "user", email: str = None) -> bool:
+        """Add a default user to the database (for initialization)."""
+        try:
+            self.execute_query(
+                "INSERT OR IGNORE INTO users (username, password_hash, role, email) VALUES (?, ?, ?, ?)",
+                (username, password_hash, role, email)
+            )
+            print(f"✓ Added default user: {username}")
+            return True
+        except Exception as e:
+            print(f"✗ Failed to add user {username}: {e}")
             return False
\ No newline at end of file
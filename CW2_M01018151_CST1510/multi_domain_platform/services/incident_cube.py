@@ -0,0 +1,173 @@
+# services/incident_cube.py
+import os
+import threading
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from services.database_manager import DatabaseManager
+
+# Cube axes, in the order of the cells array
+DIMENSIONS = ("severity", "category", "status", "week")
+
+
+class CubeView:
+    """Dense counts over some labels of each dimension, with slice/rollup/drilldown.
+
+    cells has one axis per DIMENSIONS entry; week labels are the contiguous
+    week-ending Sundays between the first and last incident, so trends come
+    out zero-filled.
+    """
+
+    def __init__(self, cells: np.ndarray, labels: Dict[str, pd.Index]):
+        self.cells = cells
+        self.labels = labels
+        self._positions = {}  # dimension -> {label: position}, built on first slice
+        self._indexes = {}  # dimensions -> MultiIndex for multi-dimension rollups
+
+    def _position_map(self, dimension: str) -> Dict:
+        if dimension not in self._positions:
+            self._positions[dimension] = {label: i for i, label in enumerate(self.labels[dimension])}
+        return self._positions[dimension]
+
+    @staticmethod
+    def _axis(dimension: str) -> int:
+        if dimension not in DIMENSIONS:
+            raise ValueError(f"Unknown cube dimension {dimension!r}")
+        return DIMENSIONS.index(dimension)
+
+    def slice(self, **selection) -> "CubeView":
+        """Keep only the given value (or list of values) of each named dimension."""
+        cells = self.cells
+        labels = dict(self.labels)
+        for dimension, wanted in selection.items():
+            if wanted is None:
+                continue
+            axis = self._axis(dimension)
+            if not isinstance(wanted, (list, tuple, set, pd.Index)):
+                wanted = [wanted]
+            if dimension == "week":
+                wanted = [pd.Timestamp(week) for week in wanted]
+            position_map = self._position_map(dimension)
+            positions = sorted({position_map[value] for value in wanted if value in position_map})
+            cells = np.take(cells, positions, axis=axis)
+            labels[dimension] = labels[dimension][positions]
+        return CubeView(cells, labels)
+
+    def _sum_to(self, dimensions: Tuple[str, ...]) -> np.ndarray:
+        axes = [self._axis(dimension) for dimension in dimensions]
+        summed = self.cells.sum(axis=tuple(i for i in range(len(DIMENSIONS)) if i not in axes))
+        # Summing keeps the remaining axes in cube order; reorder them as requested
+        return np.transpose(summed, np.argsort(np.argsort(axes)))
+
+    def rollup(self, *dimensions: str) -> pd.Series:
+        """Sum away every dimension not named; the result is indexed by the named ones."""
+        if not dimensions:
+            return pd.Series([self.total()], index=["all"], name="count")
+        summed = self._sum_to(dimensions)
+        if len(dimensions) == 1:
+            index = self.labels[dimensions[0]]
+        else:
+            if dimensions not in self._indexes:
+                self._indexes[dimensions] = pd.MultiIndex.from_product(
+                    [self.labels[d] for d in dimensions], names=list(dimensions)
+                )
+            index = self._indexes[dimensions]
+        return pd.Series(summed.ravel(), index=index, name="count")
+
+    def drilldown(self, dimension: str, **selection) -> pd.Series:
+        """Counts per value of one dimension within a slice.
+
+        Values are ordered largest first with empty ones dropped, except
+        weeks: those stay in date order from the first to the last week with
+        incidents, zero-filled in between like resample("W").size().
+        """
+        view = self.slice(**selection)
+        counts = view._sum_to((dimension,))
+        labels = view.labels[dimension]
+        if dimension == "week":
+            nonzero = np.flatnonzero(counts)
+            span = slice(nonzero[0], nonzero[-1] + 1) if len(nonzero) else slice(0, 0)
+            counts, labels = counts[span], labels[span]
+        else:
+            order = np.argsort(-counts, kind="stable")
+            order = order[counts[order] > 0]
+            counts, labels = counts[order], labels[order]
+        return pd.Series(counts, index=labels, name="count")
+
+    def total(self) -> int:
+        return int(self.cells.sum())
+
+
+class IncidentCube:
+    """Dense NumPy copy of the trigger-maintained incident_cube table.
+
+    The table already holds one count per (severity, category, status, week)
+    cell, so a reload reads cells rather than incidents; it only happens
+    when PRAGMA data_version shows a commit since the last refresh().
+    """
+
+    def __init__(self, db: DatabaseManager):
+        self._conn = db._create_read_connection()  # Own connection so data_version tracks every other writer
+        self._lock = threading.Lock()
+        self._data_version = None
+        self._view = self._build([])
+
+    def refresh(self) -> bool:
+        """Reload the cells if the database changed; returns True if it did."""
+        with self._lock:
+            version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            if self._data_version == version:
+                return False
+            rows = self._conn.execute(
+                "SELECT severity, category, status, week_ending, count FROM incident_cube"
+            ).fetchall()
+            self._view = self._build(rows)
+            self._data_version = version
+            return True
+
+    @staticmethod
+    def _build(rows: List[Tuple]) -> CubeView:
+        if not rows:
+            return CubeView(np.zeros((0,) * len(DIMENSIONS), dtype=np.int64),
+                            {d: pd.Index([], name=d) for d in DIMENSIONS})
+        frame = pd.DataFrame(rows, columns=["severity", "category", "status", "week", "count"])
+        frame["week"] = pd.to_datetime(frame["week"], format="%Y-%m-%d")
+
+        labels = {d: pd.Index(sorted(frame[d].unique()), name=d) for d in ("severity", "category", "status")}
+        labels["week"] = pd.date_range(frame["week"].min(), frame["week"].max(), freq="W-SUN", name="week")
+        index = tuple(labels[d].get_indexer(frame[d]) for d in DIMENSIONS)
+        cells = np.zeros(tuple(len(labels[d]) for d in DIMENSIONS), dtype=np.int64)
+        np.add.at(cells, index, frame["count"].to_numpy())
+        return CubeView(cells, labels)
+
+    def view(self) -> CubeView:
+        """The whole cube as of the last refresh()."""
+        return self._view
+
+    def slice(self, **selection) -> CubeView:
+        return self._view.slice(**selection)
+
+    def rollup(self, *dimensions: str) -> pd.Series:
+        return self._view.rollup(*dimensions)
+
+    def drilldown(self, dimension: str, **selection) -> pd.Series:
+        return self._view.drilldown(dimension, **selection)
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+# One cube per database file for the whole process
+_cubes = {}
+_cubes_lock = threading.Lock()
+
+
+def get_incident_cube(db: DatabaseManager) -> IncidentCube:
+    """Return the shared IncidentCube for a database, creating it on first use."""
+    key = os.path.abspath(db._db_path)
+    with _cubes_lock:
+        if key not in _cubes:
+            _cubes[key] = IncidentCube(db)
+        return _cubes[key]
@@ -0,0 +1,208 @@
+# services/incident_store.py
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from services.database_manager import DatabaseManager
+
+# Stored in place of a NULL/unparseable timestamp; excluded by every time filter
+MISSING_EPOCH = np.iinfo(np.int64).min
+
+ENCODED_COLUMNS = ("category", "severity", "status")
+
+
+class IncidentStore:
+    """In-process columnar copy of cyber_incidents for vectorised metrics.
+
+    category, severity and status are dictionary-encoded into small-int
+    NumPy arrays and timestamps are kept as int64 epoch seconds, so counts,
+    group-bys and filters are single NumPy passes instead of DataFrame
+    scans. Counts per (category, severity, status) are kept alongside and
+    updated as rows are appended, so unfiltered metrics don't touch the rows.
+    refresh() appends new rows by max incident_id and only reloads
+    everything when the table's change counter shows some other change.
+    """
+
+    def __init__(self, db: DatabaseManager):
+        self._db = db
+        self._conn = db._create_read_connection()
+        self._lock = threading.RLock()
+        self._version = None  # cyber_incidents counter in table_versions as of the last refresh
+        self._reset()
+
+    def _reset(self) -> None:
+        self._ids = np.empty(0, dtype=np.int64)
+        self._epochs = np.empty(0, dtype=np.int64)
+        self._codes = {name: np.empty(0, dtype=np.int16) for name in ENCODED_COLUMNS}
+        self._labels: Dict[str, List[Optional[str]]] = {name: [] for name in ENCODED_COLUMNS}
+        self._label_index: Dict[str, Dict[Optional[str], int]] = {name: {} for name in ENCODED_COLUMNS}
+        self._group_counts = np.zeros((0,) * len(ENCODED_COLUMNS), dtype=np.int64)
+        self._max_id = None
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    # Loading
+
+    def refresh(self, full: bool = False) -> int:
+        """Bring the store up to date; returns the number of rows loaded.
+
+        The cyber_incidents counter in table_versions moves once per row
+        inserted, updated or deleted, so nothing is read while it stands
+        still, whatever else is written. If it moved by exactly the number
+        of rows past the highest loaded id, those inserts were the only
+        change and they are appended; anything else (an update, even of the
+        timestamp alone, or a delete) rebuilds the store.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN")  # Counter and rows from one snapshot
+            try:
+                version = self._conn.execute(
+                    "SELECT version FROM table_versions WHERE table_name = 'cyber_incidents'"
+                ).fetchone()[0]
+                if not full and version == self._version:
+                    return 0
+                rows = self._new_rows() if not full and self._version is not None else None
+                if rows is None or version - self._version != len(rows):
+                    self._reset()
+                    rows = self._new_rows()
+                self._append(rows)
+                self._version = version
+                return len(rows)
+            finally:
+                self._conn.rollback()
+
+    def _new_rows(self) -> List[Tuple]:
+        """Rows past the highest loaded incident_id, in id order."""
+        query = "SELECT incident_id, timestamp_epoch, category, severity, status FROM cyber_incidents"
+        params = ()
+        if self._max_id is not None:
+            query += " WHERE incident_id > ?"
+            params = (self._max_id,)
+        return self._conn.execute(query + " ORDER BY incident_id", params).fetchall()
+
+    def _append(self, rows: List[Tuple]) -> None:
+        if not rows:
+            return
+        ids, epochs, *columns = zip(*rows)
+        self._ids = np.concatenate([self._ids, np.array(ids, dtype=np.int64)])
+        new_epochs = pd.array(epochs, dtype="Int64").to_numpy(dtype=np.int64, na_value=MISSING_EPOCH)
+        self._epochs = np.concatenate([self._epochs, new_epochs])
+        new_codes = {name: self._encode(name, values) for name, values in zip(ENCODED_COLUMNS, columns)}
+        for name, codes in new_codes.items():
+            self._codes[name] = np.concatenate([self._codes[name], codes])
+        self._count_groups(new_codes)
+        self._max_id = int(self._ids[-1])
+
+    def _count_groups(self, new_codes: Dict[str, np.ndarray]) -> None:
+        """Add newly loaded rows to the per-(category, severity, status) counts."""
+        shape = tuple(len(self._labels[name]) for name in ENCODED_COLUMNS)
+        if self._group_counts.shape != shape:  # New labels: grow the array, keeping the old counts
+            grown = np.zeros(shape, dtype=np.int64)
+            grown[tuple(slice(0, size) for size in self._group_counts.shape)] = self._group_counts
+            self._group_counts = grown
+        flat = np.ravel_multi_index(tuple(new_codes[name] for name in ENCODED_COLUMNS), shape)
+        self._group_counts += np.bincount(flat, minlength=self._group_counts.size).reshape(shape)
+
+    def _encode(self, name: str, values: Tuple) -> np.ndarray:
+        """Map strings to codes, adding unseen values to the column's dictionary."""
+        local_codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=False)
+        labels, index = self._labels[name], self._label_index[name]
+        mapping = np.empty(len(uniques), dtype=np.int16)
+        for i, value in enumerate(uniques):
+            value = None if pd.isna(value) else value
+            if value not in index:
+                index[value] = len(labels)
+                labels.append(value)
+            mapping[i] = index[value]
+        return mapping[local_codes]
+
+    # Vectorised metrics
+
+    def mask(self, category: Optional[str] = None, severities: Optional[List[str]] = None,
+             status: Optional[str] = None, start=None, end=None) -> np.ndarray:
+        """Boolean array selecting the incidents that match every given filter."""
+        filters = {
+            "category": [category] if category is not None else None,
+            "severity": severities,
+            "status": [status] if status is not None else None,
+        }
+        with self._lock:
+            selected = np.ones(len(self._ids), dtype=bool)
+            for column, wanted in filters.items():
+                if wanted is None:
+                    continue
+                index = self._label_index[column]
+                codes = [index[value] for value in wanted if value in index]
+                selected &= np.isin(self._codes[column], codes)
+            if start is not None:
+                selected &= self._epochs >= int(pd.Timestamp(start).timestamp())
+            if end is not None:
+                selected &= (self._epochs < int(pd.Timestamp(end).timestamp())) & (self._epochs != MISSING_EPOCH)
+            return selected
+
+    def count(self, **filters) -> int:
+        """Number of incidents matching the filters (see mask())."""
+        return int(self.mask(**filters).sum())
+
+    def _counts_within(self, category: Optional[str] = None, severities: Optional[List[str]] = None,
+                       status: Optional[str] = None) -> np.ndarray:
+        """The group counts array with the unselected labels of each column zeroed."""
+        counts = self._group_counts
+        filters = {"category": [category] if category is not None else None,
+                   "severity": severities,
+                   "status": [status] if status is not None else None}
+        for axis, (column, wanted) in enumerate(filters.items()):
+            if wanted is None:
+                continue
+            keep = np.zeros(counts.shape[axis], dtype=bool)
+            keep[[self._label_index[column][value] for value in wanted if value in self._label_index[column]]] = True
+            counts = counts * keep.reshape([-1 if i == axis else 1 for i in range(counts.ndim)])
+        return counts
+
+    def counts_by(self, column: str, **filters) -> pd.Series:
+        """Incident counts per value of category, severity or status, largest first."""
+        if column not in ENCODED_COLUMNS:
+            raise ValueError(f"Cannot group incidents by {column!r}")
+        with self._lock:
+            labels = list(self._labels[column])
+            if filters.get("start") is None and filters.get("end") is None:
+                # No time range: read the group counts instead of the rows
+                axis = ENCODED_COLUMNS.index(column)
+                within = self._counts_within(**{k: v for k, v in filters.items() if k not in ("start", "end")})
+                counts = within.sum(axis=tuple(i for i in range(within.ndim) if i != axis))
+            else:
+                codes = self._codes[column][self.mask(**filters)]
+                counts = np.bincount(codes, minlength=len(labels)) if len(labels) else np.empty(0, dtype=np.int64)
+        series = pd.Series(counts, index=pd.Index(labels, name=column), name="count")
+        return series[series > 0].sort_values(ascending=False, kind="stable")
+
+    def categories(self) -> List[str]:
+        """Categories that currently have at least one incident."""
+        return list(self.counts_by("category").index)
+
+    def summary(self) -> Tuple[int, int, int]:
+        """(total, open, high severity) counts, like SecurityIncident.get_incident_summary()."""
+        with self._lock:
+            return (len(self._ids), int(self._counts_within(status="Open").sum()),
+                    int(self._counts_within(severities=["High"]).sum()))
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+# One store per database file for the whole process
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_incident_store(db: DatabaseManager) -> IncidentStore:
+    """Return the shared IncidentStore for a database, creating it on first use."""
+    key = os.path.abspath(db._db_path)
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = IncidentStore(db)
+        return _stores[key]
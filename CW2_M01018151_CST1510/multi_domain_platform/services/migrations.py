@@ -0,0 +1,387 @@
+# services/migrations.py
+import sqlite3
+from typing import List, NamedTuple, Tuple
+
+from services.rollup_schema import DASHBOARD_SUMMARY_TABLES, RESOLUTION_TIME_SKETCH, STAFF_TICKET_STATS
+
+
+class Migration(NamedTuple):
+    """One ordered schema change, applied exactly once per database."""
+    version: int
+    description: str
+    statements: Tuple[str, ...]
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "Create domain tables", (
+        # DatabaseManager and init_database create users first on their own databases;
+        # a bare database needs it here for the table_versions triggers
+        """
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT UNIQUE NOT NULL,
+            password_hash TEXT NOT NULL,
+            role TEXT NOT NULL DEFAULT 'user',
+            email TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS cyber_incidents (
+            incident_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            category TEXT NOT NULL,
+            severity TEXT NOT NULL,
+            status TEXT DEFAULT 'Open',
+            description TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS datasets_metadata (
+            dataset_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            size_bytes INTEGER DEFAULT 0,
+            rows INTEGER NOT NULL,
+            columns INTEGER NOT NULL,
+            source TEXT DEFAULT 'Unknown',
+            uploaded_by TEXT,
+            upload_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS it_tickets (
+            ticket_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            priority TEXT NOT NULL,
+            description TEXT,
+            status TEXT DEFAULT 'Open',
+            assigned_to TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            resolution_time_hours REAL
+        )
+        """,
+    )),
+    Migration(2, "Add indexes for dashboard filters and summaries", (
+        # Incident status counts, high-severity-by-status, per-category counts and trends
+        "CREATE INDEX IF NOT EXISTS idx_incidents_status ON cyber_incidents(status)",
+        "CREATE INDEX IF NOT EXISTS idx_incidents_severity_status ON cyber_incidents(severity, status)",
+        "CREATE INDEX IF NOT EXISTS idx_incidents_category_timestamp ON cyber_incidents(category, timestamp)",
+        "CREATE INDEX IF NOT EXISTS idx_incidents_timestamp ON cyber_incidents(timestamp)",
+        # Ticket filters; the resolution_time_hours columns make the summaries covering scans
+        "CREATE INDEX IF NOT EXISTS idx_tickets_status_resolution ON it_tickets(status, resolution_time_hours)",
+        "CREATE INDEX IF NOT EXISTS idx_tickets_priority_status ON it_tickets(priority, status)",
+        "CREATE INDEX IF NOT EXISTS idx_tickets_assigned_resolution ON it_tickets(assigned_to, resolution_time_hours)",
+        # Dataset filters and the rows/columns summary
+        "CREATE INDEX IF NOT EXISTS idx_datasets_uploaded_by ON datasets_metadata(uploaded_by)",
+        "CREATE INDEX IF NOT EXISTS idx_datasets_rows_columns ON datasets_metadata(rows, columns)",
+        "ANALYZE",
+    )),
+    Migration(3, "Track CSV ingest checkpoints", (
+        """
+        CREATE TABLE IF NOT EXISTS ingest_checkpoints (
+            file_path TEXT NOT NULL,
+            table_name TEXT NOT NULL,
+            file_size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            byte_offset INTEGER NOT NULL,
+            inode INTEGER,
+            block_hashes BLOB,
+            rows_synced INTEGER DEFAULT 0,
+            synced_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (file_path, table_name)
+        )
+        """,
+    )),
+    Migration(4, "Add indexed epoch columns for timestamps", (
+        # Ingest fills these in; the triggers cover rows written any other way
+        "ALTER TABLE cyber_incidents ADD COLUMN timestamp_epoch INTEGER",
+        "UPDATE cyber_incidents SET timestamp_epoch = CAST(strftime('%s', timestamp) AS INTEGER)",
+        "CREATE INDEX IF NOT EXISTS idx_incidents_timestamp_epoch ON cyber_incidents(timestamp_epoch)",
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_cyber_incidents_timestamp_epoch_insert
+        AFTER INSERT ON cyber_incidents
+        WHEN NEW.timestamp_epoch IS NULL AND NEW.timestamp IS NOT NULL
+        BEGIN
+            UPDATE cyber_incidents SET timestamp_epoch = CAST(strftime('%s', NEW.timestamp) AS INTEGER)
+            WHERE incident_id = NEW.incident_id;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_cyber_incidents_timestamp_epoch_update
+        AFTER UPDATE OF timestamp ON cyber_incidents
+        WHEN NEW.timestamp IS NOT OLD.timestamp AND NEW.timestamp_epoch IS OLD.timestamp_epoch
+        BEGIN
+            UPDATE cyber_incidents SET timestamp_epoch = CAST(strftime('%s', NEW.timestamp) AS INTEGER)
+            WHERE incident_id = NEW.incident_id;
+        END
+        """,
+        "ALTER TABLE it_tickets ADD COLUMN created_at_epoch INTEGER",
+        "UPDATE it_tickets SET created_at_epoch = CAST(strftime('%s', created_at) AS INTEGER)",
+        "CREATE INDEX IF NOT EXISTS idx_tickets_created_at_epoch ON it_tickets(created_at_epoch)",
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_it_tickets_created_at_epoch_insert
+        AFTER INSERT ON it_tickets
+        WHEN NEW.created_at_epoch IS NULL AND NEW.created_at IS NOT NULL
+        BEGIN
+            UPDATE it_tickets SET created_at_epoch = CAST(strftime('%s', NEW.created_at) AS INTEGER)
+            WHERE ticket_id = NEW.ticket_id;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_it_tickets_created_at_epoch_update
+        AFTER UPDATE OF created_at ON it_tickets
+        WHEN NEW.created_at IS NOT OLD.created_at AND NEW.created_at_epoch IS OLD.created_at_epoch
+        BEGIN
+            UPDATE it_tickets SET created_at_epoch = CAST(strftime('%s', NEW.created_at) AS INTEGER)
+            WHERE ticket_id = NEW.ticket_id;
+        END
+        """,
+        "ALTER TABLE datasets_metadata ADD COLUMN upload_date_epoch INTEGER",
+        "UPDATE datasets_metadata SET upload_date_epoch = CAST(strftime('%s', upload_date) AS INTEGER)",
+        "CREATE INDEX IF NOT EXISTS idx_datasets_upload_date_epoch ON datasets_metadata(upload_date_epoch)",
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_datasets_metadata_upload_date_epoch_insert
+        AFTER INSERT ON datasets_metadata
+        WHEN NEW.upload_date_epoch IS NULL AND NEW.upload_date IS NOT NULL
+        BEGIN
+            UPDATE datasets_metadata SET upload_date_epoch = CAST(strftime('%s', NEW.upload_date) AS INTEGER)
+            WHERE dataset_id = NEW.dataset_id;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_datasets_metadata_upload_date_epoch_update
+        AFTER UPDATE OF upload_date ON datasets_metadata
+        WHEN NEW.upload_date IS NOT OLD.upload_date AND NEW.upload_date_epoch IS OLD.upload_date_epoch
+        BEGIN
+            UPDATE datasets_metadata SET upload_date_epoch = CAST(strftime('%s', NEW.upload_date) AS INTEGER)
+            WHERE dataset_id = NEW.dataset_id;
+        END
+        """,
+    )),
+    Migration(5, "Add trigger-maintained summary tables for dashboard metrics", DASHBOARD_SUMMARY_TABLES),
+    Migration(6, "Add per-assignee running ticket aggregates for staff performance", STAFF_TICKET_STATS),
+    Migration(7, "Add log-histogram sketch of ticket resolution times", RESOLUTION_TIME_SKETCH),
+    Migration(8, "Add incident cube of severity x category x status x week counts", (
+        """
+        CREATE TABLE IF NOT EXISTS incident_cube (
+            severity TEXT NOT NULL,
+            category TEXT NOT NULL,
+            status TEXT NOT NULL,
+            week_ending TEXT NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (severity, category, status, week_ending)
+        )
+        """,
+        # Sunday week bins, as in the legacy incident_weekly_counts; undated incidents are left out
+        """
+        INSERT INTO incident_cube (severity, category, status, week_ending, count)
+        SELECT IFNULL(severity, ''), IFNULL(category, ''), IFNULL(status, ''), date(timestamp, 'weekday 0'), COUNT(*)
+        FROM cyber_incidents WHERE date(timestamp, 'weekday 0') IS NOT NULL
+        GROUP BY 1, 2, 3, 4
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_incident_cube_insert AFTER INSERT ON cyber_incidents
+        WHEN date(NEW.timestamp, 'weekday 0') IS NOT NULL
+        BEGIN
+            INSERT INTO incident_cube (severity, category, status, week_ending, count)
+            VALUES (IFNULL(NEW.severity, ''), IFNULL(NEW.category, ''), IFNULL(NEW.status, ''),
+                    date(NEW.timestamp, 'weekday 0'), 1)
+            ON CONFLICT(severity, category, status, week_ending) DO UPDATE SET count = count + 1;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_incident_cube_delete AFTER DELETE ON cyber_incidents
+        BEGIN
+            UPDATE incident_cube SET count = count - 1
+            WHERE severity = IFNULL(OLD.severity, '') AND category = IFNULL(OLD.category, '')
+              AND status = IFNULL(OLD.status, '') AND week_ending = date(OLD.timestamp, 'weekday 0');
+            DELETE FROM incident_cube WHERE count <= 0;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_incident_cube_update
+        AFTER UPDATE OF severity, category, status, timestamp ON cyber_incidents
+        BEGIN
+            UPDATE incident_cube SET count = count - 1
+            WHERE severity = IFNULL(OLD.severity, '') AND category = IFNULL(OLD.category, '')
+              AND status = IFNULL(OLD.status, '') AND week_ending = date(OLD.timestamp, 'weekday 0');
+            INSERT INTO incident_cube (severity, category, status, week_ending, count)
+            SELECT IFNULL(NEW.severity, ''), IFNULL(NEW.category, ''), IFNULL(NEW.status, ''),
+                   date(NEW.timestamp, 'weekday 0'), 1
+            WHERE date(NEW.timestamp, 'weekday 0') IS NOT NULL
+            ON CONFLICT(severity, category, status, week_ending) DO UPDATE SET count = count + 1;
+            DELETE FROM incident_cube WHERE count <= 0;
+        END
+        """,
+    )),
+    Migration(9, "Add per-table version counters for the query result cache", (
+        # Bumped by a trigger on every row change; summary tables fed by triggers on
+        # these tables are covered by their source table's counter. Updates of the
+        # *_epoch columns are left out: they only follow the text timestamp, and the
+        # epoch triggers' own UPDATE would otherwise count every insert twice
+        """
+        CREATE TABLE IF NOT EXISTS table_versions (
+            table_name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0
+        )
+        """,
+        """
+        INSERT OR IGNORE INTO table_versions (table_name)
+        VALUES ('users'), ('cyber_incidents'), ('datasets_metadata'), ('it_tickets')
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_version_users_insert AFTER INSERT ON users
+        BEGIN
+            UPDATE table_versions SET version = version + 1 WHERE table_name = 'users';
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_version_users_update AFTER UPDATE ON users
+        BEGIN
+            UPDATE table_versions SET version = version + 1 WHERE table_name = 'users';
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_version_users_delete AFTER DELETE ON users
+        BEGIN
+            UPDATE table_versions SET version = version + 1 WHERE table_name = 'users';
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_version_cyber_incidents_insert AFTER INSERT ON cyber_incidents
+        BEGIN
+            UPDATE table_versions SET version = version + 1 WHERE table_name = 'cyber_incidents';
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_version_cyber_incidents_update
+        AFTER UPDATE OF incident_id, timestamp, category, severity, status, description, created_at
+        ON cyber_incidents
+        BEGIN
+            UPDATE table_versions SET version = version + 1 WHERE table_name = 'cyber_incidents';
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_version_cyber_incidents_delete AFTER DELETE ON cyber_incidents
+        BEGIN
+            UPDATE table_versions SET version = version + 1 WHERE table_name = 'cyber_incidents';
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_version_datasets_metadata_insert AFTER INSERT ON datasets_metadata
+        BEGIN
+            UPDATE table_versions SET version = version + 1 WHERE table_name = 'datasets_metadata';
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_version_datasets_metadata_update
+        AFTER UPDATE OF dataset_id, name, size_bytes, rows, columns, source, uploaded_by, upload_date, created_at
+        ON datasets_metadata
+        BEGIN
+            UPDATE table_versions SET version = version + 1 WHERE table_name = 'datasets_metadata';
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_version_datasets_metadata_delete AFTER DELETE ON datasets_metadata
+        BEGIN
+            UPDATE table_versions SET version = version + 1 WHERE table_name = 'datasets_metadata';
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_version_it_tickets_insert AFTER INSERT ON it_tickets
+        BEGIN
+            UPDATE table_versions SET version = version + 1 WHERE table_name = 'it_tickets';
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_version_it_tickets_update
+        AFTER UPDATE OF ticket_id, priority, description, status, assigned_to, created_at, resolution_time_hours
+        ON it_tickets
+        BEGIN
+            UPDATE table_versions SET version = version + 1 WHERE table_name = 'it_tickets';
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_version_it_tickets_delete AFTER DELETE ON it_tickets
+        BEGIN
+            UPDATE table_versions SET version = version + 1 WHERE table_name = 'it_tickets';
+        END
+        """,
+    )),
+    Migration(10, "Add incident indexes ending in incident_id for keyset pages", (
+        # With the filter columns first, a page is an ordered walk back from the cursor;
+        # (severity, status) and (status) already end in the rowid, which is incident_id
+        "CREATE INDEX IF NOT EXISTS idx_incidents_severity_id ON cyber_incidents(severity, incident_id)",
+        "CREATE INDEX IF NOT EXISTS idx_incidents_category_id ON cyber_incidents(category, incident_id)",
+    )),
+]
+
+
+class MigrationRunner:
+    """Applies pending MIGRATIONS in order and records them in schema_version."""
+
+    def __init__(self, conn: sqlite3.Connection, migrations: List[Migration] = None):
+        self._conn = conn
+        self._migrations = sorted(migrations or MIGRATIONS, key=lambda m: m.version)
+
+    def _ensure_version_table(self) -> None:
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
+                description TEXT NOT NULL,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        self._conn.commit()
+
+    def current_version(self) -> int:
+        """Highest migration version applied to this database (0 if none)."""
+        self._ensure_version_table()
+        row = self._conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+        return row[0] or 0
+
+    def pending(self) -> List[Migration]:
+        """Migrations that have not been applied yet."""
+        current = self.current_version()
+        return [m for m in self._migrations if m.version > current]
+
+    def apply(self) -> List[int]:
+        """Apply every pending migration, each in its own transaction."""
+        applied = []
+        for migration in self.pending():
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Another process may have applied it while we waited for the lock
+                already = self._conn.execute(
+                    "SELECT 1 FROM schema_version WHERE version = ?", (migration.version,)
+                ).fetchone()
+                if already:
+                    self._conn.rollback()
+                    continue
+
+                for statement in migration.statements:
+                    self._conn.execute(statement)
+                self._conn.execute(
+                    "INSERT INTO schema_version (version, description) VALUES (?, ?)",
+                    (migration.version, migration.description)
+                )
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+            print(f"   ✓ Applied migration {migration.version}: {migration.description}")
+            applied.append(migration.version)
+        return applied
+
+
+# Run from multi_domain_platform as: python -m services.migrations
+if __name__ == "__main__":
+    import os
+
+    db_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "intelligence_platform.db")
+    connection = sqlite3.connect(db_path)
+    runner = MigrationRunner(connection)
+    runner.apply()
+    print(f"Schema version: {runner.current_version()}")
+    connection.close()
@@ -0,0 +1,142 @@
+# services/parquet_io.py
+import os
+import sqlite3
+import time
+from typing import Dict, List, Optional
+
+from services.csv_ingest import EPOCH_COLUMNS, PRIMARY_KEYS, IngestStats, parse_timestamp, upsert_sql
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet support is optional; CSV import/export still works without it
+    pa = None
+    pq = None
+
+# Rows per Parquet row group, and per batch written to SQLite on import
+DEFAULT_ROW_GROUP_SIZE = 64_000
+
+DOMAIN_TABLES = ("cyber_incidents", "it_tickets", "datasets_metadata")
+
+
+def _require_pyarrow() -> None:
+    if pq is None:
+        raise ImportError("Parquet import/export needs pyarrow: pip install pyarrow")
+
+
+def _table_columns(conn: sqlite3.Connection, table_name: str) -> Dict[str, str]:
+    """Column name -> declared SQLite type, in table order."""
+    return {row[1]: (row[2] or "").upper() for row in conn.execute(f'PRAGMA table_info("{table_name}")')}
+
+
+def _epoch_column_names(table_name: str) -> List[str]:
+    return [EPOCH_COLUMNS[table_name][1]] if table_name in EPOCH_COLUMNS else []
+
+
+def arrow_schema(conn: sqlite3.Connection, table_name: str, columns: Optional[List[str]] = None):
+    """Arrow schema for a table: INTEGER -> int64, REAL -> float64, epoch -> timestamp, else string."""
+    _require_pyarrow()
+    declared = _table_columns(conn, table_name)
+    epoch_columns = _epoch_column_names(table_name)
+    fields = []
+    for name in columns or list(declared):
+        if name in epoch_columns:
+            arrow_type = pa.timestamp("s")
+        elif "INT" in declared[name]:
+            arrow_type = pa.int64()
+        elif declared[name] in ("REAL", "FLOAT", "DOUBLE"):
+            arrow_type = pa.float64()
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(name, arrow_type))
+    return pa.schema(fields)
+
+
+def export_table_to_parquet(conn: sqlite3.Connection, table_name: str, parquet_path: str,
+                            columns: Optional[List[str]] = None,
+                            row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+                            compression: str = "zstd") -> IngestStats:
+    """Write a table (or some of its columns) to a Parquet file.
+
+    Rows are fetched and written one row group at a time, so memory use
+    does not grow with the table. Epoch columns are written as Arrow
+    timestamps so analysts get typed datetimes.
+    """
+    _require_pyarrow()
+    start = time.perf_counter()
+    schema = arrow_schema(conn, table_name, columns)
+    column_list = ", ".join(f'"{name}"' for name in schema.names)
+    cursor = conn.execute(f'SELECT {column_list} FROM "{table_name}" ORDER BY "{PRIMARY_KEYS[table_name]}"')
+
+    total_rows = 0
+    with pq.ParquetWriter(parquet_path, schema, compression=compression) as writer:
+        while True:
+            rows = cursor.fetchmany(row_group_size)
+            if not rows:
+                break
+            arrays = [pa.array(values, type=field.type) for values, field in zip(zip(*rows), schema)]
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema), row_group_size=row_group_size)
+            total_rows += len(rows)
+    return IngestStats(table_name, total_rows, time.perf_counter() - start)
+
+
+def import_parquet_to_table(conn: sqlite3.Connection, parquet_path: str, table_name: str,
+                            columns: Optional[List[str]] = None,
+                            batch_size: int = DEFAULT_ROW_GROUP_SIZE) -> IngestStats:
+    """Upsert a Parquet file into a table, streaming it batch by batch.
+
+    Only the columns the table has (or the ones listed in `columns`) are read
+    from the file. Rows are upserted on the primary key and each batch is
+    committed, like sync_csv_to_table. If the file has the text timestamp
+    but no epoch column, the epoch is computed here.
+    """
+    _require_pyarrow()
+    start = time.perf_counter()
+    parquet_file = pq.ParquetFile(parquet_path)
+    table_columns = _table_columns(conn, table_name)
+    projection = [name for name in (columns or parquet_file.schema_arrow.names) if name in table_columns]
+
+    write_columns = list(projection)
+    epoch_fill = None  # Position of the text timestamp to compute the epoch from
+    if table_name in EPOCH_COLUMNS:
+        text_column, epoch_column = EPOCH_COLUMNS[table_name]
+        if text_column in projection and epoch_column not in projection:
+            epoch_fill = projection.index(text_column)
+            write_columns.append(epoch_column)
+
+    sql = upsert_sql(table_name, write_columns, PRIMARY_KEYS[table_name])
+    rows_written = 0
+    try:
+        for batch in parquet_file.iter_batches(batch_size=batch_size, columns=projection):
+            values = []
+            for column in batch.columns:
+                if pa.types.is_timestamp(column.type):
+                    column = column.cast(pa.timestamp("s")).cast(pa.int64())
+                values.append(column.to_pylist())
+            rows = list(zip(*values))
+            if epoch_fill is not None:
+                rows = [row + (parse_timestamp(row[epoch_fill]),) for row in rows]
+
+            rows_written += conn.executemany(sql, rows).rowcount
+            conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return IngestStats(table_name, rows_written, time.perf_counter() - start)
+
+
+def export_domain_tables(conn: sqlite3.Connection, folder: str) -> Dict[str, IngestStats]:
+    """Export the incident, ticket and dataset tables to <folder>/<table>.parquet."""
+    os.makedirs(folder, exist_ok=True)
+    return {table_name: export_table_to_parquet(conn, table_name, os.path.join(folder, f"{table_name}.parquet"))
+            for table_name in DOMAIN_TABLES}
+
+
+def import_domain_tables(conn: sqlite3.Connection, folder: str) -> Dict[str, IngestStats]:
+    """Import every <table>.parquet found in `folder` into its domain table."""
+    results = {}
+    for table_name in DOMAIN_TABLES:
+        parquet_path = os.path.join(folder, f"{table_name}.parquet")
+        if os.path.exists(parquet_path):
+            results[table_name] = import_parquet_to_table(conn, parquet_path, table_name)
+    return results
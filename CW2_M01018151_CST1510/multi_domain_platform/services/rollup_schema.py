@@ -0,0 +1,334 @@
+# services/rollup_schema.py
+"""Trigger-maintained rollup tables shared by both apps' migrations.
+
+Each constant is the list of statements for one migration. The module is
+plain SQL with no imports, so the legacy app (app.data.schema) can import
+it as multi_domain_platform.services.rollup_schema and both schemas are
+built from the same definitions. Both apps may migrate the same file, so
+every statement can run again: tables and triggers use IF NOT EXISTS and
+the backfills INSERT OR IGNORE rows the other app already wrote.
+"""
+
+
+# incident_counts, ticket_counts and dataset_totals: the dashboard metrics per group
+DASHBOARD_SUMMARY_TABLES = (
+    """
+    CREATE TABLE IF NOT EXISTS incident_counts (
+        category TEXT NOT NULL,
+        severity TEXT NOT NULL,
+        status TEXT NOT NULL,
+        count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (category, severity, status)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS ticket_counts (
+        status TEXT NOT NULL,
+        priority TEXT NOT NULL,
+        count INTEGER NOT NULL DEFAULT 0,
+        resolution_sum REAL NOT NULL DEFAULT 0,
+        resolution_count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (status, priority)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS dataset_totals (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        count INTEGER NOT NULL DEFAULT 0,
+        rows_sum INTEGER NOT NULL DEFAULT 0,
+        columns_sum INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    # Backfill from the existing rows (NULL status/priority is counted under '')
+    """
+    INSERT OR IGNORE INTO incident_counts (category, severity, status, count)
+    SELECT IFNULL(category, ''), IFNULL(severity, ''), IFNULL(status, ''), COUNT(*)
+    FROM cyber_incidents GROUP BY 1, 2, 3
+    """,
+    """
+    INSERT OR IGNORE INTO ticket_counts (status, priority, count, resolution_sum, resolution_count)
+    SELECT IFNULL(status, ''), IFNULL(priority, ''), COUNT(*),
+           IFNULL(SUM(resolution_time_hours), 0), COUNT(resolution_time_hours)
+    FROM it_tickets GROUP BY 1, 2
+    """,
+    """
+    INSERT OR IGNORE INTO dataset_totals (id, count, rows_sum, columns_sum)
+    SELECT 1, COUNT(*), IFNULL(SUM(rows), 0), IFNULL(SUM(columns), 0) FROM datasets_metadata
+    """,
+    # Incidents: add the new row's group, take away the old row's group
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_incident_counts_insert AFTER INSERT ON cyber_incidents
+    BEGIN
+        INSERT INTO incident_counts (category, severity, status, count)
+        VALUES (IFNULL(NEW.category, ''), IFNULL(NEW.severity, ''), IFNULL(NEW.status, ''), 1)
+        ON CONFLICT(category, severity, status) DO UPDATE SET count = count + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_incident_counts_delete AFTER DELETE ON cyber_incidents
+    BEGIN
+        UPDATE incident_counts SET count = count - 1
+        WHERE category = IFNULL(OLD.category, '') AND severity = IFNULL(OLD.severity, '')
+          AND status = IFNULL(OLD.status, '');
+        DELETE FROM incident_counts WHERE count <= 0;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_incident_counts_update
+    AFTER UPDATE OF category, severity, status ON cyber_incidents
+    BEGIN
+        UPDATE incident_counts SET count = count - 1
+        WHERE category = IFNULL(OLD.category, '') AND severity = IFNULL(OLD.severity, '')
+          AND status = IFNULL(OLD.status, '');
+        INSERT INTO incident_counts (category, severity, status, count)
+        VALUES (IFNULL(NEW.category, ''), IFNULL(NEW.severity, ''), IFNULL(NEW.status, ''), 1)
+        ON CONFLICT(category, severity, status) DO UPDATE SET count = count + 1;
+        DELETE FROM incident_counts WHERE count <= 0;
+    END
+    """,
+    # Tickets: counts plus the sum/count behind the average resolution time
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_ticket_counts_insert AFTER INSERT ON it_tickets
+    BEGIN
+        INSERT INTO ticket_counts (status, priority, count, resolution_sum, resolution_count)
+        VALUES (IFNULL(NEW.status, ''), IFNULL(NEW.priority, ''), 1,
+                IFNULL(NEW.resolution_time_hours, 0), NEW.resolution_time_hours IS NOT NULL)
+        ON CONFLICT(status, priority) DO UPDATE SET
+            count = count + 1,
+            resolution_sum = resolution_sum + excluded.resolution_sum,
+            resolution_count = resolution_count + excluded.resolution_count;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_ticket_counts_delete AFTER DELETE ON it_tickets
+    BEGIN
+        UPDATE ticket_counts SET
+            count = count - 1,
+            resolution_sum = resolution_sum - IFNULL(OLD.resolution_time_hours, 0),
+            resolution_count = resolution_count - (OLD.resolution_time_hours IS NOT NULL)
+        WHERE status = IFNULL(OLD.status, '') AND priority = IFNULL(OLD.priority, '');
+        DELETE FROM ticket_counts WHERE count <= 0;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_ticket_counts_update
+    AFTER UPDATE OF status, priority, resolution_time_hours ON it_tickets
+    BEGIN
+        UPDATE ticket_counts SET
+            count = count - 1,
+            resolution_sum = resolution_sum - IFNULL(OLD.resolution_time_hours, 0),
+            resolution_count = resolution_count - (OLD.resolution_time_hours IS NOT NULL)
+        WHERE status = IFNULL(OLD.status, '') AND priority = IFNULL(OLD.priority, '');
+        INSERT INTO ticket_counts (status, priority, count, resolution_sum, resolution_count)
+        VALUES (IFNULL(NEW.status, ''), IFNULL(NEW.priority, ''), 1,
+                IFNULL(NEW.resolution_time_hours, 0), NEW.resolution_time_hours IS NOT NULL)
+        ON CONFLICT(status, priority) DO UPDATE SET
+            count = count + 1,
+            resolution_sum = resolution_sum + excluded.resolution_sum,
+            resolution_count = resolution_count + excluded.resolution_count;
+        DELETE FROM ticket_counts WHERE count <= 0;
+    END
+    """,
+    # Datasets: one running totals row
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_dataset_totals_insert AFTER INSERT ON datasets_metadata
+    BEGIN
+        UPDATE dataset_totals SET count = count + 1, rows_sum = rows_sum + IFNULL(NEW.rows, 0),
+            columns_sum = columns_sum + IFNULL(NEW.columns, 0)
+        WHERE id = 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_dataset_totals_delete AFTER DELETE ON datasets_metadata
+    BEGIN
+        UPDATE dataset_totals SET count = count - 1, rows_sum = rows_sum - IFNULL(OLD.rows, 0),
+            columns_sum = columns_sum - IFNULL(OLD.columns, 0)
+        WHERE id = 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_dataset_totals_update AFTER UPDATE OF rows, columns ON datasets_metadata
+    BEGIN
+        UPDATE dataset_totals SET
+            rows_sum = rows_sum - IFNULL(OLD.rows, 0) + IFNULL(NEW.rows, 0),
+            columns_sum = columns_sum - IFNULL(OLD.columns, 0) + IFNULL(NEW.columns, 0)
+        WHERE id = 1;
+    END
+    """,
+)
+
+
+# staff_ticket_stats: running count/sum/sum of squares of resolution time per (assigned_to, priority)
+STAFF_TICKET_STATS = (
+    """
+    CREATE TABLE IF NOT EXISTS staff_ticket_stats (
+        assigned_to TEXT NOT NULL,
+        priority TEXT NOT NULL,
+        count INTEGER NOT NULL DEFAULT 0,
+        resolved_count INTEGER NOT NULL DEFAULT 0,
+        resolution_count INTEGER NOT NULL DEFAULT 0,
+        resolution_sum REAL NOT NULL DEFAULT 0,
+        resolution_sumsq REAL NOT NULL DEFAULT 0,
+        PRIMARY KEY (assigned_to, priority)
+    )
+    """,
+    # Unassigned tickets are left out, as in the old GROUP BY; Resolved/Closed count as throughput
+    """
+    INSERT OR IGNORE INTO staff_ticket_stats
+        (assigned_to, priority, count, resolved_count, resolution_count, resolution_sum, resolution_sumsq)
+    SELECT assigned_to, IFNULL(priority, ''), COUNT(*), SUM(status IN ('Resolved', 'Closed')),
+           COUNT(resolution_time_hours), IFNULL(SUM(resolution_time_hours), 0),
+           IFNULL(SUM(resolution_time_hours * resolution_time_hours), 0)
+    FROM it_tickets WHERE assigned_to IS NOT NULL GROUP BY 1, 2
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_staff_ticket_stats_insert AFTER INSERT ON it_tickets
+    WHEN NEW.assigned_to IS NOT NULL
+    BEGIN
+        INSERT INTO staff_ticket_stats
+            (assigned_to, priority, count, resolved_count, resolution_count, resolution_sum, resolution_sumsq)
+        VALUES (NEW.assigned_to, IFNULL(NEW.priority, ''), 1, NEW.status IN ('Resolved', 'Closed'),
+                NEW.resolution_time_hours IS NOT NULL, IFNULL(NEW.resolution_time_hours, 0),
+                IFNULL(NEW.resolution_time_hours * NEW.resolution_time_hours, 0))
+        ON CONFLICT(assigned_to, priority) DO UPDATE SET
+            count = count + 1,
+            resolved_count = resolved_count + excluded.resolved_count,
+            resolution_count = resolution_count + excluded.resolution_count,
+            resolution_sum = resolution_sum + excluded.resolution_sum,
+            resolution_sumsq = resolution_sumsq + excluded.resolution_sumsq;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_staff_ticket_stats_delete AFTER DELETE ON it_tickets
+    WHEN OLD.assigned_to IS NOT NULL
+    BEGIN
+        UPDATE staff_ticket_stats SET
+            count = count - 1,
+            resolved_count = resolved_count - (OLD.status IN ('Resolved', 'Closed')),
+            resolution_count = resolution_count - (OLD.resolution_time_hours IS NOT NULL),
+            resolution_sum = resolution_sum - IFNULL(OLD.resolution_time_hours, 0),
+            resolution_sumsq = resolution_sumsq - IFNULL(OLD.resolution_time_hours * OLD.resolution_time_hours, 0)
+        WHERE assigned_to = OLD.assigned_to AND priority = IFNULL(OLD.priority, '');
+        DELETE FROM staff_ticket_stats WHERE count <= 0;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_staff_ticket_stats_update
+    AFTER UPDATE OF assigned_to, priority, status, resolution_time_hours ON it_tickets
+    BEGIN
+        UPDATE staff_ticket_stats SET
+            count = count - 1,
+            resolved_count = resolved_count - (OLD.status IN ('Resolved', 'Closed')),
+            resolution_count = resolution_count - (OLD.resolution_time_hours IS NOT NULL),
+            resolution_sum = resolution_sum - IFNULL(OLD.resolution_time_hours, 0),
+            resolution_sumsq = resolution_sumsq - IFNULL(OLD.resolution_time_hours * OLD.resolution_time_hours, 0)
+        WHERE assigned_to = OLD.assigned_to AND priority = IFNULL(OLD.priority, '');
+        INSERT INTO staff_ticket_stats
+            (assigned_to, priority, count, resolved_count, resolution_count, resolution_sum, resolution_sumsq)
+        SELECT NEW.assigned_to, IFNULL(NEW.priority, ''), 1, NEW.status IN ('Resolved', 'Closed'),
+               NEW.resolution_time_hours IS NOT NULL, IFNULL(NEW.resolution_time_hours, 0),
+               IFNULL(NEW.resolution_time_hours * NEW.resolution_time_hours, 0)
+        WHERE NEW.assigned_to IS NOT NULL
+        ON CONFLICT(assigned_to, priority) DO UPDATE SET
+            count = count + 1,
+            resolved_count = resolved_count + excluded.resolved_count,
+            resolution_count = resolution_count + excluded.resolution_count,
+            resolution_sum = resolution_sum + excluded.resolution_sum,
+            resolution_sumsq = resolution_sumsq + excluded.resolution_sumsq;
+        DELETE FROM staff_ticket_stats WHERE count <= 0;
+    END
+    """,
+)
+
+
+# resolution_time_buckets + resolution_time_sketch: log-histogram of resolution hours per (priority, assigned_to)
+RESOLUTION_TIME_SKETCH = (
+    # Bucket i > 0 covers [0.01 * 1.05^(i-1), 0.01 * 1.05^i) hours, so a bucket's
+    # geometric midpoint is within 2.5% of any value in it; the last bucket is open-ended
+    """
+    CREATE TABLE IF NOT EXISTS resolution_time_buckets (
+        bucket INTEGER PRIMARY KEY,
+        lower REAL NOT NULL,
+        upper REAL NOT NULL UNIQUE,
+        value REAL NOT NULL
+    )
+    """,
+    """
+    WITH RECURSIVE bounds(bucket, lower, upper) AS (
+        SELECT 1, 0.01, 0.01 * 1.05
+        UNION ALL
+        SELECT bucket + 1, upper, upper * 1.05 FROM bounds WHERE bucket < 330
+    )
+    INSERT OR IGNORE INTO resolution_time_buckets (bucket, lower, upper, value)
+    SELECT 0, 0, 0.01, 0
+    UNION ALL
+    SELECT bucket, lower, upper, lower * 1.0246950766 FROM bounds
+    UNION ALL
+    SELECT 331, upper, 1e999, upper FROM bounds WHERE bucket = 330
+    """,
+    # Resolved/Closed tickets only, one histogram per (priority, assignee); any set of
+    # histograms merges by adding counts bucket by bucket
+    """
+    CREATE TABLE IF NOT EXISTS resolution_time_sketch (
+        priority TEXT NOT NULL,
+        assigned_to TEXT NOT NULL,
+        bucket INTEGER NOT NULL,
+        count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (priority, assigned_to, bucket)
+    )
+    """,
+    """
+    INSERT OR IGNORE INTO resolution_time_sketch (priority, assigned_to, bucket, count)
+    SELECT IFNULL(priority, ''), IFNULL(assigned_to, ''),
+           (SELECT bucket FROM resolution_time_buckets
+            WHERE upper > t.resolution_time_hours ORDER BY upper LIMIT 1),
+           COUNT(*)
+    FROM it_tickets t
+    WHERE status IN ('Resolved', 'Closed') AND resolution_time_hours IS NOT NULL
+    GROUP BY 1, 2, 3
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_resolution_sketch_insert AFTER INSERT ON it_tickets
+    WHEN NEW.status IN ('Resolved', 'Closed') AND NEW.resolution_time_hours IS NOT NULL
+    BEGIN
+        INSERT INTO resolution_time_sketch (priority, assigned_to, bucket, count)
+        VALUES (IFNULL(NEW.priority, ''), IFNULL(NEW.assigned_to, ''),
+                (SELECT bucket FROM resolution_time_buckets
+                 WHERE upper > NEW.resolution_time_hours ORDER BY upper LIMIT 1), 1)
+        ON CONFLICT(priority, assigned_to, bucket) DO UPDATE SET count = count + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_resolution_sketch_delete AFTER DELETE ON it_tickets
+    WHEN OLD.status IN ('Resolved', 'Closed') AND OLD.resolution_time_hours IS NOT NULL
+    BEGIN
+        UPDATE resolution_time_sketch SET count = count - 1
+        WHERE priority = IFNULL(OLD.priority, '') AND assigned_to = IFNULL(OLD.assigned_to, '')
+          AND bucket = (SELECT bucket FROM resolution_time_buckets
+                        WHERE upper > OLD.resolution_time_hours ORDER BY upper LIMIT 1);
+        DELETE FROM resolution_time_sketch
+        WHERE priority = IFNULL(OLD.priority, '') AND assigned_to = IFNULL(OLD.assigned_to, '')
+          AND count <= 0;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_resolution_sketch_update
+    AFTER UPDATE OF priority, assigned_to, status, resolution_time_hours ON it_tickets
+    BEGIN
+        UPDATE resolution_time_sketch SET count = count - 1
+        WHERE OLD.status IN ('Resolved', 'Closed') AND OLD.resolution_time_hours IS NOT NULL
+          AND priority = IFNULL(OLD.priority, '') AND assigned_to = IFNULL(OLD.assigned_to, '')
+          AND bucket = (SELECT bucket FROM resolution_time_buckets
+                        WHERE upper > OLD.resolution_time_hours ORDER BY upper LIMIT 1);
+        DELETE FROM resolution_time_sketch
+        WHERE priority = IFNULL(OLD.priority, '') AND assigned_to = IFNULL(OLD.assigned_to, '')
+          AND count <= 0;
+        INSERT INTO resolution_time_sketch (priority, assigned_to, bucket, count)
+        SELECT IFNULL(NEW.priority, ''), IFNULL(NEW.assigned_to, ''),
+               (SELECT bucket FROM resolution_time_buckets
+                WHERE upper > NEW.resolution_time_hours ORDER BY upper LIMIT 1), 1
+        WHERE NEW.status IN ('Resolved', 'Closed') AND NEW.resolution_time_hours IS NOT NULL
+        ON CONFLICT(priority, assigned_to, bucket) DO UPDATE SET count = count + 1;
+    END
+    """,
+)
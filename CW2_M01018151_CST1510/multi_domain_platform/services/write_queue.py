@@ -0,0 +1,198 @@
+# services/write_queue.py
+import os
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, Iterable, NamedTuple, Optional
+
+from services.database_manager import DatabaseManager
+
+
+class WriteResult(NamedTuple):
+    """Outcome of one queued write."""
+    rowcount: int
+    lastrowid: Optional[int]
+
+
+class WriteQueue:
+    """Single writer thread that group-commits writes from every session.
+
+    Sessions call submit() and get a Future back instead of competing for
+    SQLite's write lock themselves. The writer collects requests for a short
+    window, runs them in one transaction (each in its own savepoint, so one
+    bad statement only fails its own Future) and commits once. A bulk write
+    from submit_many() is one request: all of its rows land or none do.
+    """
+
+    def __init__(self, db: DatabaseManager, max_queue_size: int = 1000,
+                 batch_window: float = 0.005, max_batch_size: int = 200):
+        self._db = db
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._batch_window = batch_window
+        self._max_batch_size = max_batch_size
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._metrics_lock = threading.Lock()
+        self._metrics = {
+            "batches_committed": 0,
+            "writes_committed": 0,
+            "writes_failed": 0,
+            "writes_rejected": 0,
+            "last_batch_size": 0,
+            "max_batch_size": 0,
+            "max_queue_depth": 0,
+        }
+
+    def start(self) -> None:
+        """Start the writer thread (submit() does this automatically)."""
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop_event.clear()
+                self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+                self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Finish the queued writes and stop the writer thread."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def submit(self, sql: str, params: Iterable[Any] = (), timeout: Optional[float] = 5.0) -> Future:
+        """Queue a write and return a Future that resolves to a WriteResult.
+
+        If the queue is full the caller waits up to `timeout` seconds for
+        room, then queue.Full is raised so the page can tell the user to retry.
+        Inside db.transaction() the write runs straight away on the caller's
+        connection instead, so it commits (or rolls back) with the rest of
+        that transaction.
+        """
+        return self._submit(sql, tuple(params), False, timeout)
+
+    def submit_many(self, sql: str, seq_of_params: Iterable[Iterable[Any]],
+                    timeout: Optional[float] = 5.0) -> Future:
+        """Queue one statement for many parameter sets, like executemany(), as a single write."""
+        return self._submit(sql, [tuple(p) for p in seq_of_params], True, timeout)
+
+    def _submit(self, sql: str, params, many: bool, timeout: Optional[float]) -> Future:
+        future = Future()
+        if self._db.in_transaction():
+            future.set_running_or_notify_cancel()
+            try:
+                cur = self._db.execute_many(sql, params) if many else self._db.execute_query(sql, params)
+            except sqlite3.Error as e:
+                future.set_exception(e)
+            else:
+                future.set_result(WriteResult(cur.rowcount, cur.lastrowid))
+            return future
+
+        self.start()
+        try:
+            self._queue.put((sql, params, many, future), timeout=timeout)
+        except queue.Full:
+            with self._metrics_lock:
+                self._metrics["writes_rejected"] += 1
+            raise
+        with self._metrics_lock:
+            self._metrics["max_queue_depth"] = max(self._metrics["max_queue_depth"], self._queue.qsize())
+        return future
+
+    def execute(self, sql: str, params: Iterable[Any] = (), timeout: Optional[float] = 30.0) -> WriteResult:
+        """Queue a write and wait for it to be committed."""
+        return self.submit(sql, params).result(timeout=timeout)
+
+    def execute_many(self, sql: str, seq_of_params: Iterable[Iterable[Any]],
+                     timeout: Optional[float] = 30.0) -> WriteResult:
+        """Queue a bulk write and wait for it to be committed."""
+        return self.submit_many(sql, seq_of_params).result(timeout=timeout)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Queue depth and commit batch statistics."""
+        with self._metrics_lock:
+            metrics = dict(self._metrics)
+        metrics["queue_depth"] = self._queue.qsize()
+        batches = metrics["batches_committed"]
+        metrics["avg_batch_size"] = metrics["writes_committed"] / batches if batches else 0.0
+        return metrics
+
+    def _collect_batch(self) -> list:
+        """Wait for one request, then gather more until the window closes."""
+        try:
+            batch = [self._queue.get(timeout=0.1)]
+        except queue.Empty:
+            return []
+
+        deadline = time.monotonic() + self._batch_window
+        while len(batch) < self._max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    batch.append(self._queue.get(timeout=remaining))
+                else:
+                    batch.append(self._queue.get_nowait())  # Drain what is already waiting
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while not (self._stop_event.is_set() and self._queue.empty()):
+            batch = self._collect_batch()
+            if batch:
+                self._commit_batch(batch)
+
+    def _commit_batch(self, batch: list) -> None:
+        # Futures the caller cancelled while queued are dropped; the rest can no longer be cancelled
+        batch = [item for item in batch if item[3].set_running_or_notify_cancel()]
+        if not batch:
+            return
+        results = []
+        try:
+            with self._db.transaction() as conn:
+                for sql, params, many, future in batch:
+                    conn.execute("SAVEPOINT queued_write")
+                    try:
+                        cur = conn.executemany(sql, params) if many else conn.execute(sql, params)
+                        conn.execute("RELEASE queued_write")
+                        results.append((future, WriteResult(cur.rowcount, cur.lastrowid), None))
+                    except sqlite3.Error as e:
+                        conn.execute("ROLLBACK TO queued_write")
+                        conn.execute("RELEASE queued_write")
+                        results.append((future, None, e))
+        except Exception as e:
+            # The commit itself failed, so none of the writes in the batch happened
+            for *_, future in batch:
+                future.set_exception(e)
+            with self._metrics_lock:
+                self._metrics["writes_failed"] += len(batch)
+            return
+
+        failed = 0
+        for future, result, error in results:
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+                failed += 1
+
+        with self._metrics_lock:
+            self._metrics["batches_committed"] += 1
+            self._metrics["writes_committed"] += len(batch) - failed
+            self._metrics["writes_failed"] += failed
+            self._metrics["last_batch_size"] = len(batch)
+            self._metrics["max_batch_size"] = max(self._metrics["max_batch_size"], len(batch))
+
+
+# One writer per database file for the whole process
+_write_queues = {}
+_write_queues_lock = threading.Lock()
+
+
+def get_write_queue(db: DatabaseManager) -> WriteQueue:
+    """Return the shared WriteQueue for a database, creating it on first use."""
+    key = os.path.abspath(db._db_path)
+    with _write_queues_lock:
+        if key not in _write_queues:
+            _write_queues[key] = WriteQueue(db)
+        return _write_queues[key]
@@ -0,0 +1,10 @@
+# tests/conftest.py
+import os
+import sys
+import tempfile
+
+# Run from anywhere: the app imports `models.` and `services.` from multi_domain_platform
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# The model classes open their database when imported, so point them at a scratch file first
+os.environ["INTELLIGENCE_DB_PATH"] = os.path.join(tempfile.mkdtemp(prefix="platform-tests-"), "intelligence_platform.db")
@@ -0,0 +1,48 @@
+# tests/test_migrations.py
+"""The versioned migrations must build a working schema from an empty file."""
+import sqlite3
+
+from services.migrations import MIGRATIONS, MigrationRunner
+
+
+def test_apply_on_empty_database(tmp_path):
+    conn = sqlite3.connect(tmp_path / "empty.db")
+    try:
+        runner = MigrationRunner(conn)
+        assert runner.apply() == [m.version for m in MIGRATIONS]
+        assert runner.current_version() == MIGRATIONS[-1].version
+        assert runner.apply() == []
+
+        tables = {name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        assert {"users", "cyber_incidents", "datasets_metadata", "it_tickets", "table_versions"} <= tables
+
+        # The version triggers fire on every domain table, users included
+        conn.execute("INSERT INTO users (username, password_hash) VALUES ('alice', 'x')")
+        assert conn.execute(
+            "SELECT version FROM table_versions WHERE table_name = 'users'"
+        ).fetchone()[0] == 1
+    finally:
+        conn.close()
+
+
+def test_one_version_bump_per_row_change(tmp_path):
+    conn = sqlite3.connect(tmp_path / "versions.db")
+    try:
+        MigrationRunner(conn).apply()
+
+        def version(table):
+            return conn.execute("SELECT version FROM table_versions WHERE table_name = ?", (table,)).fetchone()[0]
+
+        # Each insert also fills its *_epoch column through a trigger; that must not count again
+        conn.execute("INSERT INTO cyber_incidents (timestamp, category, severity) "
+                     "VALUES ('2024-01-02 09:00:00', 'Phishing', 'High')")
+        conn.execute("INSERT INTO it_tickets (priority, created_at) VALUES ('High', '2024-01-02 09:00:00')")
+        conn.execute("INSERT INTO datasets_metadata (name, rows, columns, upload_date) "
+                     "VALUES ('d', 1, 1, '2024-01-02')")
+        assert [version(t) for t in ("cyber_incidents", "it_tickets", "datasets_metadata")] == [1, 1, 1]
+
+        conn.execute("UPDATE it_tickets SET created_at = '2024-02-02 09:00:00'")
+        conn.execute("UPDATE datasets_metadata SET upload_date = '2024-02-02'")
+        assert [version(t) for t in ("it_tickets", "datasets_metadata")] == [2, 2]
+    finally:
+        conn.close()
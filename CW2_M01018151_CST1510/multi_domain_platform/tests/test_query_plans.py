@@ -0,0 +1,146 @@
+# tests/test_query_plans.py
+"""Every read the models issue must reach the domain tables through an index.
+
+The statements are captured with a trace callback while the model methods
+run, so the check always covers the SQL the app actually sends.
+"""
+import os
+import sqlite3
+from contextlib import contextmanager
+
+import pytest
+
+from models.dataset import Dataset
+from models.it_ticket import ITTicket
+from models.security_incident import SecurityIncident
+from services.dashboard_overview import overview
+
+# Tables that grow with the data; the trigger-maintained summary tables hold one row per group
+DOMAIN_TABLES = {"cyber_incidents", "it_tickets", "datasets_metadata", "users"}
+
+INCIDENTS = [
+    (i, f"2024-0{1 + i % 6}-{10 + i % 15} 09:00:00", ("Phishing", "Malware", "DDoS")[i % 3],
+     ("Low", "Medium", "High", "Critical")[i % 4], ("Open", "Resolved")[i % 2], f"incident {i}")
+    for i in range(1, 41)
+]
+TICKETS = [
+    (i, ("Low", "Medium", "High")[i % 3], f"ticket {i}", ("Open", "In Progress", "Resolved")[i % 3],
+     ("alice", "bob")[i % 2], f"2024-0{1 + i % 6}-{10 + i % 15} 09:00:00", float(i % 48))
+    for i in range(1, 41)
+]
+DATASETS = [
+    (i, f"dataset {i}", 100 * i, 5 + i % 4, ("alice", "bob")[i % 2], f"2024-0{1 + i % 6}-01")
+    for i in range(1, 11)
+]
+
+MODEL_READS = {
+    "SecurityIncident.get_incident_by_id": lambda: SecurityIncident.get_incident_by_id(1),
+    "SecurityIncident.get_incidents_by_type_count": SecurityIncident.get_incidents_by_type_count,
+    "SecurityIncident.get_high_severity_by_status": SecurityIncident.get_high_severity_by_status,
+    "SecurityIncident.get_incident_summary": SecurityIncident.get_incident_summary,
+    "SecurityIncident.get_incidents_page": lambda: SecurityIncident.get_incidents_page(
+        after_id=30, limit=5, severities=["High", "Critical"], status="Open"),
+    "SecurityIncident.get_incidents_between": lambda: SecurityIncident.get_incidents_between(
+        "2024-02-01", "2024-04-01"),
+    "ITTicket.get_tickets_by_status": lambda: ITTicket.get_tickets_by_status("Open"),
+    "ITTicket.get_ticket_by_id": lambda: ITTicket.get_ticket_by_id(1),
+    "ITTicket.get_tickets_created_between": lambda: ITTicket.get_tickets_created_between(
+        "2024-02-01", "2024-04-01"),
+    "ITTicket.query_tickets": lambda: ITTicket.query_tickets(
+        statuses=["Open", "In Progress"], priority="High", page=2, page_size=5),
+    "ITTicket.get_ticket_summary": ITTicket.get_ticket_summary,
+    "ITTicket.get_staff_performance": ITTicket.get_staff_performance,
+    "ITTicket.get_staff_performance_by_priority": ITTicket.get_staff_performance_by_priority,
+    "ITTicket.get_resolution_percentiles": lambda: ITTicket.get_resolution_percentiles(
+        by="assigned_to", priorities=["High"]),
+    "Dataset.get_datasets_by_uploaded_by": lambda: Dataset.get_datasets_by_uploaded_by("alice"),
+    "Dataset.get_dataset_by_id": lambda: Dataset.get_dataset_by_id(1),
+    "Dataset.get_dataset_summary": Dataset.get_dataset_summary,
+    "dashboard_overview.overview": lambda: overview(SecurityIncident._db_manager),
+}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def seeded_database():
+    SecurityIncident.insert_incidents(INCIDENTS)
+    ITTicket.insert_tickets(TICKETS)
+    Dataset.insert_datasets(DATASETS)
+    yield
+    with SecurityIncident._db_manager.transaction() as conn:
+        for table in ("cyber_incidents", "it_tickets", "datasets_metadata"):
+            conn.execute(f"DELETE FROM {table}")
+
+
+@pytest.fixture
+def captured_sql(monkeypatch):
+    """List that collects every statement the models send through the read path."""
+    db = SecurityIncident._db_manager
+    db.clear_cache()  # A cached result would skip the SQL we want to see
+    statements = []
+    read_connection = db.read_connection
+
+    @contextmanager
+    def traced_read_connection():
+        with read_connection() as conn:
+            conn.set_trace_callback(statements.append)
+            try:
+                yield conn
+            finally:
+                conn.set_trace_callback(None)
+
+    monkeypatch.setattr(db, "read_connection", traced_read_connection)
+    return statements
+
+
+def query_plan(sql: str) -> list:
+    with sqlite3.connect(os.environ["INTELLIGENCE_DB_PATH"]) as conn:
+        return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}")]
+
+
+@pytest.mark.parametrize("name", sorted(MODEL_READS))
+def test_model_reads_use_an_index(name, captured_sql):
+    MODEL_READS[name]()
+
+    queries = [sql for sql in captured_sql if sql.lstrip().upper().startswith(("SELECT", "WITH"))]
+    assert queries, f"{name} issued no queries"
+    for sql in queries:
+        plan = query_plan(sql)
+        # An unfiltered walk in output order stops after LIMIT rows, e.g. the newest-rows lists
+        upper_sql = sql.upper()
+        if " LIMIT " in upper_sql and " WHERE " not in upper_sql \
+                and not any("USE TEMP B-TREE" in line for line in plan):
+            continue
+        full_scans = [line for line in plan
+                      if line.startswith("SCAN") and line.split()[1] in DOMAIN_TABLES
+                      and "INDEX" not in line and "PRIMARY KEY" not in line]
+        assert not full_scans, f"{name} scans a whole table:\n{sql}\n{plan}"
+
+
+@pytest.mark.parametrize("filters", [
+    {},
+    {"severities": ["High"]},
+    {"severities": ["High", "Critical", "Low"]},
+    {"status": "Open"},
+    {"category": "Phishing"},
+    {"severities": ["High", "Critical"], "status": "Open"},
+    {"severities": ["Medium"], "category": "Malware", "status": "Resolved"},
+])
+def test_incident_pages_are_keyset_seeks(filters, captured_sql):
+    """Paging walks an index from the cursor instead of sorting every matching row."""
+    pages = []
+    page, cursor = SecurityIncident.get_incidents_page(limit=4, **filters)
+    pages.append(page)
+    while cursor:
+        page, cursor = SecurityIncident.get_incidents_page(limit=4, cursor=cursor, **filters)
+        pages.append(page)
+
+    for sql in captured_sql:
+        plan = query_plan(sql)
+        assert not any("USE TEMP B-TREE" in line for line in plan), f"{sql}\n{plan}"
+
+    expected = [row for row in INCIDENTS
+                if row[3] in filters.get("severities", [row[3]])
+                and row[4] == filters.get("status", row[4])
+                and row[2] == filters.get("category", row[2])]
+    paged_ids = [incident_id for page in pages for incident_id in page["incident_id"]]
+    assert paged_ids == sorted((row[0] for row in expected), reverse=True)
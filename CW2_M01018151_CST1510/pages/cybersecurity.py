@@ -1,115 +1,130 @@
-import streamlit as st
-import pandas as pd
-
-from app.data.incidents import get_all_incidents, get_incidents_by_type_count
-
-
-# Login checking
-# Page configuration
-st.set_page_config(
-    page_title="Cybersecurity Dashboard",
-    page_icon="🔒",
-    layout="wide"
-)
-
-# Check login state
-if "logged_in" not in st.session_state:
-    st.session_state.logged_in = False
-
-#if not logged in, send user back
-if not st.session_state.logged_in:
-    st.error("You must be logged in to access this dashboard.")
-
-    col1, col2 = st.columns(2)
-    with col1:
-        if st.button(" Go to Login Page"):
-            st.switch_page("home.py")
-    with col2:
-        if st.button(" Register New Account"):
-            st.switch_page("home.py")
-
-    st.stop()
-
-
-
-# Page configuration using tutorial
-st.set_page_config(page_title="Cybersecurity Dashboard", layout="wide")
-st.title("🔒 Cybersecurity Dashboard")
-
-# sidebar
-with st.sidebar:
-    st.header("Filters")
-    severity_filter = st.multiselect(
-        "Select Severity",
-        ["Low", "Medium", "High", "Critical"],
-        default=["High", "Critical"]
-    )
-    show_raw_data = st.checkbox("Show raw data")
-
-    st.divider()
-    st.header("Quick Actions")
-    if st.button("Refresh Data"):
-        st.rerun()
-    if st.button("Generate Report"):
-        st.info("Report generation coming soon!")
-
-# Main
-st.header("Incident Overview")
-
-# Get data
-incidents = get_all_incidents()
-type_counts = get_incidents_by_type_count()
-
-# Metrics
-col1, col2, col3, col4 = st.columns(4)
-col1.metric("Total Incidents", len(incidents))
-col2.metric("High Severity", len(incidents[incidents['severity'] == 'High']))
-col3.metric("Open Incidents", len(incidents[incidents['status'] == 'Open']))
-col4.metric("Categories", len(type_counts))
-
-st.divider()
-
-# charts
-st.header("Visualizations")
-
-# Use columns for layout
-col1, col2 = st.columns(2)
-
-with col1:
-    st.subheader("Incidents by Category")
-    # Bar chart
-    st.bar_chart(type_counts.set_index('category'))
-
-with col2:
-    st.subheader("Severity Distribution")
-    # Create data for pie chart
-    severity_data = incidents['severity'].value_counts()
-    st.bar_chart(severity_data)
-
-# showing row datafiles from the csv
-if show_raw_data:
-    st.header("Raw Incident Data")
-    st.dataframe(incidents)
-
-# widgets
-st.divider()
-st.header("Incident Analysis")
-
-# Selectbox
-selected_category = st.selectbox(
-    "Analyze Category",
-    incidents['category'].unique() if len(incidents) > 0 else []
-)
-
-if selected_category:
-    category_data = incidents[incidents['category'] == selected_category]
-    st.write(f"**{len(category_data)}** incidents in {selected_category}")
-
-    # Show line chart of incidents over time
-    if 'timestamp' in category_data.columns:
-        category_data['datetime'] = pd.to_datetime(category_data['timestamp'], format='mixed')
-        weekly_counts = category_data.set_index('datetime').resample("W").size().fillna(0)
-        st.subheader("Weekly Incident Trend")
-        st.line_chart(weekly_counts)
-
+import streamlit as st
+import pandas as pd
+
+from app.data.incidents import (get_all_incidents, get_incidents_by_type_count, get_incidents_page,
+                                get_weekly_incident_trend)
+
+
+# Login checking
+# Page configuration
+st.set_page_config(
+    page_title="Cybersecurity Dashboard",
+    page_icon="🔒",
+    layout="wide"
+)
+
+# Check login state
+if "logged_in" not in st.session_state:
+    st.session_state.logged_in = False
+
+#if not logged in, send user back
+if not st.session_state.logged_in:
+    st.error("You must be logged in to access this dashboard.")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button(" Go to Login Page"):
+            st.switch_page("home.py")
+    with col2:
+        if st.button(" Register New Account"):
+            st.switch_page("home.py")
+
+    st.stop()
+
+
+
+# Page configuration using tutorial
+st.set_page_config(page_title="Cybersecurity Dashboard", layout="wide")
+st.title("🔒 Cybersecurity Dashboard")
+
+# sidebar
+with st.sidebar:
+    st.header("Filters")
+    severity_filter = st.multiselect(
+        "Select Severity",
+        ["Low", "Medium", "High", "Critical"],
+        default=["High", "Critical"]
+    )
+    show_raw_data = st.checkbox("Show raw data")
+
+    st.divider()
+    st.header("Quick Actions")
+    if st.button("Refresh Data"):
+        st.rerun()
+    if st.button("Generate Report"):
+        st.info("Report generation coming soon!")
+
+# Main
+st.header("Incident Overview")
+
+# Get data
+incidents = get_all_incidents()
+type_counts = get_incidents_by_type_count()
+
+# Metrics
+col1, col2, col3, col4 = st.columns(4)
+col1.metric("Total Incidents", len(incidents))
+col2.metric("High Severity", len(incidents[incidents['severity'] == 'High']))
+col3.metric("Open Incidents", len(incidents[incidents['status'] == 'Open']))
+col4.metric("Categories", len(type_counts))
+
+st.divider()
+
+# charts
+st.header("Visualizations")
+
+# Use columns for layout
+col1, col2 = st.columns(2)
+
+with col1:
+    st.subheader("Incidents by Category")
+    # Bar chart
+    st.bar_chart(type_counts.set_index('category'))
+
+with col2:
+    st.subheader("Severity Distribution")
+    # Create data for pie chart
+    severity_data = incidents['severity'].value_counts()
+    st.bar_chart(severity_data)
+
+# showing row datafiles from the csv
+if show_raw_data:
+    st.header("Raw Incident Data")
+    # Load pages on demand with the keyset cursor; start over when the filter changes
+    raw_key = tuple(severity_filter)
+    if st.session_state.get("raw_incidents_key") != raw_key:
+        first_page, next_cursor = get_incidents_page(limit=50, severities=severity_filter)
+        st.session_state.raw_incidents_key = raw_key
+        st.session_state.raw_incidents = [first_page]
+        st.session_state.raw_incidents_cursor = next_cursor
+
+    if st.session_state.raw_incidents_cursor and st.button("Load more"):
+        more, next_cursor = get_incidents_page(
+            limit=50, severities=severity_filter, cursor=st.session_state.raw_incidents_cursor
+        )
+        st.session_state.raw_incidents.append(more)
+        st.session_state.raw_incidents_cursor = next_cursor
+
+    st.dataframe(pd.concat(st.session_state.raw_incidents, ignore_index=True))
+
+# widgets
+st.divider()
+st.header("Incident Analysis")
+
+# Selectbox
+selected_category = st.selectbox(
+    "Analyze Category",
+    incidents['category'].unique() if len(incidents) > 0 else []
+)
+
+if selected_category:
+    category_data = incidents[incidents['category'] == selected_category]
+    st.write(f"**{len(category_data)}** incidents in {selected_category}")
+
+    # Show line chart of incidents over time, read from the weekly rollup table
+    weekly_counts = get_weekly_incident_trend(selected_category)
+    if not weekly_counts.empty:
+        st.subheader("Weekly Incident Trend")
+        st.line_chart(weekly_counts)
+
 #most of the code was extracted from the tutorials provided and Chatgpt was used for debugging
\ No newline at end of file
@@ -1,86 +1,120 @@
-import streamlit as st
-import pandas as pd
-from app.data.tickets import get_all_tickets, get_ticket_summary, get_staff_performance
-
-import streamlit as st
-
-
-# Page configuration first
-st.set_page_config(
-    page_title="IT Operations Dashboard",  # Change per page
-    page_icon="🖥️",  # Change per page
-    layout="wide"
-)
-
-# Check login state
-if "logged_in" not in st.session_state:
-    st.session_state.logged_in = False
-
-# Guard: if not logged in, send user back
-if not st.session_state.logged_in:
-    st.error("You must be logged in to access this dashboard.")
-
-    col1, col2 = st.columns(2)
-    with col1:
-        if st.button("🔐 Go to Login Page"):
-            st.switch_page("home.py")
-    with col2:
-        if st.button("📝 Register New Account"):
-            st.switch_page("home.py")
-
-    st.stop()
-
-#domain
-st.set_page_config(page_title="IT Operations Dashboard", layout="wide")
-st.title("🖥️ IT Operations Dashboard")
-
-#side bar
-with st.sidebar:
-    st.header("Ticket Filters")
-    status_filter = st.multiselect(
-        "Ticket Status",
-        ["Open", "In Progress", "Resolved", "Closed", "Waiting for User"],
-        default=["Open", "In Progress"]
-    )
-    priority_filter = st.selectbox(
-        "Priority Level",
-        ["All", "Low", "Medium", "High", "Critical"]
-    )
-
-#main
-st.header("Service Desk Performance")
-
-# Get data
-tickets = get_all_tickets()
-summary = get_ticket_summary()
-staff_perf = get_staff_performance()
-
-# Metrics
-if summary:
-    col1, col2, col3 = st.columns(3)
-    col1.metric("Total Tickets", summary[0])
-    col2.metric("Avg Resolution", f"{summary[1]:.1f} hours")
-    col3.metric("Open Tickets", summary[2])
-
-# Apply filters
-filtered_tickets = tickets.copy()
-if status_filter:
-    filtered_tickets = filtered_tickets[filtered_tickets['status'].isin(status_filter)]
-if priority_filter != "All":
-    filtered_tickets = filtered_tickets[filtered_tickets['priority'] == priority_filter]
-
-# Display
-st.subheader("Ticket Overview")
-st.dataframe(filtered_tickets)
-
-# Staff performance
-st.subheader("Staff Performance")
-if len(staff_perf) > 0:
-    col1, col2 = st.columns(2)
-
-    with col1:
-        st.bar_chart(staff_perf.set_index('assigned_to')['avg_resolution_time'])
-
-    with col2:
-        st.write("Performance Details:")
-        st.dataframe(staff_perf)
\ No newline at end of file
+import streamlit as st
+import pandas as pd
+from app.data.tickets import (get_all_tickets, get_ticket_summary, get_staff_performance,
+                              get_staff_performance_by_priority, get_resolution_percentiles)
+
+import streamlit as st
+
+
+# Page configuration first
+st.set_page_config(
+    page_title="IT Operations Dashboard",  # Change per page
+    page_icon="🖥️",  # Change per page
+    layout="wide"
+)
+
+# Check login state
+if "logged_in" not in st.session_state:
+    st.session_state.logged_in = False
+
+# Guard: if not logged in, send user back
+if not st.session_state.logged_in:
+    st.error("You must be logged in to access this dashboard.")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("🔐 Go to Login Page"):
+            st.switch_page("home.py")
+    with col2:
+        if st.button("📝 Register New Account"):
+            st.switch_page("home.py")
+
+    st.stop()
+
+#domain
+st.set_page_config(page_title="IT Operations Dashboard", layout="wide")
+st.title("🖥️ IT Operations Dashboard")
+
+#side bar
+with st.sidebar:
+    st.header("Ticket Filters")
+    status_filter = st.multiselect(
+        "Ticket Status",
+        ["Open", "In Progress", "Resolved", "Closed", "Waiting for User"],
+        default=["Open", "In Progress"]
+    )
+    priority_filter = st.selectbox(
+        "Priority Level",
+        ["All", "Low", "Medium", "High", "Critical"]
+    )
+
+#main
+st.header("Service Desk Performance")
+
+# Get data
+tickets = get_all_tickets()
+summary = get_ticket_summary()
+staff_perf = get_staff_performance()
+staff_by_priority = get_staff_performance_by_priority()
+percentiles_by_priority = get_resolution_percentiles("priority")
+percentiles_by_staff = get_resolution_percentiles("assigned_to")
+
+# Metrics
+if summary:
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Total Tickets", summary[0])
+    col2.metric("Avg Resolution", f"{summary[1]:.1f} hours")
+    col3.metric("Open Tickets", summary[2])
+
+# Apply filters
+filtered_tickets = tickets.copy()
+if status_filter:
+    filtered_tickets = filtered_tickets[filtered_tickets['status'].isin(status_filter)]
+if priority_filter != "All":
+    filtered_tickets = filtered_tickets[filtered_tickets['priority'] == priority_filter]
+
+# Display
+st.subheader("Ticket Overview")
+st.dataframe(filtered_tickets)
+
+# Staff performance
+st.subheader("Staff Performance")
+if len(staff_perf) > 0:
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.bar_chart(staff_perf.set_index('assigned_to')['avg_resolution_time'])
+
+    with col2:
+        st.write("Performance Details:")
+        st.dataframe(staff_perf)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.write("Resolved Tickets (throughput):")
+        st.bar_chart(staff_perf.set_index('assigned_to')['resolved_tickets'])
+
+    with col2:
+        st.write("Resolution Time Variance:")
+        st.bar_chart(staff_perf.set_index('assigned_to')['resolution_time_variance'])
+
+    with st.expander("Breakdown by priority"):
+        st.dataframe(staff_by_priority)
+
+# Tail latency from the resolution time sketches
+st.subheader("Resolution Time Percentiles")
+if len(percentiles_by_priority) > 0:
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.write("By priority (hours):")
+        st.dataframe(percentiles_by_priority)
+
+    with col2:
+        st.write("By staff member (hours):")
+        st.dataframe(percentiles_by_staff)
+
+    st.bar_chart(percentiles_by_priority.set_index('priority')[['p50', 'p90', 'p99']])
+else:
+    st.info("No resolved tickets yet.")
\ No newline at end of file